@@ -0,0 +1,85 @@
+"""
+Compares keeping the ISRR ready set sorted between rounds against re-sorting it every round.
+
+Usage: python benchmarks/bench_ready_queue.py [--sizes 1000 100000 1000000] [--rounds 5]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from modules import isrr_module as im
+from modules.smart_engine import SortedReadyQueue
+
+ARRIVALS_PER_ROUND = 10
+
+
+def make_processes(n, rng, start=0):
+    return [im.Process(f"P{start + i}", 0, rng.randint(1, 10**6)) for i in range(n)]
+
+
+def charge(ready, stq):
+    # Same update for both strategies: short processes finish, every survivor drops by STQ
+    finished = 0
+    for p in ready:
+        if p.remaining_time <= stq:
+            p.remaining_time = 0
+            finished += 1
+        else:
+            p.remaining_time -= stq
+    return finished
+
+
+def bench_resort(n, rounds, seed):
+    """Current behaviour: rebuild the ready list from every process and sort it each round."""
+    rng = random.Random(seed)
+    processes = make_processes(n, rng)
+    elapsed = 0.0
+    for _ in range(rounds):
+        processes += make_processes(ARRIVALS_PER_ROUND, rng, len(processes))
+        start = time.perf_counter()
+        ready = [p for p in processes if p.remaining_time > 0]
+        ready.sort(key=lambda x: x.remaining_time)
+        elapsed += time.perf_counter() - start
+        charge(ready, 1000)
+    return elapsed / rounds
+
+
+def bench_sorted_queue(n, rounds, seed):
+    """Persistent queue: only arrivals are positioned and finished processes are dropped."""
+    rng = random.Random(seed)
+    processes = make_processes(n, rng)
+    queue = SortedReadyQueue(key=lambda i: (processes[i].remaining_time, i))
+    queue.insert(list(range(n)))
+    elapsed = 0.0
+    for _ in range(rounds):
+        first = len(processes)
+        processes += make_processes(ARRIVALS_PER_ROUND, rng, first)
+        start = time.perf_counter()
+        queue.insert(list(range(first, len(processes))))
+        elapsed += time.perf_counter() - start
+        finished = charge([processes[i] for i in queue], 1000)
+        start = time.perf_counter()
+        queue.retire(finished)
+        elapsed += time.perf_counter() - start
+    return elapsed / rounds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ISRR ready queue maintenance per round.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'ready':>10} {'re-sort (ms/round)':>20} {'sorted queue (ms/round)':>24} {'speedup':>8}")
+    for n in args.sizes:
+        resort = bench_resort(n, args.rounds, args.seed)
+        sorted_queue = bench_sorted_queue(n, args.rounds, args.seed)
+        print(
+            f"{n:>10} {resort * 1000:>20.3f} {sorted_queue * 1000:>24.3f} {resort / sorted_queue:>8.1f}x"
+        )
@@ -0,0 +1,205 @@
+"""
+Measures how TRR, SRR and ISRR scale with the number of processes and with burst magnitude.
+
+Usage: python benchmarks/scaling.py [--sizes 1000 10000 100000] [--bursts 10 100 1000 10000]
+                                    [--engines trr srr isrr] [--trace off] [--output scaling.json]
+
+Every point runs the engine's public entry point (`RoundRobinScheduler.execute` or
+`smart_round_robin`, with the --trace level given) on a seeded synthetic trace (see
+modules/workloads.py) and records the best wall time over --repeat runs, the tracemalloc peak
+of a separate run, and scheduling rounds per second, where a TRR round is one time slice. For
+each engine and axis, a power law time ~ x^k is fitted and compared against the usual
+complexity classes, so a quadratic regression shows up as an exponent near 2 instead of an
+anecdote.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from modules import isrr_module as im
+from modules import smart_engine
+from modules import srr_module as sm
+from modules import trr_module as tm
+from modules import workloads
+
+ENGINES = ("trr", "srr", "isrr")
+
+# Candidate complexity classes, as functions of the scaled variable
+MODELS = {
+    "1": lambda x: np.ones_like(x),
+    "log x": np.log,
+    "x": lambda x: x,
+    "x log x": lambda x: x * np.log(x),
+    "x^2": lambda x: x**2,
+}
+
+
+def make_trace(n, mean_burst, load, seed):
+    """Poisson arrivals with exponential bursts, spaced so the CPU runs at the given load."""
+    return workloads.generate(
+        n,
+        "exponential",
+        "poisson",
+        seed,
+        burst_params={"mean": mean_burst},
+        arrival_params={"mean_interarrival": mean_burst / load},
+    )
+
+
+def run_engine(engine, tuples, time_quantum, fast_forward, trace):
+    """Runs one engine through its public entry point, returning the rounds it took."""
+    if engine == "trr":
+        scheduler = tm.RoundRobinScheduler(time_quantum, fast_forward)
+        scheduler.add_processes(tuples)
+        scheduler.execute()
+        scheduler.calculate_averages()
+        return scheduler.slices
+    module = sm if engine == "srr" else im
+    processes = [module.Process(*args) for args in tuples]
+    module.smart_round_robin(processes, fast_forward=fast_forward, trace=trace)
+    return None
+
+
+def count_rounds(engine, tuples, fast_forward):
+    # `smart_round_robin` only returns the averages, so SRR and ISRR rounds come from an untimed
+    # run of the same engine, whose round count is public
+    module = sm if engine == "srr" else im
+    processes = [module.Process(*args) for args in tuples]
+    return smart_engine.simulate(processes, module.StqDeltaCalculator(), fast_forward=fast_forward)
+
+
+def measure(engine, n, mean_burst, args):
+    arrival, burst = make_trace(n, mean_burst, args.load, args.seed)
+    tuples = workloads.to_tuples(arrival, burst)
+
+    wall_time = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        rounds = run_engine(engine, tuples, args.quantum, args.fast_forward, args.trace)
+        wall_time = min(wall_time, time.perf_counter() - start)
+    if rounds is None:
+        rounds = count_rounds(engine, tuples, args.fast_forward)
+
+    # Memory is measured on its own run, since tracing allocations slows everything down
+    tracemalloc.start()
+    run_engine(engine, tuples, args.quantum, args.fast_forward, args.trace)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "engine": engine,
+        "processes": n,
+        "mean_burst": mean_burst,
+        "trace": None if engine == "trr" else args.trace,  # TRR keeps no per-round trace
+        "wall_time": wall_time,
+        "peak_bytes": peak_bytes,
+        "rounds": rounds,
+        "rounds_per_second": rounds / wall_time if wall_time > 0 else None,
+    }
+
+
+def fit_complexity(x, y):
+    """
+    Fits time = c * x^k by least squares in log space, and picks the complexity class whose
+    single-constant fit has the smallest relative error.
+
+    Args:
+        x (list): Scaled variable, such as the process count.
+        y (list): Wall times.
+
+    Returns:
+        dict: The exponent k and the best matching class from MODELS.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    exponent = float(np.polyfit(np.log(x), np.log(y), 1)[0]) if len(x) > 1 else None
+    errors = {}
+    for name, model in MODELS.items():
+        basis = model(x)
+        # Least squares scale of basis / y ~ 1, so every point weighs by its relative error
+        ratio = basis / y
+        scale = ratio.sum() / (ratio**2).sum()
+        errors[name] = float(np.sqrt(np.mean((scale * ratio - 1) ** 2)))
+    return {"exponent": exponent, "model": min(errors, key=errors.get), "relative_errors": errors}
+
+
+def run_suite(args):
+    results = []
+    fits = []
+    axes = (
+        ("processes", [(n, args.fixed_burst) for n in args.sizes]),
+        ("mean_burst", [(args.fixed_size, b) for b in args.bursts]),
+    )
+    for engine in args.engines:
+        for axis, points in axes:
+            rows = [measure(engine, n, mean_burst, args) for n, mean_burst in points]
+            for row in rows:
+                row["axis"] = axis
+                print(
+                    f"{engine:>5} {axis:>11} {row['processes']:>9} {row['mean_burst']:>9} "
+                    f"{row['wall_time'] * 1000:>11.1f} {row['peak_bytes'] / 2**20:>9.1f} "
+                    f"{row['rounds_per_second'] or 0:>13.0f}",
+                    file=sys.stderr,
+                )
+            results += rows
+            fit = fit_complexity([row[axis] for row in rows], [row["wall_time"] for row in rows])
+            fits.append({"engine": engine, "axis": axis, **fit})
+    return results, fits
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark how the scheduling engines scale.")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--bursts", type=int, nargs="+", default=[10, 100, 1_000, 10_000], help="Mean bursts.")
+    parser.add_argument("--fixed-size", type=int, default=1_000, help="Process count along the burst axis.")
+    parser.add_argument("--fixed-burst", type=int, default=10, help="Mean burst along the process axis.")
+    parser.add_argument("--load", type=float, default=0.95, help="Mean burst / mean interarrival time.")
+    parser.add_argument("--quantum", type=int, default=4, help="TRR time quantum.")
+    parser.add_argument("--fast-forward", action="store_true", help="Skip predictable rounds in closed form.")
+    parser.add_argument("--trace", choices=smart_engine.TRACE_LEVELS, default=smart_engine.TRACE_OFF,
+                        help="Per-round STQ and Delta tracing passed to smart_round_robin.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per point; the best one is kept.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'engine':>5} {'axis':>11} {'processes':>9} {'burst':>9} {'time (ms)':>11} {'peak (MB)':>9} "
+        f"{'rounds/s':>13}",
+        file=sys.stderr,
+    )
+    results, fits = run_suite(args)
+    for fit in fits:
+        if fit["exponent"] is not None:
+            print(
+                f"{fit['engine']:>5} {fit['axis']:>11}: time ~ x^{fit['exponent']:.2f}, closest to O({fit['model']})",
+                file=sys.stderr,
+            )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+        },
+        "results": results,
+        "fits": fits,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Comparison reports of TRR, SRR and ISRR, computed live from the schedulers.
+
+Usage: python comp_scripts/report.py trr_vs_srr srr_vs_isrr trr_vs_srr_isrr --workers 4
+       python comp_scripts/report.py srr_vs_isrr --workloads workloads.jsonl --quantum 4
+
+Every figure is described by a spec holding the data it plots. Specs are rendered with the Agg
+backend across a process pool, and a manifest in the output directory records the hash of each
+figure's spec, so a figure is only re-rendered when its data or STYLE_VERSION changes.
+Simulation results go through the result cache, so unchanged cases are not simulated again either.
+"""
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from modules import result_cache
+from modules import sweep
+from modules.cases import PAPER_CASES
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Part of every figure hash. Bump it whenever a change to the plotting code changes the images.
+STYLE_VERSION = "1"
+
+MANIFEST = ".report-manifest.json"
+
+LABELS = {"trr": "TRR", "srr": "SRR", "isrr": "ISRR"}
+COLORS = {"trr": "#4472c4", "srr": "#ed7d31", "isrr": "#a5a5a5"}
+
+# Report name: (algorithms, the first one being the baseline, paper cases used, context switch figure)
+REPORTS = {
+    "trr_vs_srr": (("trr", "srr"), (0, 1, 2, 3), False),
+    "srr_vs_isrr": (("srr", "isrr"), (0, 1, 2, 3), False),
+    "trr_vs_srr_isrr": (("trr", "srr", "isrr"), (0, 2, 3), True),
+}
+
+# Output directory of each report under results/. The three-way report keeps the directory the
+# original script wrote to, from when ISRR was called PRR, so existing readers still find it
+DIRECTORIES = {
+    "trr_vs_srr": "TRR_vs_SRR",
+    "srr_vs_isrr": "SRR_vs_ISRR",
+    "trr_vs_srr_isrr": "TRR_vs_SRR_vs_PRR",
+}
+
+
+def context_switches(segments):
+    """Number of times the CPU is handed to a different process, idle time aside."""
+    switches = 0
+    previous = None
+    for _, _, pid in segments:
+        if pid is None:
+            continue
+        if previous is not None and pid != previous:
+            switches += 1
+        previous = pid
+    return switches
+
+
+def compute_case(case, algorithms, cache_dir=None):
+    """
+    Runs one case through every algorithm.
+
+    Args:
+        case (tuple): (processes, time_quantum), the quantum being used by TRR only.
+        algorithms (tuple): Algorithms to run, from sweep.ALGORITHMS.
+        cache_dir (str, optional): Result cache directory. Defaults to not caching.
+
+    Returns:
+        dict: Per algorithm, {"atat", "awt", "switches"}.
+    """
+    processes, time_quantum = case
+    cache = result_cache.ResultCache(cache_dir) if cache_dir is not None else None
+    metrics = {}
+    for algorithm in algorithms:
+        quantum = time_quantum if algorithm == "trr" else None
+        if cache is not None:
+            result = cache.run(processes, algorithm, quantum, fast_forward=True, gantt=True)
+        else:
+            result = result_cache.simulate(processes, algorithm, quantum, fast_forward=True, gantt=True)
+        metrics[algorithm] = {
+            "atat": result.average_turnaround,
+            "awt": result.average_waiting,
+            "switches": context_switches(result.gantt),
+        }
+    return metrics
+
+
+def reduction(baseline, value):
+    """Percentage by which `value` improves on `baseline`."""
+    return (baseline - value) / baseline * 100 if baseline else 0.0
+
+
+def case_label(index, count):
+    numerals = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X"]
+    return f"Case {numerals[index]}" if count <= len(numerals) else str(index + 1)
+
+
+def figure_specs(algorithms, cases, results, context_switch_figure):
+    """
+    Describes the figures of a report: one comparison per case, the reductions against the
+    baseline algorithm and optionally the context switches.
+
+    Returns:
+        list[dict]: Specs with the file name, the kind of figure and everything it plots.
+    """
+    baseline, others = algorithms[0], algorithms[1:]
+    specs = []
+    for index, ((_, quantum), metrics) in enumerate(zip(cases, results)):
+        specs.append({
+            "file": f"Case_{index + 1}_comparison.png",
+            "kind": "comparison",
+            "title": f"Case {index + 1} Comparison",
+            "groups": ["Average Turnaround time", "Average Waiting Time"],
+            "series": [
+                {
+                    "label": f"TRR (Q={quantum})" if a == "trr" else LABELS[a],
+                    "color": COLORS[a],
+                    "values": [metrics[a]["atat"], metrics[a]["awt"]],
+                }
+                for a in algorithms
+            ],
+        })
+
+    labels = [case_label(i, len(cases)) for i in range(len(cases))] + ["Overall"]
+    for metric, name in (("atat", "ATAT"), ("awt", "AWT")):
+        reductions = []
+        for algorithm in others:
+            values = [reduction(m[baseline][metric], m[algorithm][metric]) for m in results]
+            overall = reduction(sum(m[baseline][metric] for m in results), sum(m[algorithm][metric] for m in results))
+            reductions.append({
+                "label": f"{LABELS[baseline]} to {LABELS[algorithm]}",
+                "color": COLORS[algorithm],
+                "values": values + [overall],
+            })
+        specs.append({
+            "file": f"Reduction_{name}.png",
+            "kind": "reduction",
+            "title": f"% Reduction in {name}",
+            "groups": labels,
+            "series": reductions,
+        })
+
+    if context_switch_figure:
+        specs.append({
+            "file": "Context_Switch_Comparison.png",
+            "kind": "context_switches",
+            "title": "Context Switch Comparison",
+            "groups": labels[:-1],
+            "series": [
+                {"label": LABELS[a], "color": COLORS[a], "values": [m[a]["switches"] for m in results]}
+                for a in others
+            ],
+        })
+    return specs
+
+
+def spec_hash(spec):
+    text = json.dumps({"spec": spec, "style": STYLE_VERSION}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def render(spec, directory):
+    """Draws one figure spec into `directory`. Runs in pool workers, so it imports matplotlib itself."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    groups, series = spec["groups"], spec["series"]
+    x = np.arange(len(groups))
+    width = 0.7 / len(series)
+    percent = spec["kind"] == "reduction"
+
+    fig, ax = plt.subplots(figsize=(min(max(6.4, 0.6 * len(groups) * len(series)), 24), 4.8))
+    for i, entry in enumerate(series):
+        offset = (i - (len(series) - 1) / 2) * width
+        hatch = "----" if percent and len(series) == 1 else None
+        rects = ax.bar(x + offset, entry["values"], width * 0.92, label=entry["label"], color=entry["color"], hatch=hatch)
+        if len(groups) * len(series) <= 40:
+            # Data labels on top of the bars, while they still fit
+            for rect, value in zip(rects, entry["values"]):
+                ax.annotate(
+                    f"{value:.2f}%" if percent else (f"{value}" if isinstance(value, int) else f"{value:.2f}"),
+                    xy=(rect.get_x() + rect.get_width() / 2, rect.get_height()),
+                    xytext=(0, 3),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha="center",
+                    va="bottom",
+                    fontsize=9,
+                )
+
+    ax.yaxis.grid(True, linestyle="--", linewidth=0.5)
+    ax.set_axisbelow(True)
+    ax.set_ylabel({"comparison": "Time", "reduction": "Reduction (%)", "context_switches": "Context Switches"}[spec["kind"]])
+    ax.set_title(spec["title"])
+    ax.set_xticks(x)
+    ax.set_xticklabels(groups)
+    ax.margins(y=0.15)  # Room for the data labels
+    ax.legend(loc="upper left", bbox_to_anchor=(1, 1))
+    fig.tight_layout()
+    fig.savefig(Path(directory) / spec["file"])
+    plt.close(fig)
+    return spec["file"]
+
+
+def is_figure_name(file):
+    """Whether a manifest entry is a plain file name, which can not point outside the output directory."""
+    return file not in ("", ".", "..") and Path(file).name == file and "\\" not in file
+
+
+def default_directory(name):
+    """Output directory of a report: results/TRR_vs_SRR and so on, see DIRECTORIES."""
+    return ROOT / "results" / DIRECTORIES[name]
+
+
+def build(name, directory=None, cases=None, workers=None, cache_dir=None):
+    """
+    Computes a report and renders the figures whose data changed since the last build.
+
+    Args:
+        name (str): One of REPORTS.
+        directory (str | Path, optional): Output directory. Defaults to results/<REPORT NAME>.
+        cases (list, optional): (processes, time_quantum) cases. Defaults to the report's paper cases.
+        workers (int, optional): Worker processes. Defaults to one per CPU; 1 runs everything inline.
+        cache_dir (str, optional): Result cache directory. Defaults to not caching.
+
+    Returns:
+        tuple: (rendered, unchanged) lists of file names.
+    """
+    algorithms, paper_cases, switches = REPORTS[name]
+    if cases is None:
+        cases = [PAPER_CASES[i] for i in paper_cases]
+    directory = Path(directory) if directory is not None else default_directory(name)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    pool = ProcessPoolExecutor(workers) if workers != 1 else None
+    try:
+        mapper = pool.map if pool is not None else map
+        chunksize = {"chunksize": max(1, len(cases) // (4 * (workers or os.cpu_count() or 1)))} if pool else {}
+        results = list(mapper(compute_case, cases, [algorithms] * len(cases), [cache_dir] * len(cases), **chunksize))
+        specs = figure_specs(algorithms, cases, results, switches)
+
+        manifest_path = directory / MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (FileNotFoundError, ValueError):
+            manifest = {}
+        if not isinstance(manifest, dict):
+            manifest = {}
+        hashes = {spec["file"]: spec_hash(spec) for spec in specs}
+        stale = [s for s in specs if manifest.get(s["file"]) != hashes[s["file"]] or not (directory / s["file"]).exists()]
+        rendered = list(mapper(render, stale, [directory] * len(stale)))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Figures of an earlier build that this one no longer produces
+    for file in set(manifest) - set(hashes):
+        if is_figure_name(file):
+            (directory / file).unlink(missing_ok=True)
+    manifest_path.write_text(json.dumps(hashes, indent=2, sort_keys=True) + "\n")
+    unchanged = [spec["file"] for spec in specs if spec["file"] not in rendered]
+    return rendered, unchanged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render comparison reports of TRR, SRR and ISRR.")
+    parser.add_argument("reports", nargs="*", metavar="REPORT",
+                        help=f"Reports to build, from {', '.join(REPORTS)}. Defaults to all of them.")
+    parser.add_argument("--workloads", help="JSON Lines workloads to report on instead of the paper cases.")
+    parser.add_argument("--quantum", type=int, default=4, help="TRR time quantum for --workloads. Defaults to 4.")
+    parser.add_argument("--output", help="Output directory, for a single report.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes. Defaults to one per CPU.")
+    parser.add_argument("--cache", default=None, help="Result cache directory. Defaults to the user cache.")
+    parser.add_argument("--no-cache", action="store_true", help="Always simulate.")
+    args = parser.parse_args(argv)
+    args.reports = args.reports or list(REPORTS)
+    unknown = [name for name in args.reports if name not in REPORTS]
+    if unknown:
+        parser.error(f"unknown report {unknown[0]!r}, choose from {', '.join(REPORTS)}")
+    if args.output and len(args.reports) > 1:
+        parser.error("--output needs a single report")
+
+    cases = None
+    if args.workloads:
+        with open(args.workloads) as file:
+            cases = [(workload, args.quantum) for workload in sweep.read_workloads(file)]
+    cache_dir = None if args.no_cache else str(args.cache or result_cache.default_directory())
+    for name in args.reports:
+        rendered, unchanged = build(name, args.output, cases, args.workers, cache_dir)
+        directory = Path(args.output) if args.output else default_directory(name)
+        print(f"{name}: {len(rendered)} rendered, {len(unchanged)} unchanged in {directory.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
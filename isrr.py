@@ -1,12 +1,41 @@
 import argparse
+import sys
+from modules import ingest
 from modules import isrr_module as im
 
 # Enables printing gantt charts optionally
 # Usage: python isrr.py --print-gantt
+# Replays a CSV or JSON Lines job log instead of the cases below
+# Usage: python isrr.py --trace jobs.csv [--reorder-window 1000]
 parser = argparse.ArgumentParser(description="Execute ISRR scheduling and optionally print the Gantt chart.")
 parser.add_argument('--print-gantt', action='store_true', help="Print the Gantt chart.")
+parser.add_argument('--trace', help="CSV or JSON Lines job log (pid, arrival, burst) to replay, or - for stdin.")
+parser.add_argument('--format', choices=["csv", "jsonl"], help="Log format. Guessed from the extension by default.")
+parser.add_argument('--reorder-window', type=int, default=0, help="Rows a log entry may be out of arrival order.")
 args = parser.parse_args()
 
+if args.trace:
+    stats = ingest.IngestStats()
+    arrivals = ingest.read_trace(args.trace, args.format, args.reorder_window, stats=stats)
+    completed = total_tat = total_wt = 0
+    try:
+        for event in im.isrr_stream(arrivals):
+            completed += 1
+            total_tat += event.turnaround
+            total_wt += event.waiting
+    except (OSError, ValueError) as error:
+        sys.exit(f"error: {error}")
+    if completed:
+        print(
+            f"{completed} processes: Average Turnaround Time (ATAT) = {total_tat / completed:.2f}, "
+            f"Average Waiting Time (AWT) = {total_wt / completed:.2f}"
+        )
+    print(
+        f"Ingested {stats.rows} rows in {stats.chunks} chunks at {stats.rows_per_second:.0f} rows/s, "
+        f"{stats.reordered} reordered"
+    )
+    sys.exit()
+
 
 # Test cases
 # Format is Process(PID, AT, BT)
@@ -0,0 +1,157 @@
+"""
+Single entry point for the schedulers.
+
+Usage: python -m modules run [jobs.csv] [--algorithm isrr] [--gantt] [--tail]
+       python -m modules sweep workloads.jsonl --quantum 2 4 --workers 8
+       python -m modules bench --sizes 1000 10000
+       python -m modules plot trr_vs_srr --workloads workloads.jsonl
+
+Only argparse is imported up front. Each subcommand imports what it needs when it runs, so a
+scripted `run` never pays for NumPy or matplotlib. tests/test_cli.py checks what startup imports.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+ALGORITHMS = ("trr", "srr", "isrr")
+
+
+def _print_tail(latency):
+    line = []
+    for label, sketch in (("TAT", latency.turnaround), ("WT", latency.waiting)):
+        line.append(f"{label} p50/p95/p99 = " + "/".join(f"{sketch.quantile(q):.2f}" for q in (0.5, 0.95, 0.99)))
+    print("  " + ", ".join(line))
+
+
+def run(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m modules run", description="Schedule a job log, or the research paper cases, with one algorithm."
+    )
+    parser.add_argument("trace", nargs="?", help="CSV or JSON Lines job log (pid, arrival, burst), or - for stdin. "
+                                                 "Defaults to the research paper cases.")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="isrr")
+    parser.add_argument("--quantum", type=int, help="TRR time quantum. Defaults to the paper's for the paper cases.")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Log format. Guessed from the extension by default.")
+    parser.add_argument("--reorder-window", type=int, default=0, help="Rows a log entry may be out of arrival order.")
+    parser.add_argument("--fast-forward", action="store_true", help="Skip predictable rounds in closed form.")
+    parser.add_argument("--gantt", action="store_true", help="Print the Gantt chart. Holds the whole log in memory.")
+    parser.add_argument("--tail", action="store_true", help="Also print turnaround and waiting time percentiles, "
+                                                          "from a sketch within 1%% of the exact values.")
+    args = parser.parse_args(argv)
+    if args.algorithm == "trr" and args.quantum is None and args.trace:
+        parser.error("trr needs --quantum")
+    if args.quantum is not None and args.quantum < 1:
+        parser.error("--quantum must be positive")
+    if args.reorder_window < 0:
+        parser.error("--reorder-window can not be negative")
+
+    from . import ingest
+    from .sketch import LatencySketch
+
+    if args.trace is None:
+        from .cases import PAPER_CASES
+
+        cases = [(f"Case {i}", processes, quantum) for i, (processes, quantum) in enumerate(PAPER_CASES, start=1)]
+    elif args.gantt:
+        cases = [(args.trace, list(ingest.read_trace(args.trace, args.format, args.reorder_window)), args.quantum)]
+    else:
+        # Stream the log, so memory stays bounded whatever its size
+        from . import isrr_module as im
+        from . import srr_module as sm
+        from . import trr_module as tm
+
+        arrivals = ingest.read_trace(args.trace, args.format, args.reorder_window)
+        if args.algorithm == "trr":
+            events = tm.trr_stream(arrivals, args.quantum, args.fast_forward)
+        else:
+            events = (im.isrr_stream if args.algorithm == "isrr" else sm.srr_stream)(arrivals, args.fast_forward)
+        completed = total_tat = total_wt = 0
+        latency = LatencySketch()
+        for event in events:
+            completed += 1
+            total_tat += event.turnaround
+            total_wt += event.waiting
+            if args.tail:
+                latency.record(event.turnaround, event.waiting)
+        if completed:
+            print(f"{args.trace}: ATAT = {total_tat / completed:.2f}, AWT = {total_wt / completed:.2f}")
+            if args.tail:
+                _print_tail(latency)
+        return
+
+    from . import result_cache
+
+    for name, processes, quantum in cases:
+        result = result_cache.simulate(
+            processes, args.algorithm, args.quantum or quantum, args.fast_forward, gantt=args.gantt
+        )
+        print(f"{name}: ATAT = {result.average_turnaround:.2f}, AWT = {result.average_waiting:.2f}")
+        if args.tail:
+            latency = LatencySketch()
+            for (_, arrival_time, burst_time), finish_time in zip(processes, result.finish_times):
+                if burst_time > 0:
+                    latency.record(finish_time - arrival_time, finish_time - arrival_time - burst_time)
+            if len(latency):  # Processes without work are not sketched, so there may be nothing to report
+                _print_tail(latency)
+        if args.gantt:
+            print("".join(f"|{start} {'IDLE' if pid is None else pid} {end}" for start, end, pid in result.gantt) + "|")
+
+
+def sweep(argv):
+    from . import sweep as sweep_module
+
+    sweep_module.main(argv)
+
+
+def bench(argv):
+    sys.path.append(str(ROOT))
+    from benchmarks import scaling
+
+    scaling.main(argv)
+
+
+def plot(argv):
+    sys.path.append(str(ROOT))
+    from comp_scripts import report
+
+    report.main(argv)
+
+
+COMMANDS = {
+    "run": (run, "Schedule a job log or the research paper cases."),
+    "sweep": (sweep, "Run many workloads x algorithms x quanta in parallel."),
+    "bench": (bench, "Measure how the engines scale."),
+    "plot": (plot, "Render the TRR/SRR/ISRR comparison reports."),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m modules",
+        description="TRR, SRR and ISRR schedulers.",
+        epilog="Run 'python -m modules COMMAND --help' for the options of a command.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+    for name, (_, help) in COMMANDS.items():
+        commands.add_parser(name, help=help, add_help=False)
+    # Everything after the command belongs to the command's own parser
+    argv = sys.argv[1:] if argv is None else argv
+    args = parser.parse_args(argv[:1])
+    sys.argv[0] = f"python -m modules {args.command}"  # Program name in the commands' usage lines
+    try:
+        COMMANDS[args.command][0](argv[1:])
+    except OSError as error:
+        sys.exit(f"error: {error}")
+    except ValueError as error:
+        # Malformed input is the user's to fix; any other ValueError is a bug and keeps its traceback
+        from .ingest import TraceError
+
+        if not isinstance(error, TraceError):
+            raise
+        sys.exit(f"error: {error}")
+
+
+if __name__ == "__main__":
+    main()
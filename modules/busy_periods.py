@@ -0,0 +1,180 @@
+"""
+Parallel simulation of independent busy periods.
+
+A busy period ends when the CPU runs out of work: every process that arrived so far has finished
+and the next one has not arrived yet. None of TRR, SRR or ISRR carries state across such an idle
+gap, so the schedule of each busy period depends only on its own processes, with unchanged
+absolute arrival times. Long traces are therefore split at the gaps, simulated in chunks of whole
+busy periods on a process pool, and the finish times written back in input order. The results are
+identical to simulating the whole trace at once. `latency_parallel` ships back mergeable latency
+sketches instead of finish times, for traces whose finish times are not worth keeping.
+"""
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain, islice
+
+from . import columnar
+from . import sweep
+from .sketch import LatencySketch
+
+
+def _bounds(arrival, burst, order):
+    # The prefix scan of `busy_period_bounds`, over an arrival order computed once by the caller
+    start = 0
+    end = None
+    for position, index in enumerate(order):
+        arrival_time = arrival[index]
+        if end is not None and arrival_time >= end:
+            yield start, position
+            start = position
+            end = arrival_time
+        elif end is None or arrival_time > end:
+            end = arrival_time
+        end += burst[index]
+    if end is not None:
+        yield start, len(order)
+
+
+def busy_period_bounds(workload):
+    """
+    Splits a workload at its idle gaps with one lazy scan over the processes in arrival order,
+    tracking when the CPU would run out of work: end = max(end, arrival) + burst. A process
+    arriving at or after `end` starts a new busy period. Nothing but the scan state is held,
+    so mapped workloads of any length can be split.
+
+    Args:
+        workload (Workload): The processes.
+
+    Yields:
+        tuple: (start, stop) positions of each busy period in `workload.arrival_order()`, in time order.
+    """
+    return _bounds(workload.arrival, workload.burst, workload.arrival_order())
+
+
+def busy_periods(workload):
+    """
+    Returns:
+        list[list[int]]: Process indices of each busy period in time order, each list in input order.
+            See `busy_period_bounds`, which does not hold the indices.
+    """
+    order = workload.arrival_order()
+    # Ties between processes are broken by input order, so keep it within a period
+    return [sorted(order[start:stop]) for start, stop in _bounds(workload.arrival, workload.burst, order)]
+
+
+def _run_chunk(algorithm, time_quantum, fast_forward, arrival, burst, latency=None):
+    n = len(arrival)
+    workload = columnar.Workload(arrival, burst, range(n), range(n))
+    return sweep.run_columns(workload, algorithm, time_quantum, fast_forward, latency=latency)
+
+
+def _sketch_chunk(algorithm, time_quantum, fast_forward, arrival, burst):
+    # Workers send back a fixed-size sketch instead of a finish time per process
+    latency = LatencySketch()
+    _run_chunk(algorithm, time_quantum, fast_forward, arrival, burst, latency)
+    return latency
+
+
+def _chunks(workload, size):
+    # Process indices of consecutive busy periods packed into chunks of at least `size`
+    # processes, in input order, cut one at a time as the scan goes
+    order = workload.arrival_order()
+    start = None
+    for period_start, stop in _bounds(workload.arrival, workload.burst, order):
+        if start is None:
+            start = period_start
+        if stop - start >= size:
+            yield range(start, stop) if isinstance(order, range) else sorted(order[start:stop])
+            start = None
+    if start is not None:
+        yield range(start, len(order)) if isinstance(order, range) else sorted(order[start:])
+
+
+def _columns(workload, indices):
+    arrival, burst = workload.arrival, workload.burst
+    return array("q", (arrival[i] for i in indices)), array("q", (burst[i] for i in indices))
+
+
+def _check(algorithm, time_quantum):
+    if algorithm not in sweep.ALGORITHMS:
+        raise ValueError(f"algorithm must be one of {sweep.ALGORITHMS}, got {algorithm!r}")
+    if algorithm == "trr" and time_quantum is None:
+        raise ValueError("trr needs a time quantum")
+
+
+def _map_chunks(function, workload, algorithm, time_quantum, fast_forward, workers, chunk_size):
+    # Runs `function` over chunks of whole busy periods and yields (indices, result) as chunks
+    # finish. Like `sweep.sweep`, only a bounded number of chunks is cut and in flight at a time,
+    # so the parent never holds more than a few chunks of indices and columns
+    if chunk_size is None:
+        chunk_size = max(1, len(workload) // (4 * workers))
+    chunks = _chunks(workload, chunk_size)
+    first = list(islice(chunks, 2))
+    if len(first) < 2:  # A pool would gain nothing
+        for indices in first:
+            yield indices, function(algorithm, time_quantum, fast_forward, *_columns(workload, indices))
+        return
+    chunks = chain(first, chunks)
+    with ProcessPoolExecutor(workers) as pool:
+        in_flight = {}  # Future -> process indices of its chunk
+
+        def submit(indices):
+            in_flight[pool.submit(function, algorithm, time_quantum, fast_forward, *_columns(workload, indices))] = indices
+
+        for indices in islice(chunks, 4 * workers):
+            submit(indices)
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield in_flight.pop(future), future.result()
+                # Keep the pool busy with one new chunk per finished one
+                for indices in islice(chunks, 1):
+                    submit(indices)
+
+
+def run_parallel(workload, algorithm, time_quantum=None, fast_forward=False, max_workers=None, chunk_size=None):
+    """
+    Simulates a workload one busy period at a time, spreading the periods over a process pool.
+
+    Args:
+        workload (Workload): The processes, see `columnar.Workload.from_processes`.
+        algorithm (str): One of sweep.ALGORITHMS.
+        time_quantum (int, optional): Fixed quantum, required for "trr".
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+        max_workers (int, optional): Worker processes. Defaults to one per CPU; 1 runs everything inline.
+        chunk_size (int, optional): Minimum processes sent to a worker at once. Defaults to a quarter
+            of an even share per worker, so uneven periods still balance.
+
+    Returns:
+        array: Finish time of every process, in input order.
+    """
+    _check(algorithm, time_quantum)
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        return sweep.run_columns(workload, algorithm, time_quantum, fast_forward)  # Splitting would gain nothing
+    finish = array("q", bytes(8 * len(workload)))
+    for indices, times in _map_chunks(_run_chunk, workload, algorithm, time_quantum, fast_forward, workers, chunk_size):
+        for index, finish_time in zip(indices, times):
+            finish[index] = finish_time
+    return finish
+
+
+def latency_parallel(workload, algorithm, time_quantum=None, fast_forward=False, max_workers=None, chunk_size=None):
+    """
+    Like `run_parallel`, but every worker sketches the waiting and turnaround times of its busy
+    periods and only the fixed-size sketches come back, to be merged, never a finish time per process.
+
+    Returns:
+        LatencySketch: Waiting and turnaround times of every process with work, see `sketch.LatencySketch`.
+    """
+    _check(algorithm, time_quantum)
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        latency = LatencySketch()
+        sweep.run_columns(workload, algorithm, time_quantum, fast_forward, latency=latency)
+        return latency
+    latency = LatencySketch()
+    for _, sketch in _map_chunks(_sketch_chunk, workload, algorithm, time_quantum, fast_forward, workers, chunk_size):
+        latency.merge(sketch)
+    return latency
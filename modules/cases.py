@@ -0,0 +1,11 @@
+"""
+Reference workloads shared by the command line, the reports and the tests.
+"""
+
+# Research paper cases as (processes, time quantum TRR was run with in the paper)
+PAPER_CASES = [
+    ([("P0", 0, 12), ("P1", 0, 34), ("P2", 0, 8), ("P3", 0, 19)], 6),
+    ([("P0", 0, 2), ("P1", 0, 5), ("P2", 0, 6), ("P3", 0, 3), ("P4", 0, 9)], 4),
+    ([("P0", 0, 26), ("P1", 0, 67), ("P2", 0, 82), ("P3", 0, 11)], 20),
+    ([("P0", 0, 8), ("P1", 2, 6), ("P2", 7, 11), ("P3", 0, 5)], 2),
+]
@@ -0,0 +1,454 @@
+import json
+import mmap
+import os
+from array import array
+
+# int64 words before the columns: byte-order mark, process count, pid count (-1 when the pids are
+# the indices), byte length of the pid data, and 1 when an arrival order column is stored
+_HEADER = 5
+_WORD = 8
+
+# Columns are native-endian. Read back in the other byte order, this word no longer matches
+_BYTE_ORDER_MARK = 0x0102030405060708
+
+# First bytes of trace and result files, ending in the format version
+TRACE_MAGIC = b"RRTRACE2"
+RESULT_MAGIC = b"RRRESLT1"
+
+
+class Workload:
+    """
+    Columnar workload: one int64 column per field instead of one object per process.
+    It can be published once into shared memory and attached read-only by any number of
+    worker processes, which then run the engines on it without copying or unpickling it.
+
+    Attributes:
+        arrival (array): Arrival time of every process.
+        burst (array): Burst time of every process.
+        pid_index (array): Index into `pids` of every process.
+        pids (list | range | PidTable): Distinct process IDs in order of first appearance. They must
+            be JSON serializable (ints or strings) to be published. A range means every process is
+            identified by its index, which is stored without a table. Mapped workloads get a
+            PidTable, which decodes a pid only when it is looked up.
+    """
+    def __init__(self, arrival, burst, pid_index, pids, mapping=None, order=None):
+        if not len(arrival) == len(burst) == len(pid_index):
+            raise ValueError("arrival, burst and pid_index must have the same length")
+        self.arrival = arrival
+        self.burst = burst
+        self.pid_index = pid_index
+        self.pids = pids
+        self._mapping = mapping  # Shared memory block or mmap the columns are views of, if any
+        self._order = order  # Stored arrival order of a mapped workload, if any
+        self._path = None  # Trace file behind the mmap, if any
+
+    def __reduce__(self):
+        # Mapped columns are memoryviews, which do not pickle: a trace file is sent as its path and
+        # mapped again on the other side, an in-memory workload as arrays
+        if self._path is not None:
+            return Workload.open, (self._path,)
+        if self._mapping is not None:
+            raise TypeError(
+                "a Workload attached to shared memory can not be pickled; send the SharedWorkload "
+                "handle returned by publish() instead"
+            )
+        columns = (self.arrival, self.burst, self.pid_index)
+        return Workload, (*(column if isinstance(column, array) else array("q", column) for column in columns), self.pids)
+
+    @classmethod
+    def from_processes(cls, processes):
+        """
+        Builds a workload from Process objects or (pid, arrival_time, burst_time) tuples.
+
+        Args:
+            processes (iterable): The processes, in input order.
+
+        Returns:
+            Workload: The columnar form of `processes`.
+        """
+        arrival, burst, pid_index = array("q"), array("q"), array("q")
+        pids = []
+        lookup = {}
+        for process in processes:
+            if isinstance(process, tuple):
+                pid, arrival_time, burst_time = process
+            else:
+                pid, arrival_time, burst_time = process.pid, process.arrival_time, process.burst_time
+            index = lookup.get(pid)
+            if index is None:
+                index = lookup[pid] = len(pids)
+                pids.append(pid)
+            arrival.append(arrival_time)
+            burst.append(burst_time)
+            pid_index.append(index)
+        return cls(arrival, burst, pid_index, pids)
+
+    @classmethod
+    def from_numpy(cls, arrival, burst):
+        """
+        Builds a workload from arrival and burst arrays, identifying every process by its index.
+
+        Args:
+            arrival (np.ndarray): Arrival time of every process.
+            burst (np.ndarray): Burst time of every process.
+
+        Returns:
+            Workload: The workload, with its own copy of the columns.
+        """
+        import numpy as np
+
+        columns = [array("q") for _ in range(3)]
+        for column, values in zip(columns, (arrival, burst, np.arange(len(arrival)))):
+            column.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+        return cls(*columns, range(len(arrival)))
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def __iter__(self):
+        """Yields (pid, arrival_time, burst_time) tuples in input order."""
+        pids = self.pids
+        for pid_index, arrival_time, burst_time in zip(self.pid_index, self.arrival, self.burst):
+            yield pids[pid_index], arrival_time, burst_time
+
+    def arrival_order(self):
+        """
+        Returns the process indices sorted by arrival time, ties kept in input order.
+        Already sorted workloads, the common case for traces, are not sorted again, and mapped
+        workloads read the order stored with them instead of sorting in Python.
+        """
+        if self._order is not None:
+            return self._order
+        arrival = self.arrival
+        if all(arrival[i] <= arrival[i + 1] for i in range(len(arrival) - 1)):
+            return range(len(arrival))
+        return sorted(range(len(arrival)), key=arrival.__getitem__)
+
+    def averages(self, finish):
+        """
+        Calculates the average turn around and average waiting times from per-process finish times.
+
+        Args:
+            finish (array): Finish time of every process, as returned by the engines.
+
+        Returns:
+            tuple: A tuple containing average turn around time and average waiting time.
+        """
+        n = len(self)
+        total_tat = sum(finish) - sum(self.arrival)
+        total_wt = total_tat - sum(self.burst)
+        return total_tat / n, total_wt / n
+
+    def to_numpy(self):
+        """
+        Returns (arrival, burst, pid_index) as int64 NumPy arrays sharing memory with the columns.
+        For mapped workloads, the arrays must be dropped before `close`.
+        """
+        import numpy as np
+
+        return tuple(np.frombuffer(column, dtype=np.int64) for column in (self.arrival, self.burst, self.pid_index))
+
+    def _pid_table(self):
+        # Returns the pid offsets and the concatenated JSON of every pid, None when pids are the indices
+        pids = self.pids
+        if isinstance(pids, range):
+            return None
+        if isinstance(pids, PidTable):
+            return pids._offsets, pids._data
+        encoded = [json.dumps(pid).encode() for pid in pids]
+        offsets = array("q", [0])
+        end = 0
+        for pid in encoded:
+            end += len(pid)
+            offsets.append(end)
+        return offsets, b"".join(encoded)
+
+    def _image(self):
+        # Layout shared by shared memory blocks and trace files: the header words, the int64
+        # columns back to back (the arrival order only when it is not the input order, and the
+        # pid offsets only when there is a pid table), then the pid data
+        n = len(self)
+        pid_table = self._pid_table()
+        order = self.arrival_order()
+        order = None if isinstance(order, range) else order
+        offsets, data = pid_table if pid_table is not None else (array("q"), b"")
+        pid_count = len(offsets) - 1 if pid_table is not None else -1
+        header = array("q", (_BYTE_ORDER_MARK, n, pid_count, len(data), order is not None))
+        columns = (self.arrival, self.burst, self.pid_index) + ((order,) if order is not None else ()) + (offsets,)
+        return [header, *(c if isinstance(c, (array, memoryview)) else array("q", c) for c in columns), data]
+
+    @classmethod
+    def _from_image(cls, buffer, mapping):
+        header = buffer[: _HEADER * _WORD].cast("q")
+        _, n, pid_count, pid_data_size, ordered = header
+        header.release()
+        column_count = 4 if ordered else 3
+        columns_end = _HEADER + column_count * n
+        words_end = columns_end + pid_count + 1 if pid_count >= 0 else columns_end
+        readonly = buffer.toreadonly()
+        words = readonly[: words_end * _WORD].cast("q")
+        columns = [words[_HEADER + position * n : _HEADER + (position + 1) * n] for position in range(column_count)]
+        order = columns.pop() if ordered else range(n)
+        if pid_count < 0:
+            pids = range(n)
+        else:
+            data = readonly[words_end * _WORD : words_end * _WORD + pid_data_size]
+            pids = PidTable(words[columns_end:words_end], data)
+        words.release()
+        readonly.release()
+        return cls(*columns, pids, mapping, order)
+
+    def publish(self, name=None):
+        """
+        Copies the workload into a new shared memory block.
+
+        Args:
+            name (str, optional): Name of the block. Defaults to a unique generated name.
+
+        Returns:
+            SharedWorkload: Handle owning the block. It pickles as the block name only.
+        """
+        from multiprocessing import shared_memory  # Deferred, it is slow to import and only needed here
+
+        parts = [memoryview(part).cast("B") for part in self._image()]
+        shm = shared_memory.SharedMemory(name, create=True, size=sum(part.nbytes for part in parts))
+        position = 0
+        for part in parts:
+            shm.buf[position : position + part.nbytes] = part
+            position += part.nbytes
+            part.release()
+        return SharedWorkload(shm.name, shm)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attaches to a workload published under `name`. The columns are read-only views of the
+        shared block, so nothing is copied. Call `close` once the workload is no longer used.
+        """
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name)
+        return cls._from_image(shm.buf, shm)
+
+    def save(self, path):
+        """
+        Writes the workload as a trace file: an 8-byte magic, then the same layout as a published
+        block, with every column a contiguous native-endian int64 array (little-endian on x86 and
+        ARM) and a byte-order mark in the header. Columns are streamed to the file, so saving
+        never builds a second copy in memory.
+
+        Args:
+            path (str | Path): Destination file.
+        """
+        with open(path, "wb") as file:
+            file.write(TRACE_MAGIC)
+            for part in self._image():
+                file.write(part)
+
+    @classmethod
+    def open(cls, path):
+        """
+        Memory-maps a trace file written by `save`. The columns are read-only views of the mapping,
+        so the operating system pages them in on demand and nothing is copied or turned into objects.
+        Pids are decoded one at a time as they are looked up. Call `close` once the workload is no
+        longer used. The workload pickles as the file path, so a worker maps the same file instead
+        of receiving a copy.
+        """
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapping)
+        error = None
+        if buffer[: len(TRACE_MAGIC)] != TRACE_MAGIC:
+            error = f"{path} is not a trace file"
+        elif array("q", bytes(buffer[len(TRACE_MAGIC) : len(TRACE_MAGIC) + _WORD]))[0] != _BYTE_ORDER_MARK:
+            error = f"{path} was written on a machine of the other byte order"
+        if error is not None:
+            buffer.release()
+            mapping.close()
+            raise ValueError(error)
+        workload = cls._from_image(buffer[len(TRACE_MAGIC) :], mapping)
+        workload._path = os.path.abspath(path)
+        buffer.release()
+        return workload
+
+    def close(self):
+        """Releases the shared block or file mapping, if any. The workload can not be used afterwards."""
+        if self._mapping is None:
+            return
+        for column in (self.arrival, self.burst, self.pid_index):
+            column.release()
+        if isinstance(self._order, memoryview):
+            self._order.release()
+        if isinstance(self.pids, PidTable):
+            self.pids._release()
+        self._mapping.close()
+        self._mapping = None
+
+
+class PidTable:
+    """
+    Read-only sequence of the pids of a mapped workload. Each pid is stored as JSON at an offset
+    given by an int64 column and decoded only when it is looked up, so opening a trace costs the
+    same whatever its number of distinct pids.
+    """
+    def __init__(self, offsets, data):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("pid index out of range")
+        if index < 0:
+            index += len(self)
+        return json.loads(bytes(self._data[self._offsets[index] : self._offsets[index + 1]]))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def _release(self):
+        self._offsets.release()
+        self._data.release()
+
+
+class SharedWorkload:
+    """
+    Handle to a Workload published in shared memory.
+    Only the block name crosses process boundaries, so sending it to a worker costs a few bytes
+    whatever the size of the workload. The publishing side owns the block and unlinks it on exit.
+
+    Attributes:
+        name (str): Name of the shared memory block.
+    """
+    def __init__(self, name, shm=None):
+        self.name = name
+        self._shm = shm
+
+    def __reduce__(self):
+        return SharedWorkload, (self.name,)
+
+    def attach(self):
+        """Attaches to the published workload. See `Workload.attach`."""
+        return Workload.attach(self.name)
+
+    def unlink(self):
+        """Closes and destroys the block. Workers that are still attached keep their mapping."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unlink()
+
+
+class ResultColumns:
+    """
+    Named int64 columns of per-process results, such as the finish times of each algorithm,
+    backed by a memory-mapped result file. Engines write straight into the columns, so results
+    for traces far larger than memory never exist as Python objects.
+
+    The file holds an 8-byte magic, the process and column counts, one 16-byte zero-padded
+    ASCII name per column, then the columns back to back.
+
+    Attributes:
+        names (tuple[str]): Column names, in file order.
+    """
+    NAME_SIZE = 16
+
+    def __init__(self, mapping, names, n, writable):
+        self.names = names
+        self._mapping = mapping
+        self._writable = writable
+        buffer = memoryview(mapping)
+        if not writable:
+            buffer = buffer.toreadonly()
+        offset = len(RESULT_MAGIC) + 2 * _WORD + len(names) * self.NAME_SIZE
+        words = buffer[offset : offset + len(names) * n * _WORD].cast("q")
+        self._columns = {name: words[i * n : (i + 1) * n] for i, name in enumerate(names)}
+        words.release()
+        buffer.release()
+
+    @classmethod
+    def create(cls, path, n, names=("finish",)):
+        """
+        Creates a result file of `n` zeros per column and maps it for writing.
+
+        Args:
+            path (str | Path): Destination file, replaced if it exists.
+            n (int): Number of processes.
+            names (tuple[str], optional): Column names of at most 16 ASCII characters. Defaults to ("finish",).
+
+        Returns:
+            ResultColumns: The writable columns.
+        """
+        encoded = [name.encode("ascii") for name in names]
+        if any(len(name) > cls.NAME_SIZE for name in encoded) or len(set(names)) != len(names):
+            raise ValueError(f"column names must be distinct and at most {cls.NAME_SIZE} characters")
+        header = RESULT_MAGIC + array("q", (n, len(names))).tobytes()
+        header += b"".join(name.ljust(cls.NAME_SIZE, b"\0") for name in encoded)
+        with open(path, "w+b") as file:
+            file.write(header)
+            file.truncate(len(header) + len(names) * n * _WORD)  # Zero-filled, and sparse where supported
+            mapping = mmap.mmap(file.fileno(), 0)
+        return cls(mapping, tuple(names), n, writable=True)
+
+    @classmethod
+    def open(cls, path):
+        """Maps an existing result file read-only."""
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapping[: len(RESULT_MAGIC)] != RESULT_MAGIC:
+            mapping.close()
+            raise ValueError(f"{path} is not a result file")
+        offset = len(RESULT_MAGIC)
+        n, count = array("q", mapping[offset : offset + 2 * _WORD])
+        offset += 2 * _WORD
+        names = tuple(
+            mapping[offset + i * cls.NAME_SIZE : offset + (i + 1) * cls.NAME_SIZE].rstrip(b"\0").decode("ascii")
+            for i in range(count)
+        )
+        return cls(mapping, names, n, writable=False)
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def __len__(self):
+        return len(self._columns[self.names[0]]) if self.names else 0
+
+    def to_numpy(self):
+        """
+        Returns the columns as a dict of int64 NumPy arrays sharing memory with the file.
+        The arrays must be dropped before `close`, which can not unmap memory they still use.
+        """
+        import numpy as np
+
+        return {name: np.frombuffer(column, dtype=np.int64) for name, column in self._columns.items()}
+
+    def flush(self):
+        """Writes changes back to the file."""
+        if self._writable:
+            self._mapping.flush()
+
+    def close(self):
+        """Flushes and unmaps the file. The columns can not be used afterwards."""
+        if self._mapping is None:
+            return
+        for column in self._columns.values():
+            column.release()
+        if self._writable:
+            self._mapping.flush()
+        self._mapping.close()
+        self._mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,153 @@
+from array import array
+
+IDLE = -1  # Process index used for idle segments
+
+
+class SegmentLog:
+    """
+    Compact Gantt chart made of parallel `array('q')` columns.
+    Segments are coalesced when the same process runs back to back. Rounds skipped by
+    fast-forward are stored as cycles and only expanded when the chart is read.
+
+    Attributes:
+        starts (array): Start time of each stored segment.
+        ends (array): End time of each stored segment.
+        pid_indices (array): Index into `pids` of each stored segment, or IDLE.
+        pids (list): Process IDs in order of first appearance.
+        cycles (list[tuple]): Skipped rounds as (position, start, stq, rounds, pid_indices), where position is
+            the number of stored segments that come before the cycle.
+    """
+    def __init__(self):
+        self.starts = array("q")
+        self.ends = array("q")
+        self.pid_indices = array("q")
+        self.pids = []
+        self._pid_lookup = {}
+        self.cycles = []
+
+    def _index(self, pid):
+        index = self._pid_lookup.get(pid)
+        if index is None:
+            index = self._pid_lookup[pid] = len(self.pids)
+            self.pids.append(pid)
+        return index
+
+    def _record(self, start, end, index):
+        last = len(self.starts) - 1
+        if (
+            last >= 0
+            and self.pid_indices[last] == index
+            and self.ends[last] == start
+            and not (self.cycles and self.cycles[-1][0] > last)
+        ):
+            self.ends[last] = end
+            return
+        self.starts.append(start)
+        self.ends.append(end)
+        self.pid_indices.append(index)
+
+    def append(self, start, end, pid):
+        """Records that process `pid` ran from `start` to `end`."""
+        self._record(start, end, self._index(pid))
+
+    def append_idle(self, start, end):
+        """Records that the CPU was idle from `start` to `end`."""
+        self._record(start, end, IDLE)
+
+    def append_cycle(self, start, pids, stq, rounds):
+        """
+        Records `rounds` identical rounds in which every process in `pids` runs for `stq`, in order.
+
+        Args:
+            start (int): Time at which the first round starts.
+            pids (list): Process IDs in execution order within each round.
+            stq (int): CPU time every process receives per round.
+            rounds (int): Number of rounds.
+        """
+        if len(pids) == 1:
+            self.append(start, start + stq * rounds, pids[0])
+            return
+        indices = array("q", (self._index(pid) for pid in pids))
+        self.cycles.append((len(self.starts), start, stq, rounds, indices))
+
+    def _raw_segments(self):
+        segment = 0
+        for position, start, stq, rounds, indices in self.cycles:
+            while segment < position:
+                yield self.starts[segment], self.ends[segment], self.pid_indices[segment]
+                segment += 1
+            time = start
+            for _ in range(rounds):
+                for index in indices:
+                    yield time, time + stq, index
+                    time += stq
+        for segment in range(segment, len(self.starts)):
+            yield self.starts[segment], self.ends[segment], self.pid_indices[segment]
+
+    def segments(self):
+        """
+        Yields the chart as coalesced (start, end, pid) tuples, with pid None for idle time.
+        Cycles are expanded on the fly, so this never materializes the whole chart.
+        """
+        current = None
+        for start, end, index in self._raw_segments():
+            if current is not None:
+                if current[2] == index and current[1] == start:
+                    current[1] = end
+                    continue
+                yield current[0], current[1], self._pid(current[2])
+            current = [start, end, index]
+        if current is not None:
+            yield current[0], current[1], self._pid(current[2])
+
+    def _pid(self, index):
+        return None if index == IDLE else self.pids[index]
+
+    def render(self):
+        """Renders the chart in the `|start pid end|` text format."""
+        parts = [
+            f"|{start} {'IDLE' if pid is None else pid} {end}" for start, end, pid in self.segments()
+        ]
+        return "".join(parts) + "|"
+
+    def __str__(self):
+        return self.render()
+
+    def to_numpy(self):
+        """
+        Exposes the coalesced chart as NumPy arrays, expanding cycles with vectorized arithmetic.
+
+        Returns:
+            tuple: (starts, ends, pid_indices) int64 arrays, where pid_indices index `pids` and IDLE marks idle time.
+        """
+        import numpy as np
+
+        def stored(lo, hi):
+            return (
+                np.frombuffer(self.starts, dtype=np.int64)[lo:hi],
+                np.frombuffer(self.ends, dtype=np.int64)[lo:hi],
+                np.frombuffer(self.pid_indices, dtype=np.int64)[lo:hi],
+            )
+
+        pieces = []
+        segment = 0
+        for position, start, stq, rounds, indices in self.cycles:
+            pieces.append(stored(segment, position))
+            segment = position
+            cycle_starts = start + stq * np.arange(rounds * len(indices), dtype=np.int64)
+            pieces.append(
+                (cycle_starts, cycle_starts + stq, np.tile(np.frombuffer(indices, dtype=np.int64), rounds))
+            )
+        pieces.append(stored(segment, len(self.starts)))
+        starts, ends, pid_indices = (
+            np.concatenate([piece[column] for piece in pieces]) for column in range(3)
+        )
+
+        if not len(starts):
+            return starts, ends, pid_indices
+
+        # A segment starts a new run unless it continues the previous one for the same process
+        new_run = np.ones(len(starts), dtype=bool)
+        new_run[1:] = (pid_indices[1:] != pid_indices[:-1]) | (starts[1:] != ends[:-1])
+        run_ends = np.append(np.flatnonzero(new_run)[1:] - 1, len(starts) - 1)
+        return starts[new_run], ends[run_ends], pid_indices[new_run]
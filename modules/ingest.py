@@ -0,0 +1,252 @@
+"""
+Streaming import of CSV and JSON Lines job logs into the schedulers' arrival side.
+
+Rows are parsed a bounded chunk at a time and only when the consumer asks for more, so a
+scheduler stream pulling arrivals throttles the reader and memory stays bounded by one chunk
+plus the reorder window, whatever the size of the log.
+
+CSV logs have a header naming the pid, arrival and burst columns (aliases such as arrival_time
+or bt are accepted), or no header, in which case the first three columns are used in that order.
+JSON Lines logs hold one object with the same keys, or one [pid, arrival, burst] list, per line.
+"""
+import csv
+import heapq
+import json
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# Accepted column names, by field
+ALIASES = {
+    "pid": ("pid", "name", "id", "process"),
+    "arrival": ("arrival", "arrival_time", "at"),
+    "burst": ("burst", "burst_time", "bt"),
+}
+
+
+class TraceError(ValueError):
+    """A job log or workload file that can not be parsed, or not put back in arrival order."""
+
+
+class IngestStats:
+    """
+    Counters of an ingest run, updated as rows are pulled.
+
+    Attributes:
+        rows (int): Rows parsed.
+        chunks (int): Chunks parsed.
+        reordered (int): Rows that arrived after a later arrival and were put back in order.
+        max_buffered (int): Largest number of rows held by the reorder buffer at once.
+        parse_seconds (float): Time spent reading and parsing, excluding the consumer.
+    """
+    __slots__ = ("rows", "chunks", "reordered", "max_buffered", "parse_seconds")
+
+    def __init__(self):
+        self.rows = 0
+        self.chunks = 0
+        self.reordered = 0
+        self.max_buffered = 0
+        self.parse_seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.parse_seconds if self.parse_seconds else 0.0
+
+    def __repr__(self):
+        return (
+            f"IngestStats(rows={self.rows}, chunks={self.chunks}, reordered={self.reordered}, "
+            f"max_buffered={self.max_buffered}, rows_per_second={self.rows_per_second:.0f})"
+        )
+
+
+def _to_time(value, field, where):
+    try:
+        if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+            raise TypeError
+        number = int(value)
+    except (TypeError, ValueError):
+        raise TraceError(f"{where}: {field} must be a whole number, got {value!r}") from None
+    if number < 0:
+        raise TraceError(f"{where}: {field} can not be negative, got {number}")
+    return number
+
+
+def _column_positions(header):
+    names = [name.strip().lower() for name in header]
+    positions = []
+    for field, aliases in ALIASES.items():
+        matches = [i for i, name in enumerate(names) if name in aliases]
+        if not matches:
+            return None
+        positions.append(matches[0])
+    return positions
+
+
+def _csv_chunks(file, name, chunk_size):
+    reader = csv.reader(file)
+    first = next(reader, None)
+    if first is None:
+        return
+    positions = _column_positions(first)
+    line = 1
+    pending = []
+    if positions is None:
+        # No recognised header, so the first row is data
+        positions = [0, 1, 2]
+        pending = [first]
+        line = 0
+    rows = iter(reader)
+    while True:
+        raw = pending + list(islice(rows, chunk_size - len(pending)))
+        pending = []
+        if not raw:
+            return
+        chunk = []
+        for fields in raw:
+            line += 1
+            if not fields:
+                continue
+            where = f"{name}:{line}"
+            try:
+                pid, arrival, burst = (fields[i] for i in positions)
+            except IndexError:
+                raise TraceError(f"{where}: expected pid, arrival and burst, got {fields!r}") from None
+            chunk.append((pid, _to_time(arrival, "arrival", where), _to_time(burst, "burst", where)))
+        yield chunk
+
+
+def _json_lines_chunks(file, name, chunk_size):
+    line = 0
+    while True:
+        raw = list(islice(file, chunk_size))
+        if not raw:
+            return
+        chunk = []
+        for text in raw:
+            line += 1
+            if not text.strip():
+                continue
+            where = f"{name}:{line}"
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as error:
+                raise TraceError(f"{where}: {error}") from None
+            if isinstance(record, dict):
+                values = []
+                for field, aliases in ALIASES.items():
+                    key = next((key for key in aliases if key in record), None)
+                    if key is None:
+                        raise TraceError(f"{where}: missing {field}")
+                    values.append(record[key])
+            elif isinstance(record, list) and len(record) == 3:
+                values = record
+            else:
+                raise TraceError(f"{where}: expected an object or a [pid, arrival, burst] list")
+            pid, arrival, burst = values
+            chunk.append((pid, _to_time(arrival, "arrival", where), _to_time(burst, "burst", where)))
+        yield chunk
+
+
+def read_chunks(path, format=None, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Parses a job log lazily, one chunk of rows at a time.
+
+    Args:
+        path (str | Path): Log file, or "-" for standard input.
+        format (str, optional): "csv" or "jsonl". Defaults to guessing from the file extension.
+        chunk_size (int, optional): Lines parsed per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+        stats (IngestStats, optional): Receives row, chunk and timing counters.
+
+    Yields:
+        list[tuple]: (pid, arrival_time, burst_time) rows, in file order.
+    """
+    if format is None:
+        format = "jsonl" if Path(path).suffix.lower() in (".jsonl", ".ndjson", ".json") else "csv"
+    if format not in ("csv", "jsonl"):
+        raise ValueError(f"format must be 'csv' or 'jsonl', got {format!r}")
+    parse = _csv_chunks if format == "csv" else _json_lines_chunks
+
+    if path == "-":
+        file, name = sys.stdin, "<stdin>"
+    else:
+        file, name = open(path, newline="" if format == "csv" else None), str(path)
+    try:
+        chunks = parse(file, name, chunk_size)
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            if stats is not None:
+                stats.parse_seconds += time.perf_counter() - start
+            if chunk is None:
+                return
+            if stats is not None:
+                stats.rows += len(chunk)
+                stats.chunks += 1
+            yield chunk
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def reorder(rows, window=0, stats=None):
+    """
+    Restores arrival order to rows that are at most `window` rows out of place.
+    Rows are held in a heap of at most `window` entries; equal arrivals keep their file order.
+
+    Args:
+        rows (iterable): (pid, arrival_time, burst_time) rows.
+        window (int, optional): Rows held back. Defaults to 0, which only validates the order.
+        stats (IngestStats, optional): Receives the reordered and max_buffered counters.
+
+    Yields:
+        tuple: The rows, sorted by arrival time.
+
+    Raises:
+        TraceError: A row arrives earlier than a row already released, so the window is too small.
+    """
+    heap = []
+    released = None  # Arrival time of the last released row
+    latest = None  # Latest arrival time read so far
+    for seq, row in enumerate(rows):
+        arrival_time = row[1]
+        if released is not None and arrival_time < released:
+            raise TraceError(
+                f"{row[0]!r} arrives at {arrival_time}, after a row arriving at {released} was released; "
+                f"the log is more than {window} rows out of order"
+            )
+        if latest is not None and arrival_time < latest and stats is not None:
+            stats.reordered += 1
+        if latest is None or arrival_time > latest:
+            latest = arrival_time
+        heapq.heappush(heap, (arrival_time, seq, row))
+        ready = None
+        if len(heap) > window:
+            released, _, ready = heapq.heappop(heap)
+        if stats is not None and len(heap) > stats.max_buffered:
+            stats.max_buffered = len(heap)
+        if ready is not None:
+            yield ready
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+def read_trace(path, format=None, window=0, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Streams a job log as arrival-ordered (pid, arrival_time, burst_time) tuples, ready for
+    `isrr_stream`, `srr_stream`, `trr_stream` or `Workload.from_processes`.
+
+    Args:
+        path (str | Path): Log file, or "-" for standard input.
+        format (str, optional): "csv" or "jsonl". Defaults to guessing from the file extension.
+        window (int, optional): Size of the reorder buffer for out-of-order rows. Defaults to 0.
+        chunk_size (int, optional): Lines parsed per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+        stats (IngestStats, optional): Receives throughput and reordering counters.
+
+    Yields:
+        tuple: One row per job, sorted by arrival time.
+    """
+    rows = (row for chunk in read_chunks(path, format, chunk_size, stats) for row in chunk)
+    return reorder(rows, window, stats)
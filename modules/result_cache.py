@@ -0,0 +1,326 @@
+"""
+Content-addressed on-disk cache of simulation results.
+
+Entries are keyed by a SHA-256 of the workload contents, the algorithm, its parameters and
+ENGINE_VERSION, so a repeated run of the same workload is answered from disk without simulating.
+Each entry is one compact binary file holding the averages, per-process finish times and,
+optionally, the Gantt chart. The least recently used entries are evicted once the cache
+outgrows its size limit.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from array import array
+from collections import namedtuple
+from pathlib import Path
+
+from . import columnar
+from . import gantt as gantt_module
+from . import isrr_module as im
+from . import smart_engine
+from . import srr_module as sm
+from . import trr_module as tm
+from .gantt import SegmentLog
+
+
+def _engine_version():
+    # Digest of the sources that cached results depend on, so any change to an engine,
+    # even one nobody thought would change its results, invalidates the cache
+    digest = hashlib.sha256()
+    for module in (smart_engine, im, sm, tm, gantt_module):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# Part of every key
+ENGINE_VERSION = _engine_version()
+
+ALGORITHMS = ("trr", "srr", "isrr")
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+_MAGIC = b"RRCACHE1"
+
+# Cached outcome of one run. `finish_times` is in input order; `gantt` is a list of
+# (start, end, pid) segments with pid None for idle time, or None when it was not recorded.
+CachedResult = namedtuple("CachedResult", ["average_turnaround", "average_waiting", "finish_times", "gantt"])
+
+
+def default_directory():
+    """Cache location: $RR_CACHE_DIR, else the user cache directory."""
+    if os.environ.get("RR_CACHE_DIR"):
+        return Path(os.environ["RR_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "improved-smart-round-robin"
+
+
+def _as_workload(processes):
+    if isinstance(processes, columnar.Workload):
+        return processes
+    return columnar.Workload.from_processes(
+        process if isinstance(process, tuple) else (process.pid, process.arrival_time, process.burst_time)
+        for process in processes
+    )
+
+
+def cache_key(processes, algorithm, time_quantum=None):
+    """
+    Hashes a workload and the settings that determine its schedule.
+    Fast-forward is left out on purpose: it never changes the results, only how fast they come.
+
+    Args:
+        processes (list | Workload): Process objects, (pid, arrival_time, burst_time) tuples or a Workload.
+        algorithm (str): One of ALGORITHMS.
+        time_quantum (int, optional): Fixed quantum, required for "trr".
+
+    Returns:
+        str: Hex digest identifying the run.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}")
+    if algorithm == "trr" and time_quantum is None:
+        raise ValueError("trr needs a time quantum")
+    workload = _as_workload(processes)
+    settings = {
+        "algorithm": algorithm,
+        "time_quantum": time_quantum if algorithm == "trr" else None,
+        "engine_version": ENGINE_VERSION,
+    }
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode())
+    digest.update(array("q", [len(workload)]))
+    for column in (workload.arrival, workload.burst, workload.pid_index):
+        digest.update(column if isinstance(column, (array, memoryview)) else array("q", column))
+    pid_table = workload._pid_table()
+    digest.update(b"indices" if pid_table is None else b"pids")
+    for part in pid_table or ():
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def simulate(processes, algorithm, time_quantum=None, fast_forward=False, gantt=False):
+    """
+    Runs a workload without touching the cache or the given process objects.
+
+    Args:
+        processes (list | Workload): Process objects, (pid, arrival_time, burst_time) tuples or a Workload.
+        algorithm (str): One of ALGORITHMS.
+        time_quantum (int, optional): Fixed quantum, required for "trr".
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+        gantt (bool, optional): Whether to record the Gantt chart. Defaults to False.
+
+    Returns:
+        CachedResult: The results of the run.
+    """
+    rows = list(_as_workload(processes))
+    log = SegmentLog() if gantt else None
+    if algorithm == "trr":
+        if time_quantum is None:
+            raise ValueError("trr needs a time quantum")
+        scheduler = tm.RoundRobinScheduler(time_quantum)
+        for row in rows:
+            scheduler.add_process(*row)
+        entries = list(scheduler.processes)  # Input order, before execute sorts by arrival
+        scheduler.execute(fast_forward=fast_forward, gantt=log)
+        averages = scheduler.calculate_averages()
+        finish_times = [entry["completion_time"] for entry in entries]
+    elif algorithm in ("srr", "isrr"):
+        module = sm if algorithm == "srr" else im
+        copies = [module.Process(*row) for row in rows]
+        averages = module.smart_round_robin(copies, fast_forward=fast_forward, gantt=log, trace="off")
+        finish_times = [process.finish_time for process in copies]
+    else:
+        raise ValueError(f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}")
+    return CachedResult(*averages, finish_times, list(log.segments()) if gantt else None)
+
+
+class ResultCache:
+    """
+    Directory of cached results, one file per key, evicted least recently used first.
+    Writes go through a temporary file and an atomic rename, so parallel workers can share a cache.
+
+    The directory is scanned once, then a running total of its size is kept, so stores only
+    scan it again when the total goes over the limit. Entries stored by other processes are
+    counted from the next scan on.
+
+    Attributes:
+        directory (Path): Where entries are stored.
+        max_bytes (int): Size the cache is trimmed to once a store takes it over.
+        hits (int): Lookups answered from disk.
+        misses (int): Lookups that had to simulate.
+    """
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory is not None else default_directory()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # Running total of the entry sizes, None until the first scan
+
+    def _path(self, key):
+        return self.directory / f"{key}.rrc"
+
+    def get(self, key, need_gantt=False):
+        """
+        Looks up a key, marking the entry as recently used.
+
+        Returns:
+            CachedResult: The stored result, or None if it is missing, unreadable, or lacks a
+            Gantt chart that `need_gantt` asks for.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        result = _decode(data)
+        if result is None:
+            path.unlink(missing_ok=True)  # Corrupt or from another format version
+            if self._size is not None:
+                self._size -= len(data)
+            return None
+        if need_gantt and result.gantt is None:
+            return None
+        try:
+            os.utime(path)  # Modification time is the LRU clock
+        except FileNotFoundError:
+            pass  # Evicted by another process in the meantime
+        return result
+
+    def put(self, key, result):
+        """Stores a result under `key`, then evicts old entries if the cache is over its limit."""
+        if self._size is None:
+            self._size = self.size()
+        data = _encode(result)
+        path = self._path(key)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        self._size += len(data) - replaced
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def run(self, processes, algorithm, time_quantum=None, fast_forward=False, gantt=False):
+        """
+        Returns the result of a run, simulating only if the cache does not have it.
+
+        Args:
+            processes (list | Workload): Process objects, (pid, arrival_time, burst_time) tuples or a Workload.
+                They are never modified.
+            algorithm (str): One of ALGORITHMS.
+            time_quantum (int, optional): Fixed quantum, required for "trr".
+            fast_forward (bool, optional): Skips predictable rounds on a miss. Defaults to False.
+            gantt (bool, optional): Whether the result must include the Gantt chart. Defaults to False.
+
+        Returns:
+            CachedResult: The results of the run.
+        """
+        key = cache_key(processes, algorithm, time_quantum)
+        result = self.get(key, need_gantt=gantt)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = simulate(processes, algorithm, time_quantum, fast_forward, gantt)
+        self.put(key, result)
+        return result
+
+    def entries(self):
+        """Returns (modification time, size, path) of every entry, least recently used first."""
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".rrc"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime_ns, stat.st_size, Path(entry.path)))
+        return sorted(found)
+
+    def size(self):
+        """Total size of the entries in bytes."""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, max_bytes=None):
+        """Deletes least recently used entries until the cache fits in `max_bytes`, by default `self.max_bytes`."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._size = total
+
+    def clear(self):
+        """Deletes every entry."""
+        self.evict(0)
+
+
+def _encode(result):
+    # Magic, length-prefixed JSON metadata, then the finish times and Gantt columns as int64
+    gantt = result.gantt
+    pids = []
+    columns = [array("q"), array("q"), array("q")]
+    if gantt is not None:
+        lookup = {}
+        for start, end, pid in gantt:
+            if pid is None:
+                index = -1
+            elif pid in lookup:
+                index = lookup[pid]
+            else:
+                index = lookup[pid] = len(pids)
+                pids.append(pid)
+            for column, value in zip(columns, (start, end, index)):
+                column.append(value)
+    meta = json.dumps(
+        {
+            "average_turnaround": result.average_turnaround,
+            "average_waiting": result.average_waiting,
+            "processes": len(result.finish_times),
+            "segments": None if gantt is None else len(gantt),
+            "pids": pids,
+        }
+    ).encode()
+    parts = [_MAGIC, array("q", [len(meta)]).tobytes(), meta, array("q", result.finish_times).tobytes()]
+    parts += [column.tobytes() for column in columns]
+    return b"".join(parts)
+
+
+def _decode(data):
+    if data[: len(_MAGIC)] != _MAGIC:
+        return None
+    try:
+        offset = len(_MAGIC)
+        (meta_size,) = array("q", data[offset : offset + 8])
+        offset += 8
+        meta = json.loads(data[offset : offset + meta_size])
+        offset += meta_size
+        n = meta["processes"]
+        finish_times = array("q", data[offset : offset + 8 * n]).tolist()
+        offset += 8 * n
+        gantt = None
+        if meta["segments"] is not None:
+            m = meta["segments"]
+            starts, ends, indices = (
+                array("q", data[offset + 8 * m * i : offset + 8 * m * (i + 1)]) for i in range(3)
+            )
+            pids = meta["pids"]
+            gantt = [
+                (start, end, None if index < 0 else pids[index])
+                for start, end, index in zip(starts, ends, indices)
+            ]
+        return CachedResult(meta["average_turnaround"], meta["average_waiting"], finish_times, gantt)
+    except (ValueError, KeyError, IndexError):
+        return None
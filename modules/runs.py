@@ -0,0 +1,125 @@
+"""
+Non-mutating runs of TRR, SRR and ISRR over a read-only workload.
+
+`smart_round_robin` and `RoundRobinScheduler.execute` write their run state onto the caller's
+processes, so comparing algorithms on the same processes means rebuilding them for every run.
+`simulate` instead reads a columnar Workload, which it never writes to, keeps the run state inside
+the engine, and returns a RunResult whose columns are preallocated once per run. The same
+workload can be simulated any number of times, with any algorithm, without copying it.
+"""
+from array import array
+
+from . import columnar
+from . import sweep
+
+
+class DispatchLog:
+    """
+    Schedule sink recording, per process, when it first got the CPU and how many times it was
+    dispatched, into preallocated columns indexed by process index. It takes the place of a
+    SegmentLog, so the engines feed it without knowing the difference.
+
+    A dispatch is a hand-over of the CPU to the process after another process ran or the CPU was
+    idle; consecutive slices of the same process count once.
+
+    Attributes:
+        first_start (array): Time each process first ran, -1 for processes that never ran.
+        dispatches (array): Number of dispatches of each process.
+    """
+    def __init__(self, n):
+        self.first_start = array("q", [-1]) * n
+        self.dispatches = array("q", bytes(8 * n))
+        self._last = None  # Process that ran last, None after idle time
+        self._last_end = None
+
+    def append(self, start, end, pid):
+        if pid != self._last or start != self._last_end:
+            self.dispatches[pid] += 1
+            if self.first_start[pid] < 0:
+                self.first_start[pid] = start
+        self._last = pid
+        self._last_end = end
+
+    def append_idle(self, start, end):
+        self._last = None
+
+    def append_cycle(self, start, pids, stq, rounds):
+        if len(pids) == 1:
+            self.append(start, start + stq * rounds, pids[0])
+            return
+        first_start, dispatches = self.first_start, self.dispatches
+        for position, pid in enumerate(pids):
+            dispatches[pid] += rounds
+            if first_start[pid] < 0:
+                first_start[pid] = start + position * stq
+        if pids[0] == self._last and start == self._last_end:
+            dispatches[pids[0]] -= 1  # Its first slice continues the one before the cycle
+        self._last = pids[-1]
+        self._last_end = start + stq * len(pids) * rounds
+
+
+class RunResult:
+    """
+    Outcome of one run, one int64 column per metric, indexed like the workload.
+
+    Attributes:
+        workload (Workload): The workload that was run. It is shared, not copied.
+        algorithm (str): One of sweep.ALGORITHMS.
+        time_quantum (int): Quantum of TRR runs, None otherwise.
+        finish (array): Finish time of every process, 0 for processes without any work.
+        first_start (array): Time every process first got the CPU, -1 for processes without any work.
+        dispatches (array): Number of times every process was given the CPU.
+    """
+    __slots__ = ("workload", "algorithm", "time_quantum", "finish", "first_start", "dispatches")
+
+    def __init__(self, workload, algorithm, time_quantum, finish, first_start, dispatches):
+        self.workload = workload
+        self.algorithm = algorithm
+        self.time_quantum = time_quantum
+        self.finish = finish
+        self.first_start = first_start
+        self.dispatches = dispatches
+
+    def __len__(self):
+        return len(self.finish)
+
+    def averages(self):
+        """
+        Returns:
+            tuple: A tuple containing average turn around time and average waiting time,
+            (0.0, 0.0) for an empty workload like `WhatIf.averages`.
+        """
+        if not self.finish:
+            return 0.0, 0.0
+        return self.workload.averages(self.finish)
+
+    def context_switches(self):
+        """Number of times the CPU went from one process to another, idle time aside."""
+        return max(sum(self.dispatches) - 1, 0) if self.finish else 0
+
+
+def simulate(workload, algorithm, time_quantum=None, fast_forward=False):
+    """
+    Runs a workload through one algorithm without modifying it.
+
+    Args:
+        workload (Workload | list): A columnar Workload, or Process objects or (pid, arrival_time, burst_time)
+            tuples, which are read once into a Workload. Pass a Workload to run it repeatedly without conversion.
+        algorithm (str): One of sweep.ALGORITHMS.
+        time_quantum (int, optional): Fixed quantum, required for "trr".
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+
+    Returns:
+        RunResult: Finish times, first dispatch times and dispatch counts of every process.
+    """
+    if algorithm not in sweep.ALGORITHMS:
+        raise ValueError(f"algorithm must be one of {sweep.ALGORITHMS}, got {algorithm!r}")
+    if algorithm == "trr" and time_quantum is None:
+        raise ValueError("trr needs a time quantum")
+    if not isinstance(workload, columnar.Workload):
+        workload = columnar.Workload.from_processes(workload)
+    log = DispatchLog(len(workload))
+    finish = sweep.run_columns(workload, algorithm, time_quantum, fast_forward, gantt=log)
+    return RunResult(
+        workload, algorithm, time_quantum if algorithm == "trr" else None, finish, log.first_start, log.dispatches
+    )
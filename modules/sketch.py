@@ -0,0 +1,266 @@
+"""
+Mergeable quantile sketches of waiting and turnaround times.
+
+A QuantileSketch follows DDSketch: every value is counted in a logarithmic bucket whose width
+is a fixed fraction of its position, so any quantile is answered within a relative error of
+`relative_accuracy`, whatever the distribution. Memory depends on the range of the values, not
+on how many there are: at 1% accuracy, every int64 latency fits in about 2200 buckets. Two
+sketches with the same accuracy merge by adding their bucket counts, which gives exactly the
+sketch of the combined values until the bucket limit is reached. Past it, shards fold their
+lowest buckets at different floors than a single sketch would, which only moves the lowest
+quantiles, and only within the folded range. Shards and workers each keep their own sketch and
+the parent merges them, which makes the p99 of a replay of any length available without holding
+its finish times.
+
+Only the standard library is used, so the streaming CLI stays as light to start as it is.
+"""
+import math
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+DEFAULT_MAX_BUCKETS = 2048
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+# Distinct values counted exactly before they are bucketed
+FLUSH_SIZE = 4096
+
+
+class QuantileSketch:
+    """
+    DDSketch of non-negative values.
+
+    Attributes:
+        relative_accuracy (float): Bound on the relative error of every quantile.
+        max_buckets (int): Bucket limit. Past it the lowest buckets are folded together,
+            which keeps memory bounded and only costs accuracy on the lowest quantiles.
+    """
+    __slots__ = (
+        "relative_accuracy", "max_buckets", "_gamma", "_multiplier",
+        "_values", "_count", "_total", "_min", "_max", "_zeros", "_buckets", "_floor",
+    )
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, max_buckets=DEFAULT_MAX_BUCKETS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative accuracy must be between 0 and 1, got {relative_accuracy!r}")
+        if max_buckets < 1:
+            raise ValueError(f"max buckets must be positive, got {max_buckets!r}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        # Latencies repeat a lot, so values are first counted exactly and only bucketed
+        # once FLUSH_SIZE distinct ones piled up, or when the sketch is read
+        self._values = {}
+        self._count = 0
+        self._total = 0
+        self._min = None
+        self._max = None
+        self._zeros = 0
+        self._buckets = {}  # Bucket index to count, bucket k holding (gamma^(k-1), gamma^k]
+        self._floor = None  # Lowest bucket index left after folding, None while nothing was folded
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def count(self):
+        """Number of values added."""
+        self._flush()
+        return self._count
+
+    @property
+    def total(self):
+        """Sum of the values added."""
+        self._flush()
+        return self._total
+
+    @property
+    def min(self):
+        """Smallest value added, None if empty."""
+        self._flush()
+        return self._min
+
+    @property
+    def max(self):
+        """Largest value added, None if empty."""
+        self._flush()
+        return self._max
+
+    def add(self, value, count=1):
+        """
+        Counts a value, `count` times.
+
+        Args:
+            value (int | float): Non-negative value.
+            count (int, optional): Number of occurrences. Defaults to 1.
+        """
+        if value < 0:
+            raise ValueError(f"sketched values must be non-negative, got {value!r}")
+        values = self._values
+        values[value] = values.get(value, 0) + count
+        if len(values) > FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        values = self._values
+        if not values:
+            return
+        self._values = {}
+        low, high = min(values), max(values)
+        self._min = low if self._min is None else min(self._min, low)
+        self._max = high if self._max is None else max(self._max, high)
+        buckets = self._buckets
+        log, ceil, multiplier, floor = math.log, math.ceil, self._multiplier, self._floor
+        for value, count in values.items():
+            self._count += count
+            self._total += value * count
+            if value == 0:
+                self._zeros += count
+                continue
+            index = ceil(log(value) * multiplier)
+            if floor is not None and index < floor:
+                index = floor
+            buckets[index] = buckets.get(index, 0) + count
+        if len(buckets) > self.max_buckets:
+            self._fold()
+
+    def _fold(self):
+        # Merge the lowest buckets into the lowest one that is kept
+        indices = sorted(self._buckets)
+        excess = len(indices) - self.max_buckets
+        floor = indices[excess]
+        self._buckets[floor] += sum(self._buckets.pop(index) for index in indices[:excess])
+        self._floor = floor
+
+    def merge(self, other):
+        """
+        Adds the values of another sketch to this one.
+
+        Args:
+            other (QuantileSketch): Sketch with the same relative accuracy.
+
+        Returns:
+            QuantileSketch: This sketch.
+        """
+        if other._gamma != self._gamma:
+            raise ValueError(
+                f"cannot merge sketches of relative accuracy {other.relative_accuracy} and {self.relative_accuracy}"
+            )
+        self._flush()
+        other._flush()
+        if not other._count:
+            return self
+        self._count += other._count
+        self._total += other._total
+        self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = other._max if self._max is None else max(self._max, other._max)
+        self._zeros += other._zeros
+        buckets = self._buckets
+        for index, count in other._buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+        # Fold below the higher of the two floors, so the result is bounded like both inputs
+        floor = max((f for f in (self._floor, other._floor) if f is not None), default=None)
+        if floor is not None:
+            low = [index for index in buckets if index < floor]
+            buckets[floor] = buckets.get(floor, 0) + sum(buckets.pop(index) for index in low)
+            self._floor = floor
+        if len(buckets) > self.max_buckets:
+            self._fold()
+        return self
+
+    def mean(self):
+        """Returns the exact mean of the values, None if empty."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q):
+        """
+        Returns the q-quantile, within the relative accuracy of the sketch.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float: The estimate, None if empty. q = 0 and q = 1 give the exact min and max.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"quantile must be between 0 and 1, got {q!r}")
+        self._flush()
+        if not self._count:
+            return None
+        if q == 0:
+            return self._min
+        if q == 1:
+            return self._max
+        rank = q * (self._count - 1)
+        seen = self._zeros
+        if seen > rank:
+            return 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self._min), self._max)
+        return self._max
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        Returns:
+            dict: count, mean, p<q> for every percentile, and max. Empty sketches report a count of 0 only.
+        """
+        if not self.count:
+            return {"count": 0}
+        summary = {"count": self.count, "mean": self.mean()}
+        for q in percentiles:
+            summary[f"p{q:g}"] = self.quantile(q / 100)
+        summary["max"] = self.max
+        return summary
+
+
+class LatencySketch:
+    """
+    Waiting and turnaround sketches of the processes that finished.
+    Processes without any work never run, so unlike the averages they are not counted.
+
+    Attributes:
+        turnaround (QuantileSketch): Turnaround times.
+        waiting (QuantileSketch): Waiting times.
+    """
+    __slots__ = ("turnaround", "waiting")
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, max_buckets=DEFAULT_MAX_BUCKETS):
+        self.turnaround = QuantileSketch(relative_accuracy, max_buckets)
+        self.waiting = QuantileSketch(relative_accuracy, max_buckets)
+
+    def __len__(self):
+        return self.turnaround.count
+
+    def record(self, turnaround, waiting):
+        """Counts a finished process."""
+        # Called once per finished process by the engines, so `add` is inlined;
+        # a finished process never has a negative turnaround or waiting time
+        turnarounds = self.turnaround._values
+        turnarounds[turnaround] = turnarounds.get(turnaround, 0) + 1
+        waitings = self.waiting._values
+        waitings[waiting] = waitings.get(waiting, 0) + 1
+        if len(turnarounds) > FLUSH_SIZE or len(waitings) > FLUSH_SIZE:
+            self.turnaround._flush()
+            self.waiting._flush()
+
+    def merge(self, other):
+        """
+        Adds the processes of another LatencySketch, such as the one of another shard.
+
+        Returns:
+            LatencySketch: This sketch.
+        """
+        self.turnaround.merge(other.turnaround)
+        self.waiting.merge(other.waiting)
+        return self
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        Returns:
+            dict: Summaries of "turnaround" and "waiting", see `QuantileSketch.summary`.
+        """
+        return {"turnaround": self.turnaround.summary(percentiles), "waiting": self.waiting.summary(percentiles)}
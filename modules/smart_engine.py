@@ -0,0 +1,618 @@
+from array import array
+from bisect import insort
+from collections import namedtuple
+from heapq import heappop, heappush, merge
+from itertools import count
+from operator import attrgetter
+
+from .sketch import LatencySketch
+
+
+# Levels of per-round STQ and Delta tracing kept on each process
+TRACE_OFF = "off"  # Nothing is recorded
+TRACE_SUMMARY = "summary"  # Count, min, max and mean in a TraceSummary
+TRACE_FULL = "full"  # Every value, in the `stqs` and `ds` lists
+TRACE_LEVELS = (TRACE_OFF, TRACE_SUMMARY, TRACE_FULL)
+
+
+# Event reported by the streaming schedulers whenever a process finishes
+Completion = namedtuple("Completion", ["pid", "finish_time", "turnaround", "waiting"])
+
+# State of an online scheduler between calls
+Snapshot = namedtuple(
+    "Snapshot",
+    ["time", "horizon", "ready", "pending", "completed", "average_turnaround", "average_waiting"],
+)
+
+
+class TraceSummary:
+    """
+    Constant-size summary of the STQ and Delta values a process was scheduled with.
+
+    Attributes:
+        count (int): Number of rounds the process took part in.
+        stq_min (int): Smallest STQ seen.
+        stq_max (int): Largest STQ seen.
+        stq_total (int): Sum of all STQs seen.
+        delta_min (int): Smallest Delta seen.
+        delta_max (int): Largest Delta seen.
+        delta_total (int): Sum of all Deltas seen.
+    """
+    __slots__ = ("count", "stq_min", "stq_max", "stq_total", "delta_min", "delta_max", "delta_total")
+
+    def __init__(self):
+        self.count = 0
+        self.stq_min = self.stq_max = self.stq_total = 0
+        self.delta_min = self.delta_max = self.delta_total = 0
+
+    def record(self, stq, delta, rounds=1):
+        """Adds `rounds` rounds scheduled with the given STQ and Delta."""
+        if self.count == 0:
+            self.stq_min = self.stq_max = stq
+            self.delta_min = self.delta_max = delta
+        else:
+            self.stq_min = min(self.stq_min, stq)
+            self.stq_max = max(self.stq_max, stq)
+            self.delta_min = min(self.delta_min, delta)
+            self.delta_max = max(self.delta_max, delta)
+        self.count += rounds
+        self.stq_total += stq * rounds
+        self.delta_total += delta * rounds
+
+    @property
+    def stq_mean(self):
+        return self.stq_total / self.count if self.count else 0
+
+    @property
+    def delta_mean(self):
+        return self.delta_total / self.count if self.count else 0
+
+
+class QuantumCalculator:
+    """
+    Running aggregates of the ready set used to derive the STQ and Delta of a round.
+    The engine reports every admission, CPU charge and retirement, so computing a
+    quantum never walks the ready processes.
+
+    Attributes:
+        count (int): Number of processes currently in the ready set.
+        total (int): Sum of the remaining burst times of the ready set.
+        stable_quantum (bool): True when the quantum only depends on the spread of the
+            remaining times, so it cannot change until a process is admitted or retired.
+    """
+    stable_quantum = False
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+
+    def admit(self, remaining_time):
+        """Adds a newly arrived process with `remaining_time` left to the aggregates."""
+        self.count += 1
+        self.total += remaining_time
+
+    def charge(self, cpu_time):
+        """Records that a ready process ran for `cpu_time`."""
+        self.total -= cpu_time
+
+    def retire(self):
+        """Removes a process that finished execution from the aggregates."""
+        self.count -= 1
+
+    def quantum(self, shortest, longest):
+        """
+        Calculates the STQ and Delta for the next round.
+
+        Args:
+            shortest (int): Smallest remaining burst time in the ready set.
+            longest (int): Largest remaining burst time in the ready set.
+
+        Returns:
+            tuple: A tuple containing the STQ and delta values.
+        """
+        raise NotImplementedError
+
+
+class SortedReadyQueue:
+    """
+    Ready set kept sorted by remaining time between rounds.
+    Within a round, processes that fit in STQ + Delta finish, which is always a prefix of
+    the sorted order, and every survivor drops by the same STQ, so the relative order of the
+    survivors never changes. Only new arrivals have to be positioned, by insertion or by a
+    linear merge, instead of re-sorting the whole ready set every round.
+
+    Attributes:
+        items (list): Entries ordered by `key`.
+        key (callable): Sort key of an entry, which must be unique to keep the order deterministic.
+    """
+    # Above this many arrivals in one round a single linear merge beats repeated insertion.
+    MERGE_THRESHOLD = 16
+
+    def __init__(self, key):
+        self.items = []
+        self.key = key
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def insert(self, arrivals):
+        """
+        Positions newly arrived entries in the queue.
+
+        Args:
+            arrivals (list): Entries to add, in any order.
+        """
+        if not arrivals:
+            return
+        arrivals.sort(key=self.key)
+        if not self.items:
+            self.items = arrivals
+        elif len(arrivals) <= self.MERGE_THRESHOLD:
+            for entry in arrivals:
+                insort(self.items, entry, key=self.key)
+        else:
+            self.items = list(merge(self.items, arrivals, key=self.key))
+
+    def retire(self, finished):
+        """Drops the first `finished` entries, which completed in the last round."""
+        del self.items[:finished]
+
+
+class SmartEngine:
+    """
+    Incremental state of the event loop shared by the smart round robin family (SRR and ISRR).
+    Submitted processes wait in an arrival heap and are admitted when the clock reaches them.
+    Only processes that have arrived and not yet finished are tracked, so each round costs
+    the size of the ready set instead of the whole process list.
+
+    Attributes:
+        time (int): End of the last round, or the time the engine jumped to over idle time.
+        pending (list[tuple]): Heap of (arrival_time, seq, process) for processes that have not arrived yet.
+        ready (SortedReadyQueue): (seq, process) entries that have arrived and still have remaining time.
+        calculator (QuantumCalculator): Incremental STQ and Delta rule of the algorithm.
+        gantt (SegmentLog): Receives the Gantt chart, or None when nothing is recorded.
+        fast_forward (bool): Whether predictable rounds are skipped in closed form.
+        horizon (int): Latest time up to which every arrival is known, or None when all of them are submitted.
+            Fast-forward never skips past a round that would start after it.
+        rounds (int): Number of rounds run so far, skipped ones included.
+    """
+    def __init__(self, calculator, gantt=None, fast_forward=False, trace=TRACE_OFF):
+        """
+        Initializes an empty engine at time 0.
+
+        Args:
+            calculator (QuantumCalculator): Incremental STQ and Delta rule of the algorithm, starting empty.
+            gantt (SegmentLog, optional): Receives the Gantt chart when given. Nothing is recorded otherwise.
+            fast_forward (bool, optional): If true and the calculator has a stable quantum, rounds in which no
+                process finishes and no process arrives are skipped in closed form. Defaults to False.
+            trace (str, optional): One of TRACE_LEVELS, selecting what is recorded about every round on the
+                processes. Defaults to TRACE_OFF, which allocates nothing per round.
+        """
+        if trace not in TRACE_LEVELS:
+            raise ValueError(f"trace must be one of {TRACE_LEVELS}, got {trace!r}")
+        self.time = 0
+        self.pending = []
+        # Ties on remaining time are broken by `seq`, which is input order for batch runs
+        self.ready = SortedReadyQueue(key=lambda entry: (entry[1].remaining_time, entry[0]))
+        self.calculator = calculator
+        self.gantt = gantt
+        self.fast_forward = fast_forward
+        self.horizon = None
+        self.rounds = 0
+        self._full_trace = trace == TRACE_FULL
+        self._summary_trace = trace == TRACE_SUMMARY
+
+    def submit(self, process, seq):
+        """
+        Adds a process that will be admitted once the clock reaches its arrival time.
+
+        Args:
+            process (Process): Process with remaining time left.
+            seq (int): Unique tie-breaker; among equal arrival or remaining times, lower runs first.
+        """
+        heappush(self.pending, (process.arrival_time, seq, process))
+
+    def next_arrival_time(self):
+        """Returns the arrival time of the next pending process, or None if there is none."""
+        return self.pending[0][0] if self.pending else None
+
+    def next_decision_time(self):
+        """Returns when the next round will start, or None if there is nothing left to run."""
+        if self.ready or (self.pending and self.pending[0][0] <= self.time):
+            return self.time
+        return self.next_arrival_time()
+
+    def step(self):
+        """
+        Runs one round, or jumps over idle time to the next arrival.
+
+        Returns:
+            list[Process]: Processes that finished during the step, or None if there is nothing left to run.
+        """
+        # Admit every process that has arrived by now
+        arrivals = []
+        while self.pending and self.pending[0][0] <= self.time:
+            _, seq, process = heappop(self.pending)
+            if self._full_trace:
+                process.stqs = []
+                process.ds = []
+            elif self._summary_trace:
+                process.summary = TraceSummary()
+            self.calculator.admit(process.remaining_time)
+            arrivals.append((seq, process))
+        self.ready.insert(arrivals)
+
+        # If no processes are ready, jump to the next process arrival
+        if not self.ready:
+            if not self.pending:
+                return None
+            next_arrival_time = self.pending[0][0]
+            if self.gantt is not None:
+                self.gantt.append_idle(self.time, next_arrival_time)
+            self.time = next_arrival_time
+            return []
+
+        stq, delta = self.calculator.quantum(
+            self.ready[0][1].remaining_time, self.ready[-1][1].remaining_time
+        )
+        if self.fast_forward and self.calculator.stable_quantum and self._skip_rounds(stq, delta):
+            return []
+        return self._run_round(stq, delta)
+
+    def _skip_rounds(self, stq, delta):
+        # Rounds in a row in which even the shortest process needs more than STQ + Delta
+        rounds = -((stq + delta - self.ready[0][1].remaining_time) // stq)
+        if self.pending:
+            # Arrivals are only admitted at the start of a round, so stop at the first
+            # round that starts at or after the next arrival
+            period = stq * len(self.ready)
+            rounds = min(rounds, -((self.time - self.pending[0][0]) // period))
+        if self.horizon is not None:
+            # Unknown arrivals come after the horizon, so every skipped round must start by then
+            rounds = min(rounds, (self.horizon - self.time) // (stq * len(self.ready)) + 1)
+        if rounds <= 0:
+            return False
+        if self.gantt is not None:
+            self.gantt.append_cycle(self.time, [process.pid for _, process in self.ready], stq, rounds)
+        for _, process in self.ready:
+            if self._full_trace:
+                process.stqs.extend([stq] * rounds)
+                process.ds.extend([delta] * rounds)
+            elif self._summary_trace:
+                process.summary.record(stq, delta, rounds)
+            process.remaining_time -= stq * rounds
+        self.calculator.charge(stq * rounds * len(self.ready))
+        self.time += stq * rounds * len(self.ready)
+        self.rounds += rounds
+        return True
+
+    def _run_round(self, stq, delta):
+        # Execute every process in current ready queue
+        time = self.time
+        finished = []
+        for _, process in self.ready:
+            if self._full_trace:
+                process.stqs.append(stq)
+                process.ds.append(delta)
+            elif self._summary_trace:
+                process.summary.record(stq, delta)
+            # Determine the time to assign to the CPU
+            cpu_time = (
+                process.remaining_time
+                if process.remaining_time <= stq + delta
+                else stq
+            )
+            process.remaining_time -= cpu_time
+            self.calculator.charge(cpu_time)
+            if self.gantt is not None:
+                # Update the Gantt chart with the process execution
+                self.gantt.append(time, time + cpu_time, process.pid)
+            time += cpu_time
+            if process.remaining_time == 0:
+                process.finish_time = time
+                self.calculator.retire()
+                finished.append(process)
+        self.time = time
+        self.rounds += 1
+
+        # Retire finished processes so later rounds never look at them again
+        self.ready.retire(len(finished))
+        return finished
+
+
+class OnlineScheduler:
+    """
+    Stateful smart round robin scheduler for live workloads.
+    Processes are submitted as they become known and the schedule is advanced incrementally,
+    keeping the ready set, the running STQ and Delta aggregates and the clock between calls,
+    so a new submission never re-simulates what has already run.
+
+    Subclasses set `calculator_class` to the STQ and Delta rule of their algorithm.
+
+    Attributes:
+        horizon (int): Every arrival up to this time has been submitted. New submissions must arrive later.
+        latency (LatencySketch): Waiting and turnaround times of the completed processes.
+    """
+    calculator_class = None
+
+    def __init__(self, fast_forward=False, trace=TRACE_OFF, gantt=None):
+        """
+        Initializes an empty scheduler at time 0.
+
+        Args:
+            fast_forward (bool, optional): If true, skips predictable rounds in closed form. Defaults to False.
+            trace (str, optional): One of TRACE_LEVELS. Defaults to TRACE_OFF.
+            gantt (SegmentLog, optional): Receives the Gantt chart when given. Defaults to None.
+        """
+        self._engine = SmartEngine(self.calculator_class(), gantt, fast_forward, trace)
+        self._seq = 0
+        self.horizon = None
+        self._completed = 0
+        self._total_turnaround = 0
+        self._total_waiting = 0
+        self.latency = LatencySketch()
+
+    def submit(self, process):
+        """
+        Adds a process to the live workload. Processes without any work are ignored.
+
+        Args:
+            process (Process): Process arriving after the current horizon.
+        """
+        if self.horizon is not None and process.arrival_time <= self.horizon:
+            raise ValueError(
+                f"{process.pid!r} arrives at {process.arrival_time}, but the schedule is already "
+                f"decided up to {self.horizon}"
+            )
+        if process.remaining_time > 0:
+            self._engine.submit(process, self._seq)
+            self._seq += 1
+
+    def _close_horizon(self, time):
+        if self.horizon is None or time > self.horizon:
+            self.horizon = time
+            self._engine.horizon = time
+
+    def _run_engine_step(self, completions):
+        for process in self._engine.step():
+            turnaround = process.finish_time - process.arrival_time
+            waiting = turnaround - process.burst_time
+            self._completed += 1
+            self._total_turnaround += turnaround
+            self._total_waiting += waiting
+            self.latency.record(turnaround, waiting)
+            completions.append(Completion(process.pid, process.finish_time, turnaround, waiting))
+
+    def step(self):
+        """
+        Runs the next round, jumping over idle time first if needed.
+        Running a round declares that every arrival up to its start has been submitted.
+
+        Returns:
+            list[Completion]: Processes that finished in the round, or None if there is nothing to run.
+        """
+        completions = []
+        rounds = self._engine.rounds
+        while self._engine.rounds == rounds:
+            start = self._engine.next_decision_time()
+            if start is None:
+                return None
+            self._close_horizon(start)
+            self._run_engine_step(completions)
+        return completions
+
+    def advance_to(self, time):
+        """
+        Declares that every arrival up to `time` has been submitted and runs every round that starts by then.
+        The last round may end after `time`.
+
+        Args:
+            time (int): New horizon, which can not be earlier than the current one.
+
+        Returns:
+            list[Completion]: Processes that finished, in order of finish time.
+        """
+        if self.horizon is not None and time < self.horizon:
+            raise ValueError(f"cannot advance to {time}, the schedule is already decided up to {self.horizon}")
+        self._close_horizon(time)
+        completions = []
+        while True:
+            start = self._engine.next_decision_time()
+            if start is None or start > time:
+                return completions
+            self._run_engine_step(completions)
+
+    def snapshot(self):
+        """
+        Returns the current state of the schedule.
+
+        Returns:
+            Snapshot: Clock, horizon, (pid, remaining_time) of the ready processes in run order, number of
+            pending processes, number of completed processes and the running averages over completed ones.
+        """
+        engine = self._engine
+        completed = self._completed
+        return Snapshot(
+            engine.time,
+            self.horizon,
+            [(process.pid, process.remaining_time) for _, process in engine.ready],
+            len(engine.pending),
+            completed,
+            self._total_turnaround / completed if completed else 0,
+            self._total_waiting / completed if completed else 0,
+        )
+
+
+_END = object()  # Marks an exhausted arrival iterator
+
+
+class ArrivalFeeder:
+    """
+    Hands arrivals, sorted by arrival time, to an engine as its clock advances.
+    Every arrival up to the current time is submitted, plus the next future one. The future one
+    lets idle jumps and fast-forward see where the next round must start, even after the step
+    admitted everything else that is pending, and it must outlive those admissions, or
+    fast-forward could skip past it. At most one arrival beyond the current time is pulled from
+    the iterator, so memory is bounded by the live ready set rather than the length of the stream.
+    """
+    def __init__(self, arrivals, arrival_time, submit, name=None):
+        """
+        Args:
+            arrivals (iterable): Arrivals sorted by arrival time, consumed lazily.
+            arrival_time (callable): Returns the arrival time of an arrival.
+            submit (callable): Hands an arrival to the engine, returning False if it was dropped for having no work.
+            name (callable, optional): Names an arrival in the error raised when arrivals are out of order.
+                Arrivals are trusted to be sorted when omitted.
+        """
+        self._arrivals = iter(arrivals)
+        self._arrival_time = arrival_time
+        self._submit = submit
+        self._name = name
+        self._last_arrival_time = None
+        self._latest_submitted = None  # Arrival time of the last submitted arrival, the latest one pending
+        self._lookahead = next(self._arrivals, _END)
+        self._lookahead_time = None if self._lookahead is _END else arrival_time(self._lookahead)
+
+    def feed(self, time):
+        """Submits every arrival the engine must hold before it runs its next step at `time`."""
+        latest_submitted = self._latest_submitted
+        arrival = self._lookahead_time
+        # Called before every step, so the common case of nothing to submit returns at once
+        if arrival is None or (arrival > time and latest_submitted is not None and latest_submitted > time):
+            return
+        lookahead = self._lookahead
+        arrivals, arrival_time, submit, name = self._arrivals, self._arrival_time, self._submit, self._name
+        last_arrival_time = self._last_arrival_time
+        while arrival <= time or latest_submitted is None or latest_submitted <= time:
+            if name is not None and last_arrival_time is not None and arrival < last_arrival_time:
+                raise ValueError(
+                    f"arrivals must be sorted by arrival time: {name(lookahead)!r} arrives at "
+                    f"{arrival} after an arrival at {last_arrival_time}"
+                )
+            last_arrival_time = arrival
+            if submit(lookahead):
+                latest_submitted = arrival
+            lookahead = next(arrivals, _END)
+            if lookahead is _END:
+                arrival = None
+                break
+            arrival = arrival_time(lookahead)
+        self._lookahead = lookahead
+        self._lookahead_time = arrival
+        self._latest_submitted = latest_submitted
+        self._last_arrival_time = last_arrival_time
+
+
+def simulate(processes, calculator, gantt=None, fast_forward=False, trace=TRACE_OFF):
+    """
+    Runs a batch of processes to completion on a SmartEngine.
+
+    Args:
+        processes (list[Process]): The list of Processes to be scheduled.
+        calculator (QuantumCalculator): Incremental STQ and Delta rule of the algorithm, starting empty.
+        gantt (SegmentLog, optional): Receives the Gantt chart when given. Nothing is recorded otherwise.
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+        trace (str, optional): One of TRACE_LEVELS. Defaults to TRACE_OFF.
+
+    Returns:
+        int: Number of rounds run, skipped ones included.
+    """
+    engine = SmartEngine(calculator, gantt, fast_forward, trace)
+    for seq, process in enumerate(processes):
+        # Processes without any work are never scheduled, exactly like the original rescanning loop
+        if process.remaining_time > 0:
+            engine.submit(process, seq)
+        elif trace == TRACE_FULL:
+            process.stqs = []  # Never scheduled, so never traced
+            process.ds = []
+    while engine.step() is not None:
+        pass
+    return engine.rounds
+
+
+def run_workload(workload, calculator, process_factory, fast_forward=False, out=None, gantt=None, latency=None):
+    """
+    Runs a columnar Workload to completion, reading its columns directly.
+    Processes are only built when they are about to arrive and dropped once they finish,
+    so a published workload is simulated without ever holding the whole trace as objects.
+
+    Args:
+        workload (Workload): The columnar workload, possibly attached from shared memory or mapped from a trace file.
+        calculator (QuantumCalculator): Incremental STQ and Delta rule of the algorithm, starting empty.
+        process_factory (callable): Builds a process from a (pid, arrival_time, burst_time) tuple.
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+        out (array | memoryview, optional): Zero-filled int64 column to write the finish times into,
+            such as a column of a ResultColumns file. Defaults to a new array.
+        gantt (SegmentLog, optional): Receives the schedule, with every process identified by its input index.
+            Nothing is recorded otherwise.
+        latency (LatencySketch, optional): Records the waiting and turnaround time of every process as it finishes.
+
+    Returns:
+        array: Finish time of every process in input order, 0 for processes without any work.
+    """
+    engine = SmartEngine(calculator, gantt, fast_forward)
+    arrival, burst = workload.arrival, workload.burst
+    finish = array("q", bytes(8 * len(workload))) if out is None else out
+
+    def submit(index):
+        # The pid of each process is its input index, which is also its tie-breaker, exactly as in batch runs
+        if burst[index] <= 0:
+            return False
+        engine.submit(process_factory(index, arrival[index], burst[index]), index)
+        return True
+
+    feeder = ArrivalFeeder(workload.arrival_order(), arrival.__getitem__, submit)
+    while True:
+        feeder.feed(engine.time)
+        finished = engine.step()
+        if finished is None:
+            return finish
+        for process in finished:
+            finish[process.pid] = process.finish_time
+            if latency is not None:
+                turnaround = process.finish_time - process.arrival_time
+                latency.record(turnaround, turnaround - process.burst_time)
+
+
+def stream(arrivals, calculator, process_factory, fast_forward=False, trace=TRACE_OFF):
+    """
+    Runs the engine over a lazily consumed stream of arrivals, yielding completions as they happen.
+    At most one process beyond the current time is pulled ahead, so memory is bounded by the live
+    ready set rather than the length of the stream.
+
+    Args:
+        arrivals (iterable): Processes or (pid, arrival_time, burst_time) tuples, sorted by arrival time.
+            Processes without any work are skipped, as in batch runs.
+        calculator (QuantumCalculator): Incremental STQ and Delta rule of the algorithm, starting empty.
+        process_factory (callable): Builds a process from a (pid, arrival_time, burst_time) tuple.
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+        trace (str, optional): One of TRACE_LEVELS. Defaults to TRACE_OFF.
+
+    Yields:
+        Completion: One event per finished process, in order of finish time.
+    """
+    engine = SmartEngine(calculator, fast_forward=fast_forward, trace=trace)
+    processes = (item if not isinstance(item, tuple) else process_factory(*item) for item in arrivals)
+    seqs = count()
+
+    def submit(process):
+        if process.remaining_time <= 0:
+            return False
+        engine.submit(process, next(seqs))
+        return True
+
+    feeder = ArrivalFeeder(processes, attrgetter("arrival_time"), submit, name=attrgetter("pid"))
+    while True:
+        feeder.feed(engine.time)
+        finished = engine.step()
+        if finished is None:
+            return
+        for process in finished:
+            turnaround = process.finish_time - process.arrival_time
+            yield Completion(process.pid, process.finish_time, turnaround, turnaround - process.burst_time)
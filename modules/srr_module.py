@@ -1,3 +1,7 @@
+from . import smart_engine
+from .gantt import SegmentLog
+
+
 class Process:
     """
     Represents a single process in a scheduling algorithm.
@@ -9,9 +13,23 @@ class Process:
         remaining_time (int): Remaining execution time for the process.
         finish_time (int): Time at which the process finishes execution.
         has_started (bool): Indicates whether the process execution has started.
-        stqs (list[int]): Dynamic list to store the Smart Time Quantum used at each scheduling decision for this process.
-        ds (list[int]): Dynamic list to store the Delta values used at each scheduling decision for this process.
+        stqs (list[int]): Smart Time Quantum used at each scheduling decision for this process, empty unless traced in full.
+        ds (list[int]): Delta values used at each scheduling decision for this process, empty unless traced in full.
+        summary (TraceSummary): Count, min, max and mean of the STQ and Delta values, when traced as a summary.
     """
+    # Slots keep each process compact, which matters for traces with millions of processes
+    __slots__ = (
+        "pid",
+        "arrival_time",
+        "burst_time",
+        "remaining_time",
+        "finish_time",
+        "has_started",
+        "stqs",
+        "ds",
+        "summary",
+    )
+
     def __init__(self, pid, arrival_time, burst_time):
         """
         Initializes a new instance of the Process class.
@@ -27,8 +45,9 @@ class Process:
         self.remaining_time = burst_time
         self.finish_time = 0
         self.has_started = False
-        self.stqs = []
-        self.ds = []
+        self.stqs = ()  # Shared until the engine allocates lists, only when traced in full
+        self.ds = ()
+        self.summary = None
 
 
 def calculate_stq(processes):
@@ -62,6 +81,43 @@ def calculate_delta(stq):
     return stq // 2
 
 
+def calculate_stq_delta(ready_processes):
+    """
+    Calculates the STQ and Delta used by SRR for one round.
+
+    Args:
+        ready_processes (list[Process]): Ready processes sorted by remaining time.
+
+    Returns:
+        tuple: A tuple containing the calculated STQ and delta values.
+    """
+    stq = max(calculate_stq(ready_processes), 1)  # STQ should be at least 1
+    return stq, calculate_delta(stq)
+
+
+class StqDeltaCalculator(smart_engine.QuantumCalculator):
+    """
+    Incremental form of `calculate_stq_delta` used by the engine.
+    The ready processes are sorted by remaining time, so the average of adjacent
+    differences collapses to (longest - shortest) / (n - 1).
+    The spread is unchanged while every process drops by the same STQ, so the quantum is stable.
+    """
+    stable_quantum = True
+
+    def quantum(self, shortest, longest):
+        stq = round((longest - shortest) / (self.count - 1)) if self.count > 1 else 0
+        stq = max(stq, 1)  # STQ should be at least 1
+        return stq, calculate_delta(stq)
+
+
+class SmartRoundRobinScheduler(smart_engine.OnlineScheduler):
+    """
+    Online SRR scheduler driven by `submit`, `advance_to`, `step` and `snapshot`.
+    Produces the same schedule as `smart_round_robin` once every process has been submitted and run.
+    """
+    calculator_class = StqDeltaCalculator
+
+
 def calculate_times(processes):
     """
     Calculates the average turn around and average waiting times.
@@ -83,7 +139,9 @@ def calculate_times(processes):
     return average_tat, average_wt
 
 
-def smart_round_robin(processes, print_gantt=False):
+def smart_round_robin(
+    processes, print_gantt=False, fast_forward=False, gantt=None, trace=None
+):
     """
     An improved implementation of the traditional round robin algorithm.
     It uses Average of Differences of RBTs for STQ and half of STQ for Delta.
@@ -91,58 +149,59 @@ def smart_round_robin(processes, print_gantt=False):
     Args:
         processes (list[Process]): The list of Processes to be evaluated with Smart Round Robin Algorithm.
         print_gantt (bool, optional): If true, prints the gantt chart for the current solution. Defaults to False.
+        fast_forward (bool, optional): If true, skips predictable rounds in closed form. Defaults to False.
+        gantt (SegmentLog, optional): Receives the Gantt chart segments for later analysis. Defaults to None.
+        trace (str, optional): Per-round STQ and Delta tracing, one of "off", "summary" or "full".
+            "full" fills `stqs` and `ds`, "summary" fills `summary`. Defaults to "full", or to "off" with
+            fast-forward, whose skipped rounds would otherwise each add an entry to `stqs` and `ds`.
 
     Returns:
         tuple: It returns a tuple containing average turn around time and average waiting time.
     """
-    time = 0
-    gantt_chart = ""  # Initialize an empty string to build the Gantt chart
-    while any(p.remaining_time > 0 for p in processes):
-        # Filter processes that have arrived and have remaining time
-        ready_processes = [
-            p for p in processes if p.remaining_time > 0 and p.arrival_time <= time
-        ]
-
-        # If no processes are ready, increment time to the next process arrival
-        if not ready_processes:
-            next_arrival_time = min(
-                p.arrival_time
-                for p in processes
-                if p.remaining_time > 0 and p.arrival_time > time
-            )
-            if time < next_arrival_time:
-                # Add idle time to the Gantt chart
-                gantt_chart += f"|{time} IDLE {next_arrival_time}"
-            time = next_arrival_time
-            continue
-
-        # Calculate STQ and Delta based on ready processes
-        ready_processes.sort(key=lambda x: x.remaining_time)
-        stq = max(calculate_stq(ready_processes), 1)  # STQ should be at least 1
-        delta = calculate_delta(stq)
-
-        for process in ready_processes:
-            process.stqs.append(stq)
-            process.ds.append(delta)
-            if process.remaining_time > 0:
-                # Determine the time to assign to the CPU
-                cpu_time = (
-                    process.remaining_time
-                    if process.remaining_time <= stq + delta
-                    else stq
-                )
-                start_time = time  # Record the start time for this process
-                process.remaining_time -= cpu_time
-                time += cpu_time
-                # Update the Gantt chart with the process execution
-                gantt_chart += f"|{start_time} {process.pid} {time}"
-                if process.remaining_time == 0:
-                    process.finish_time = time
+    if trace is None:
+        trace = smart_engine.TRACE_OFF if fast_forward else smart_engine.TRACE_FULL
+    if print_gantt and gantt is None:
+        gantt = SegmentLog()  # The chart is only recorded when it is needed
+    smart_engine.simulate(processes, StqDeltaCalculator(), gantt, fast_forward, trace)
 
     if print_gantt:
-        print(gantt_chart + "|")  # Print the final Gantt chart only if print_gantt is True
+        print(gantt.render())  # Print the final Gantt chart only if print_gantt is True
         print()
         print()
         print()
-
     return calculate_times(processes)
+
+
+def srr_stream(arrivals, fast_forward=False, trace=smart_engine.TRACE_OFF):
+    """
+    Streaming form of `smart_round_robin` that consumes arrivals lazily and yields completions as they happen.
+    Memory is bounded by the live ready set, so arbitrarily long traces can be replayed.
+
+    Args:
+        arrivals (iterable): Processes or (pid, arrival_time, burst_time) tuples, sorted by arrival time.
+        fast_forward (bool, optional): If true, skips predictable rounds in closed form. Defaults to False.
+        trace (str, optional): Per-round STQ and Delta tracing, one of "off", "summary" or "full". Defaults to "off".
+
+    Yields:
+        Completion: (pid, finish_time, turnaround, waiting) for every process, in order of finish time.
+    """
+    return smart_engine.stream(arrivals, StqDeltaCalculator(), Process, fast_forward, trace)
+
+
+def srr_workload(workload, fast_forward=False, out=None, gantt=None, latency=None):
+    """
+    Runs SRR over a columnar Workload without building the whole process list.
+
+    Args:
+        workload (Workload): The columnar workload, possibly attached from shared memory or mapped from a trace file.
+        fast_forward (bool, optional): If true, skips predictable rounds in closed form. Defaults to False.
+        out (array | memoryview, optional): Zero-filled int64 column to write the finish times into.
+            Defaults to a new array.
+        gantt (SegmentLog, optional): Receives the schedule, with every process identified by its input index.
+            Nothing is recorded otherwise.
+        latency (LatencySketch, optional): Records the waiting and turnaround time of every process as it finishes.
+
+    Returns:
+        array: Finish time of every process in input order, 0 for processes without any work.
+    """
+    return smart_engine.run_workload(workload, StqDeltaCalculator(), Process, fast_forward, out, gantt, latency)
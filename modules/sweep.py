@@ -0,0 +1,270 @@
+"""
+Parallel sweep runner that evaluates workloads x algorithms x parameters on a process pool.
+
+Usage: python -m modules.sweep workloads.jsonl --algorithms trr srr isrr --quantum 2 4 --workers 8 > results.jsonl
+
+Every input line is one workload, a JSON list of [pid, arrival_time, burst_time] triples.
+Every output line is one JSON result, in deterministic workload, algorithm, quantum order.
+
+Large workloads are best published to shared memory first and passed as SharedWorkload handles:
+workers then attach to the columns instead of receiving a pickled copy of every process.
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from . import columnar
+from . import isrr_module as im
+from . import srr_module as sm
+from . import trr_module as tm
+from .ingest import TraceError
+
+ALGORITHMS = ("trr", "srr", "isrr")
+
+_attached = None  # (block name, Workload) of the shared workload this worker last attached to
+_in_worker = False  # Set by `_init_worker` in pool workers, the only processes that keep attachments
+
+
+def run_workload(workload, algorithm, time_quantum=None, fast_forward=False):
+    """
+    Runs one workload through one algorithm.
+
+    Args:
+        workload (list[tuple] | Workload | SharedWorkload): (pid, arrival_time, burst_time) triples,
+            or a columnar workload, which is run without building the whole process list.
+        algorithm (str): One of ALGORITHMS.
+        time_quantum (int, optional): Fixed quantum, required for "trr".
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+
+    Returns:
+        tuple: A tuple containing average turn around time and average waiting time.
+    """
+    if algorithm == "trr" and time_quantum is None:
+        raise ValueError("trr needs a time quantum")
+    if isinstance(workload, columnar.SharedWorkload):
+        if _in_worker:
+            workload = _attach(workload)
+        else:
+            # Attached only for this run, so the caller never keeps a mapping of a block it later unlinks
+            attached = workload.attach()
+            try:
+                return attached.averages(run_columns(attached, algorithm, time_quantum, fast_forward))
+            finally:
+                attached.close()
+    if isinstance(workload, columnar.Workload):
+        return workload.averages(run_columns(workload, algorithm, time_quantum, fast_forward))
+    if algorithm == "trr":
+        scheduler = tm.RoundRobinScheduler(time_quantum)
+        scheduler.add_processes(workload)
+        scheduler.execute(fast_forward=fast_forward)
+        return scheduler.calculate_averages()
+    if algorithm == "srr":
+        return sm.smart_round_robin([sm.Process(*p) for p in workload], fast_forward=fast_forward, trace="off")
+    if algorithm == "isrr":
+        return im.smart_round_robin([im.Process(*p) for p in workload], trace="off")
+    raise ValueError(f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}")
+
+
+def _init_worker():
+    global _in_worker
+    _in_worker = True
+
+
+def _attach(shared):
+    # Tasks arrive grouped by workload, so keeping only the last attachment reuses it
+    # across a whole group while holding at most one mapping per worker
+    global _attached
+    if _attached is None or _attached[0] != shared.name:
+        if _attached is not None:
+            _attached[1].close()
+        _attached = shared.name, shared.attach()
+    return _attached[1]
+
+
+def run_columns(workload, algorithm, time_quantum=None, fast_forward=False, out=None, gantt=None, latency=None):
+    """
+    Runs a columnar Workload through one algorithm, reading its columns directly.
+
+    Args:
+        workload (Workload): The columnar workload, possibly attached from shared memory or mapped from a trace file.
+        algorithm (str): One of ALGORITHMS.
+        time_quantum (int, optional): Fixed quantum, required for "trr".
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+        out (array | memoryview, optional): Zero-filled int64 column to write the finish times into.
+            Defaults to a new array.
+        gantt (SegmentLog, optional): Receives the schedule, with every process identified by its input index.
+        latency (LatencySketch, optional): Records the waiting and turnaround time of every process as it finishes.
+
+    Returns:
+        array: Finish time of every process in input order, 0 for processes without any work.
+    """
+    if algorithm == "trr" and time_quantum is None:
+        raise ValueError("trr needs a time quantum")
+    if algorithm == "trr":
+        return tm.trr_workload(workload, time_quantum, fast_forward, out, gantt, latency)
+    if algorithm == "srr":
+        return sm.srr_workload(workload, fast_forward, out, gantt, latency)
+    if algorithm == "isrr":
+        return im.isrr_workload(workload, out=out, gantt=gantt, latency=latency)
+    raise ValueError(f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}")
+
+
+def run_trace(trace_path, result_path, algorithms=ALGORITHMS, time_quantum=None, fast_forward=False):
+    """
+    Runs a trace file through each algorithm, writing one finish-time column per algorithm
+    into a memory-mapped result file. Neither the trace nor the results are loaded into memory.
+
+    Args:
+        trace_path (str | Path): Trace file written by `Workload.save`.
+        result_path (str | Path): Result file to create, see `ResultColumns`.
+        algorithms (tuple, optional): Algorithms to run, each giving a column of the same name. Defaults to ALGORITHMS.
+        time_quantum (int, optional): Fixed quantum, required for "trr".
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+
+    Returns:
+        dict: Average turn around time and average waiting time of every algorithm.
+    """
+    if "trr" in algorithms and time_quantum is None:
+        raise ValueError("trr needs a time quantum")
+    workload = columnar.Workload.open(trace_path)
+    try:
+        with columnar.ResultColumns.create(result_path, len(workload), algorithms) as results:
+            averages = {}
+            for algorithm in algorithms:
+                finish = run_columns(workload, algorithm, time_quantum, fast_forward, results[algorithm])
+                averages[algorithm] = workload.averages(finish)
+            return averages
+    finally:
+        workload.close()
+
+
+def iter_tasks(workloads, algorithms=ALGORITHMS, time_quanta=(), fast_forward=False):
+    """
+    Expands workloads x algorithms x parameters into tasks, in deterministic order.
+    TRR runs once per time quantum, SRR and ISRR once per workload.
+
+    Yields:
+        tuple: (workload_index, workload, algorithm, time_quantum, fast_forward)
+    """
+    for index, workload in enumerate(workloads):
+        for algorithm in algorithms:
+            for time_quantum in time_quanta if algorithm == "trr" else (None,):
+                yield index, workload, algorithm, time_quantum, fast_forward
+
+
+def _run_chunk(chunk):
+    # Runs in a worker. Tasks of one workload share the same list, which pickle sends only once per chunk.
+    results = []
+    for index, workload, algorithm, time_quantum, fast_forward in chunk:
+        atat, awt = run_workload(workload, algorithm, time_quantum, fast_forward)
+        results.append(
+            {"workload": index, "algorithm": algorithm, "time_quantum": time_quantum, "atat": atat, "awt": awt}
+        )
+    return results
+
+
+def _chunks(tasks, chunksize):
+    tasks = iter(tasks)
+    while chunk := list(islice(tasks, chunksize)):
+        yield chunk
+
+
+def sweep(workloads, algorithms=ALGORITHMS, time_quanta=(), fast_forward=False, max_workers=None, chunksize=64):
+    """
+    Evaluates every workload with every algorithm and parameter on a process pool.
+    Tasks are sent in chunks to amortize pickling, a bounded number of chunks is in flight at once,
+    and finished chunks are held back only until every earlier one is done, so results stream out
+    as soon as possible while keeping a deterministic order.
+
+    Args:
+        workloads (iterable): Workloads, each a list of (pid, arrival_time, burst_time) triples, a Workload
+            or a SharedWorkload. May be lazy.
+        algorithms (tuple, optional): Algorithms to run. Defaults to ALGORITHMS.
+        time_quanta (tuple, optional): Quanta to run TRR with. Defaults to none.
+        fast_forward (bool, optional): Skips predictable rounds in closed form. Defaults to False.
+        max_workers (int, optional): Worker processes; 1 runs inline without a pool. Defaults to the CPU count.
+        chunksize (int, optional): Tasks per chunk. Defaults to 64.
+
+    Yields:
+        dict: One result per task, with workload index, algorithm, time_quantum, atat and awt.
+    """
+    if "trr" in algorithms and not time_quanta:
+        raise ValueError("trr needs at least one time quantum")
+    chunks = _chunks(iter_tasks(workloads, algorithms, time_quanta, fast_forward), chunksize)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _run_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        in_flight = {}  # Future -> chunk number
+        done = {}  # Finished chunks waiting for an earlier one
+        submitted = 0
+        next_to_yield = 0
+        for chunk in islice(chunks, 4 * max_workers):
+            in_flight[executor.submit(_run_chunk, chunk)] = submitted
+            submitted += 1
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done[in_flight.pop(future)] = future.result()
+                # Keep the pool busy with one new chunk per finished one
+                for chunk in islice(chunks, 1):
+                    in_flight[executor.submit(_run_chunk, chunk)] = submitted
+                    submitted += 1
+            while next_to_yield in done:
+                yield from done.pop(next_to_yield)
+                next_to_yield += 1
+
+
+def read_workloads(lines):
+    """
+    Parses JSON Lines workloads, one list of [pid, arrival_time, burst_time] triples per line.
+
+    Raises:
+        TraceError: A line is not a list of triples.
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            workload = [tuple(process) for process in json.loads(line)]
+        except (ValueError, TypeError) as error:
+            raise TraceError(f"workload line {number}: {error}") from None
+        if not all(len(process) == 3 for process in workload):
+            raise TraceError(f"workload line {number}: expected [pid, arrival_time, burst_time] triples")
+        yield workload
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run TRR, SRR and ISRR over many workloads in parallel.")
+    parser.add_argument("workloads", help="JSON Lines file of workloads, or - for stdin.")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--quantum", type=int, nargs="+", default=[], help="Time quanta to run TRR with.")
+    parser.add_argument("--fast-forward", action="store_true", help="Skip predictable rounds in closed form.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--chunksize", type=int, default=64, help="Tasks sent to a worker at once.")
+    args = parser.parse_args(argv)
+    if "trr" in args.algorithms and not args.quantum:
+        parser.error("trr needs --quantum")
+
+    source = sys.stdin if args.workloads == "-" else open(args.workloads)
+    with source:
+        results = sweep(
+            read_workloads(source),
+            tuple(args.algorithms),
+            tuple(args.quantum),
+            args.fast_forward,
+            args.workers,
+            args.chunksize,
+        )
+        for result in results:
+            print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,67 +1,269 @@
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from operator import itemgetter
+
+from .sketch import LatencySketch
+from .smart_engine import ArrivalFeeder, Completion, Snapshot
+
+
+def new_process(name, arrival_time, burst_time):
+    """Builds the dictionary the scheduler uses to track a process."""
+    return {
+        "name": name,
+        "arrival_time": arrival_time,
+        "burst_time": burst_time,
+        "remaining_time": burst_time,
+        "start_time": None,  # Track the first time a process starts
+        "completion_time": 0,
+    }
+
+
 class RoundRobinScheduler:
-    def __init__(self, time_quantum):
+    def __init__(self, time_quantum, fast_forward=False, gantt=None):
+        """
+        Args:
+            time_quantum (int): The fixed time quantum.
+            fast_forward (bool, optional): If true, whole rotations of the ready queue that cannot complete
+                a process or admit an arrival are skipped in closed form. Defaults to False.
+            gantt (SegmentLog, optional): Receives the Gantt chart when given. Nothing is recorded otherwise.
+        """
         self.time_quantum = time_quantum
+        self.fast_forward = fast_forward
+        self.gantt = gantt
         self.processes = []
+        self._sorted = True  # Whether `processes` is currently ordered by arrival time
+        self._reset()
+
+    def _reset(self):
+        # Run state, advanced one time slice at a time by `run_slice`
+        self.current_time = 0
+        self.ready_queue = deque()
+        self._pending = []  # Heap of (arrival_time, seq, process) not yet admitted
+        self._seq = 0  # Tie-breaker that keeps simultaneous arrivals in submission order
+        self._slices_until_check = 0  # Fast-forward is re-checked at most once per rotation of the ready queue
+        self.horizon = None  # Every arrival up to this time is known; None when all of them are
+        self.slices = 0  # Time slices run so far, skipped ones included
+        self._completed = 0
+        self._total_turnaround = 0
+        self._total_waiting = 0
+        self.latency = LatencySketch()  # Waiting and turnaround times of the live workload's completions
 
     def add_process(self, name, arrival_time, burst_time):
-        self.processes.append(
-            {
-                "name": name,
-                "arrival_time": arrival_time,
-                "burst_time": burst_time,
-                "remaining_time": burst_time,
-                "start_time": None,  # Track the first time a process starts
-                "completion_time": 0,
-            }
+        if self.processes and arrival_time < self.processes[-1]["arrival_time"]:
+            self._sorted = False  # Sorting is deferred until the processes are needed in order
+        self.processes.append(new_process(name, arrival_time, burst_time))
+
+    def add_processes(self, processes):
+        """Bulk loads (name, arrival_time, burst_time) tuples, sorting only once."""
+        for name, arrival_time, burst_time in processes:
+            self.add_process(name, arrival_time, burst_time)
+        self._sort_processes()
+
+    def _sort_processes(self):
+        # The sort is stable, so processes arriving together keep their insertion order
+        if not self._sorted:
+            self.processes.sort(key=itemgetter("arrival_time"))  # Sort by arrival time
+            self._sorted = True
+
+    def _enqueue(self, process):
+        # Hands a process to the run state; it is admitted once the clock reaches its arrival time
+        heappush(self._pending, (process["arrival_time"], self._seq, process))
+        self._seq += 1
+
+    def _fast_forward(self, next_arrival_time):
+        """
+        Skips whole rotations of the ready queue in which every process runs a full quantum.
+        Such rotations leave the queue order unchanged, so they can be applied in closed form.
+        Returns whether any rotation was skipped.
+        """
+        quantum = self.time_quantum
+        # Slices each process can run before its last one is the smallest ceil(remaining / quantum) - 1
+        rotations = min(-(-p["remaining_time"] // quantum) for p in self.ready_queue) - 1
+        period = quantum * len(self.ready_queue)
+        if next_arrival_time is not None:
+            # An arrival may only be admitted after the last skipped slice
+            rotations = min(rotations, (next_arrival_time - self.current_time) // period)
+        if self.horizon is not None:
+            # Unknown arrivals come after the horizon, so every skipped slice must start by then
+            rotations = min(rotations, (self.horizon - self.current_time + quantum) // period)
+        if rotations <= 0:
+            return False
+        if self.gantt is not None:
+            self.gantt.append_cycle(
+                self.current_time, [p["name"] for p in self.ready_queue], quantum, rotations
+            )
+        for position, process in enumerate(self.ready_queue):
+            if process["start_time"] is None:
+                process["start_time"] = self.current_time + position * quantum
+            process["remaining_time"] -= rotations * quantum
+        self.current_time += rotations * period
+        self.slices += rotations * len(self.ready_queue)
+        return True
+
+    def run_slice(self):
+        """
+        Runs one time slice, skips whole rotations when fast-forwarding, or skips idle time.
+        Unlike `step`, it neither moves the horizon nor reports Completions, for drivers that
+        submit arrivals themselves, such as an ArrivalFeeder.
+
+        Returns:
+            list[dict]: The processes completed by the step, or None if there is nothing left to run.
+        """
+        # Add newly arrived processes to the ready queue
+        while self._pending and self._pending[0][0] <= self.current_time:
+            process = heappop(self._pending)[2]
+            if process["remaining_time"] > 0:
+                self.ready_queue.append(process)
+
+        if not self.ready_queue:
+            if not self._pending:
+                return None
+            # Increment current time to the next process arrival time or by 1
+            idle_until = max(self.current_time + 1, self._pending[0][0])
+            if self.gantt is not None:
+                self.gantt.append_idle(self.current_time, idle_until)
+            self.current_time = idle_until
+            return []
+
+        if self.fast_forward:
+            if self._slices_until_check == 0:
+                self._slices_until_check = len(self.ready_queue)
+                next_arrival_time = self._pending[0][0] if self._pending else None
+                if self._fast_forward(next_arrival_time):
+                    return []  # Admit anything arriving exactly at the end of the skipped rotations
+            self._slices_until_check -= 1
+
+        process = self.ready_queue.popleft()
+        if process["start_time"] is None:
+            process["start_time"] = self.current_time
+
+        start_time = self.current_time
+        self.slices += 1
+        completed = []
+        if process["remaining_time"] > self.time_quantum:
+            self.current_time += self.time_quantum
+            process["remaining_time"] -= self.time_quantum
+        else:
+            self.current_time += process["remaining_time"]
+            process["remaining_time"] = 0
+            process["completion_time"] = self.current_time
+            completed.append(process)
+        if self.gantt is not None:
+            self.gantt.append(start_time, self.current_time, process["name"])
+
+        # Re-add the process to the end of the queue if it's not finished
+        if process["remaining_time"] > 0:
+            self.ready_queue.append(process)
+        return completed
+
+    def execute(self, fast_forward=None, gantt=None):
+        """
+        Runs the round robin schedule over the added processes.
+
+        Args:
+            fast_forward (bool, optional): Replaces the scheduler's fast-forward setting when given.
+            gantt (SegmentLog, optional): Replaces the scheduler's Gantt chart sink when given.
+        """
+        self._sort_processes()
+        self._reset()
+        if fast_forward is not None:
+            self.fast_forward = fast_forward
+        if gantt is not None:
+            self.gantt = gantt
+        for process in self.processes:
+            self._enqueue(process)
+        while self.run_slice() is not None:
+            pass
+
+    def submit(self, name, arrival_time, burst_time):
+        """
+        Adds a process to a live workload driven by `advance_to`, `step` and `snapshot`.
+        Unlike `add_process`, the process is scheduled immediately and not kept once it completes.
+        Processes without any work are ignored.
+
+        Returns:
+            bool: Whether the process was scheduled, False if it has no work.
+        """
+        if self.horizon is not None and arrival_time <= self.horizon:
+            raise ValueError(
+                f"{name!r} arrives at {arrival_time}, but the schedule is already decided up to {self.horizon}"
+            )
+        if burst_time <= 0:
+            return False
+        self._enqueue(new_process(name, arrival_time, burst_time))
+        return True
+
+    def _next_decision_time(self):
+        # When the next time slice will start, or None if there is nothing left to run
+        if self.ready_queue or (self._pending and self._pending[0][0] <= self.current_time):
+            return self.current_time
+        return self._pending[0][0] if self._pending else None
+
+    def _close_horizon(self, time):
+        if self.horizon is None or time > self.horizon:
+            self.horizon = time
+
+    def _run_advance(self, completions):
+        for process in self.run_slice():
+            turnaround = process["completion_time"] - process["arrival_time"]
+            waiting = turnaround - process["burst_time"]
+            self._completed += 1
+            self._total_turnaround += turnaround
+            self._total_waiting += waiting
+            self.latency.record(turnaround, waiting)
+            completions.append(Completion(process["name"], process["completion_time"], turnaround, waiting))
+
+    def step(self):
+        """
+        Runs the next time slice of a live workload, jumping over idle time first if needed.
+        Running a slice declares that every arrival up to its start has been submitted.
+
+        Returns:
+            list[Completion]: The process completed by the slice, if any, or None if there is nothing to run.
+        """
+        completions = []
+        slices = self.slices
+        while self.slices == slices:
+            start = self._next_decision_time()
+            if start is None:
+                return None
+            self._close_horizon(start)
+            self._run_advance(completions)
+        return completions
+
+    def advance_to(self, time):
+        """
+        Declares that every arrival up to `time` has been submitted and runs every time slice that starts by then.
+
+        Returns:
+            list[Completion]: Processes that completed, in order of completion time.
+        """
+        if self.horizon is not None and time < self.horizon:
+            raise ValueError(f"cannot advance to {time}, the schedule is already decided up to {self.horizon}")
+        self._close_horizon(time)
+        completions = []
+        while True:
+            start = self._next_decision_time()
+            if start is None or start > time:
+                return completions
+            self._run_advance(completions)
+
+    def snapshot(self):
+        """
+        Returns the current state of a live workload as a Snapshot, listing (name, remaining_time)
+        of the ready processes in queue order.
+        """
+        completed = self._completed
+        return Snapshot(
+            self.current_time,
+            self.horizon,
+            [(process["name"], process["remaining_time"]) for process in self.ready_queue],
+            len(self._pending),
+            completed,
+            self._total_turnaround / completed if completed else 0,
+            self._total_waiting / completed if completed else 0,
         )
-        self.processes.sort(key=lambda x: x["arrival_time"])  # Sort by arrival time
-
-    def execute(self):
-        current_time = 0
-        ready_queue = []
-        completed_processes = 0
-        n = len(self.processes)
-
-        while completed_processes < n:
-            # Add newly arrived processes to the ready queue
-            for process in self.processes:
-                if (
-                    process["arrival_time"] <= current_time
-                    and process not in ready_queue
-                    and process["remaining_time"] > 0
-                ):
-                    ready_queue.append(process)
-
-            if ready_queue:
-                process = ready_queue.pop(0)
-                if process["start_time"] is None:
-                    process["start_time"] = current_time
-
-                if process["remaining_time"] > self.time_quantum:
-                    current_time += self.time_quantum
-                    process["remaining_time"] -= self.time_quantum
-                else:
-                    current_time += process["remaining_time"]
-                    process["remaining_time"] = 0
-                    process["completion_time"] = current_time
-                    completed_processes += 1
-
-                # Re-add the process to the end of the queue if it's not finished
-                if process["remaining_time"] > 0:
-                    ready_queue.append(process)
-            else:
-                # Find the next process arrival time if the ready queue is empty
-                next_arrival_time = min(
-                    [
-                        p["arrival_time"]
-                        for p in self.processes
-                        if p["arrival_time"] > current_time
-                    ],
-                    default=current_time,
-                )
-                current_time = max(
-                    current_time + 1, next_arrival_time
-                )  # Increment current time to the next process arrival time or by 1
 
     def calculate_averages(self):
         total_tat = 0
@@ -76,3 +278,67 @@ class RoundRobinScheduler:
         avg_tat = total_tat / len(self.processes)
         avg_wt = total_wt / len(self.processes)
         return avg_tat, avg_wt
+
+
+def trr_stream(arrivals, time_quantum, fast_forward=False):
+    """
+    Runs traditional round robin over a lazily consumed stream of arrivals, yielding completions as they happen.
+    At most one process beyond the current time is pulled ahead, so memory is bounded by the live
+    ready queue rather than the length of the stream.
+
+    Args:
+        arrivals (iterable): (name, arrival_time, burst_time) tuples sorted by arrival time.
+        time_quantum (int): The fixed time quantum.
+        fast_forward (bool, optional): Skips whole rotations in closed form. Defaults to False.
+
+    Yields:
+        Completion: One event per completed process, in order of completion time.
+    """
+    scheduler = RoundRobinScheduler(time_quantum, fast_forward)
+    feeder = ArrivalFeeder(arrivals, itemgetter(1), lambda item: scheduler.submit(*item), name=itemgetter(0))
+    while True:
+        feeder.feed(scheduler.current_time)
+        completed = scheduler.run_slice()
+        if completed is None:
+            return
+        for process in completed:
+            turnaround = process["completion_time"] - process["arrival_time"]
+            yield Completion(
+                process["name"], process["completion_time"], turnaround, turnaround - process["burst_time"]
+            )
+
+
+def trr_workload(workload, time_quantum, fast_forward=False, out=None, gantt=None, latency=None):
+    """
+    Runs traditional round robin over a columnar Workload without building the whole process list.
+
+    Args:
+        workload (Workload): The columnar workload, possibly attached from shared memory or mapped from a trace file.
+        time_quantum (int): The fixed time quantum.
+        fast_forward (bool, optional): Skips whole rotations in closed form. Defaults to False.
+        out (array | memoryview, optional): Zero-filled int64 column to write the completion times into.
+            Defaults to a new array.
+        gantt (SegmentLog, optional): Receives the schedule, with every process identified by its input index.
+            Nothing is recorded otherwise.
+        latency (LatencySketch, optional): Records the waiting and turnaround time of every process as it completes.
+
+    Returns:
+        array: Completion time of every process in input order, 0 for processes without any work.
+    """
+    scheduler = RoundRobinScheduler(time_quantum, fast_forward, gantt)
+    arrival, burst = workload.arrival, workload.burst
+    completion = array("q", bytes(8 * len(workload))) if out is None else out
+    # Processes are named by their input index
+    feeder = ArrivalFeeder(
+        workload.arrival_order(), arrival.__getitem__, lambda index: scheduler.submit(index, arrival[index], burst[index])
+    )
+    while True:
+        feeder.feed(scheduler.current_time)
+        completed = scheduler.run_slice()
+        if completed is None:
+            return completion
+        for process in completed:
+            completion[process["name"]] = process["completion_time"]
+            if latency is not None:
+                turnaround = process["completion_time"] - process["arrival_time"]
+                latency.record(turnaround, turnaround - process["burst_time"])
@@ -0,0 +1,211 @@
+"""
+Incremental what-if recomputation for capacity planning.
+
+A WhatIf session simulates a workload once and keeps its busy periods as checkpoints. The engines
+carry no state across the idle gap that ends a busy period, so a checkpoint is just a position in
+the schedule. When a process is edited, added or removed, the session resumes from the first busy
+period the change touches and rescans forward until the new periods line up with the old ones
+again; only the periods in between are simulated. A query therefore costs time proportional to
+the busy periods it touches, not to the whole trace.
+"""
+from array import array
+from bisect import bisect_right
+
+from . import columnar
+from . import sweep
+from .busy_periods import busy_periods
+
+
+class WhatIf:
+    """
+    Workload whose schedule is kept up to date as its processes are edited, added and removed.
+    Processes are identified by their index, which stays valid after other processes are removed.
+
+    Attributes:
+        pids (list): Process ID of every process, None once removed.
+        arrival (list): Arrival time of every process, None once removed.
+        burst (list): Burst time of every process, None once removed.
+        finish (list): Finish time of every process, None once removed.
+        simulated (int): Processes simulated by the last change, a measure of its cost.
+    """
+    def __init__(self, processes, algorithm, time_quantum=None, fast_forward=False):
+        if algorithm not in sweep.ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {sweep.ALGORITHMS}, got {algorithm!r}")
+        if algorithm == "trr" and time_quantum is None:
+            raise ValueError("trr needs a time quantum")
+        workload = processes if isinstance(processes, columnar.Workload) else columnar.Workload.from_processes(processes)
+        self.algorithm = algorithm
+        self.time_quantum = time_quantum
+        self.fast_forward = fast_forward
+        self.pids = [pid for pid, _, _ in workload]
+        self.arrival = list(workload.arrival)
+        self.burst = list(workload.burst)
+        self.finish = list(sweep.run_columns(workload, algorithm, time_quantum, fast_forward))
+        self.simulated = len(self.finish)
+        self._count = len(self.finish)
+        self._turnaround = sum(self.finish) - sum(self.arrival)
+        self._burst = sum(self.burst)
+        # Busy periods in time order, as their processes sorted by (arrival, index), and their start times
+        self._members = [sorted(period, key=lambda i: (self.arrival[i], i)) for period in busy_periods(workload)]
+        self._starts = [self.arrival[period[0]] for period in self._members]
+
+    def __len__(self):
+        return self._count
+
+    def averages(self):
+        """
+        Returns:
+            tuple: A tuple containing average turn around time and average waiting time.
+        """
+        if not self._count:
+            return 0.0, 0.0
+        return self._turnaround / self._count, (self._turnaround - self._burst) / self._count
+
+    def busy_periods(self):
+        """Returns the number of busy periods in the current schedule."""
+        return len(self._members)
+
+    def edit(self, index, arrival_time=None, burst_time=None):
+        """
+        Changes the arrival and/or burst time of a process and updates the schedule.
+        Editing it back to its old values restores the old schedule, at the same cost.
+
+        Returns:
+            tuple: The new averages, see `averages`.
+        """
+        self._check(index)
+        arrival_time = self.arrival[index] if arrival_time is None else arrival_time
+        burst_time = self.burst[index] if burst_time is None else burst_time
+        return self._change(index, arrival_time, burst_time)
+
+    def add(self, pid, arrival_time, burst_time):
+        """
+        Adds a process and updates the schedule.
+
+        Returns:
+            int: Index of the new process.
+        """
+        self.pids.append(pid)
+        self.arrival.append(None)
+        self.burst.append(None)
+        self.finish.append(None)
+        index = len(self.pids) - 1
+        self._change(index, arrival_time, burst_time)
+        return index
+
+    def remove(self, index):
+        """
+        Removes a process and updates the schedule.
+
+        Returns:
+            tuple: The new averages, see `averages`.
+        """
+        self._check(index)
+        result = self._change(index, None, None)
+        self.pids[index] = None
+        return result
+
+    def _check(self, index):
+        if not 0 <= index < len(self.pids) or self.arrival[index] is None:
+            raise IndexError(f"no process at index {index}")
+
+    def _change(self, index, arrival_time, burst_time):
+        for value, name in ((arrival_time, "arrival"), (burst_time, "burst")):
+            if value is not None and (isinstance(value, bool) or int(value) != value or value < 0):
+                raise ValueError(f"{name} time must be a non-negative whole number, got {value!r}")
+        removed = arrival_time is None
+
+        # First busy period the change touches: where the process was, or where it will arrive
+        first = len(self._starts)
+        old_period = None
+        if self.arrival[index] is not None:
+            old_period = bisect_right(self._starts, self.arrival[index]) - 1
+            while index not in self._members[old_period]:
+                old_period -= 1  # Equal start times: a zero-burst period precedes the one holding it
+            first = old_period
+        if not removed:
+            first = min(first, max(bisect_right(self._starts, arrival_time) - 1, 0))
+
+        # Take the process out of the totals, then give it its new times
+        if self.arrival[index] is not None:
+            self._count -= 1
+            self._turnaround -= self.finish[index] - self.arrival[index]
+            self._burst -= self.burst[index]
+        self.arrival[index] = arrival_time
+        self.burst[index] = burst_time
+        self.finish[index] = None
+        pending = [] if removed else [(arrival_time, index)]
+
+        # Rescan from the first touched period, merging the changed process in by (arrival, index),
+        # until an old period starts after an idle gap with the change behind it. From there on the
+        # old periods are unchanged.
+        new_periods = []
+        current = []
+        end = None
+
+        def feed(entry):
+            nonlocal current, end
+            arrival, member = entry
+            if end is not None and arrival >= end:
+                new_periods.append(current)
+                current = []
+            if end is None or arrival > end:
+                end = arrival
+            end += self.burst[member]
+            current.append(member)
+
+        stop = first
+        while stop < len(self._members):
+            entries = [(self.arrival[m], m) for m in self._members[stop] if m != index]
+            if entries:
+                if pending and pending[0] < entries[0]:
+                    feed(pending.pop())
+                if (
+                    not pending
+                    and stop > first
+                    and (old_period is None or stop > old_period)
+                    and (end is None or entries[0][0] >= end)
+                ):
+                    break
+                for entry in entries:
+                    if pending and pending[0] < entry:
+                        feed(pending.pop())
+                    feed(entry)
+            stop += 1
+        if pending:
+            feed(pending.pop())
+        if current:
+            new_periods.append(current)
+
+        self._replace(first, stop, new_periods)
+        return self.averages()
+
+    def _replace(self, first, stop, new_periods):
+        # Reuse the schedule of any period that came through the change untouched
+        old = {tuple(members): position for position, members in enumerate(self._members[first:stop], first)}
+        self.simulated = 0
+        for members in new_periods:
+            if tuple(members) in old and all(self.finish[i] is not None for i in members):
+                continue
+            ordered = sorted(members)  # Input order, which the engines break ties by
+            for i in ordered:
+                if self.finish[i] is not None:
+                    self._turnaround -= self.finish[i] - self.arrival[i]
+                    self._burst -= self.burst[i]
+                    self._count -= 1
+            n = len(ordered)
+            period = columnar.Workload(
+                array("q", (self.arrival[i] for i in ordered)),
+                array("q", (self.burst[i] for i in ordered)),
+                range(n),
+                range(n),
+            )
+            times = sweep.run_columns(period, self.algorithm, self.time_quantum, self.fast_forward)
+            for i, finish_time in zip(ordered, times):
+                self.finish[i] = finish_time
+                self._turnaround += finish_time - self.arrival[i]
+                self._burst += self.burst[i]
+                self._count += 1
+            self.simulated += len(ordered)
+        self._members[first:stop] = new_periods
+        self._starts[first:stop] = [self.arrival[members[0]] for members in new_periods]
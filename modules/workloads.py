@@ -0,0 +1,163 @@
+"""
+Seeded synthetic workloads for benchmarks, sweeps and stress tests.
+
+Usage: python -m modules.workloads --count 100 --processes 1000 --bursts pareto > workloads.jsonl
+
+Every trace is generated with vectorized NumPy draws, so millions of processes take well under a
+second. The same seed and parameters always give the same trace. Burst and arrival times come from
+independent streams, so changing the arrival model never changes the bursts and vice versa.
+"""
+import argparse
+import json
+
+import numpy as np
+
+# Largest burst or arrival time generated, keeping heavy tails far from int64 overflow
+MAX_TIME = 2**53
+
+
+def exponential_bursts(rng, n, mean=10.0):
+    """Burst times with an exponential distribution, rounded up to whole time units."""
+    return _to_times(rng.exponential(mean, n))
+
+
+def pareto_bursts(rng, n, shape=1.5, minimum=1.0):
+    """
+    Heavy-tailed burst times with a Pareto distribution: most processes are short,
+    a few are orders of magnitude longer. Shapes at or below 1 have an unbounded mean.
+    """
+    return _to_times((rng.pareto(shape, n) + 1.0) * minimum)
+
+
+def bimodal_bursts(rng, n, short_mean=4.0, long_mean=100.0, long_fraction=0.1):
+    """
+    Burst times from a mix of interactive and batch processes, each exponentially distributed.
+    A `long_fraction` share of the processes is drawn around `long_mean`, the rest around `short_mean`.
+    """
+    means = np.where(rng.random(n) < long_fraction, long_mean, short_mean)
+    return _to_times(rng.exponential(means))
+
+
+def uniform_bursts(rng, n, low=1, high=30):
+    """Burst times drawn uniformly from `low` to `high` inclusive, like the hand-written test cases."""
+    return rng.integers(low, high + 1, n, dtype=np.int64)
+
+
+def poisson_arrivals(rng, n, mean_interarrival=5.0):
+    """
+    Arrival times of a Poisson process: exponential gaps with the given mean, first arrival at 0.
+    For bursts with mean B, the CPU load is about B / mean_interarrival.
+    """
+    gaps = rng.exponential(mean_interarrival, n)
+    gaps[0] = 0.0
+    return np.minimum(np.floor(np.cumsum(gaps)), MAX_TIME).astype(np.int64)
+
+
+def batch_arrivals(rng, n):
+    """Every process arrives at time 0."""
+    return np.zeros(n, dtype=np.int64)
+
+
+def uniform_arrivals(rng, n, span=100):
+    """Arrival times drawn uniformly from 0 to `span` inclusive, sorted."""
+    return np.sort(rng.integers(0, span + 1, n, dtype=np.int64))
+
+
+BURSTS = {
+    "exponential": exponential_bursts,
+    "pareto": pareto_bursts,
+    "bimodal": bimodal_bursts,
+    "uniform": uniform_bursts,
+}
+ARRIVALS = {
+    "poisson": poisson_arrivals,
+    "batch": batch_arrivals,
+    "uniform": uniform_arrivals,
+}
+
+
+def _to_times(values):
+    # Whole time units of at least 1, so every generated process has work
+    return np.clip(np.ceil(values), 1, MAX_TIME).astype(np.int64)
+
+
+def generate(n, bursts="exponential", arrivals="poisson", seed=0, burst_params=None, arrival_params=None):
+    """
+    Generates one trace as columns.
+
+    Args:
+        n (int): Number of processes.
+        bursts (str, optional): One of BURSTS. Defaults to "exponential".
+        arrivals (str, optional): One of ARRIVALS. Defaults to "poisson".
+        seed (int, optional): Seed of the trace. Defaults to 0.
+        burst_params (dict, optional): Keyword arguments of the burst model. Defaults to its defaults.
+        arrival_params (dict, optional): Keyword arguments of the arrival model. Defaults to its defaults.
+
+    Returns:
+        tuple: (arrival, burst) int64 arrays, sorted by arrival time.
+    """
+    if bursts not in BURSTS:
+        raise ValueError(f"bursts must be one of {tuple(BURSTS)}, got {bursts!r}")
+    if arrivals not in ARRIVALS:
+        raise ValueError(f"arrivals must be one of {tuple(ARRIVALS)}, got {arrivals!r}")
+    burst_rng, arrival_rng = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(2))
+    burst = BURSTS[bursts](burst_rng, n, **(burst_params or {}))
+    arrival = ARRIVALS[arrivals](arrival_rng, n, **(arrival_params or {}))
+    return arrival, burst
+
+
+def generate_many(count, n, seed=0, **kwargs):
+    """
+    Yields `count` independent traces of `n` processes, lazily. Trace i is `generate(n, seed=[seed, i])`,
+    so any single trace can be regenerated on its own.
+    """
+    for index in range(count):
+        yield generate(n, seed=[seed, index], **kwargs)
+
+
+def to_tuples(arrival, burst):
+    """Converts columns into (pid, arrival_time, burst_time) tuples, with the process index as pid."""
+    return list(zip(range(len(arrival)), arrival.tolist(), burst.tolist()))
+
+
+def to_processes(arrival, burst, process_class):
+    """
+    Converts columns into Process objects.
+
+    Args:
+        arrival (np.ndarray): Arrival times.
+        burst (np.ndarray): Burst times.
+        process_class (type): Process class of the target engine, such as isrr_module.Process.
+
+    Returns:
+        list[Process]: One process per row, with the row index as pid.
+    """
+    return [process_class(*args) for args in to_tuples(arrival, burst)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write seeded synthetic workloads as JSON Lines.")
+    parser.add_argument("--count", type=int, default=1, help="Number of workloads.")
+    parser.add_argument("--processes", type=int, default=100, help="Processes per workload.")
+    parser.add_argument("--bursts", choices=BURSTS, default="exponential")
+    parser.add_argument("--arrivals", choices=ARRIVALS, default="poisson")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--burst-params", type=json.loads, default=None, help='JSON object, e.g. \'{"shape": 1.2}\'')
+    parser.add_argument("--arrival-params", type=json.loads, default=None, help="JSON object of arrival parameters.")
+    args = parser.parse_args(argv)
+
+    traces = generate_many(
+        args.count,
+        args.processes,
+        args.seed,
+        bursts=args.bursts,
+        arrivals=args.arrivals,
+        burst_params=args.burst_params,
+        arrival_params=args.arrival_params,
+    )
+    for arrival, burst in traces:
+        print(json.dumps([[pid, a, b] for pid, a, b in to_tuples(arrival, burst)]))
+
+
+if __name__ == "__main__":
+    main()
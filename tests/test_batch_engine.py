@@ -0,0 +1,51 @@
+import sys
+import random
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from modules import batch_engine as be
+from modules import isrr_module as im
+from modules import srr_module as sm
+
+# Research paper cases as (arrival_time, burst_time) pairs
+research_cases = [
+    [(0, 12), (0, 34), (0, 8), (0, 19)],
+    [(0, 2), (0, 5), (0, 6), (0, 3), (0, 9)],
+    [(0, 26), (0, 67), (0, 82), (0, 11)],
+    [(0, 8), (2, 6), (7, 11), (0, 5)],
+]
+
+
+@pytest.mark.parametrize(
+    "algorithm, expected",
+    [
+        ("isrr", [(35.00, 16.75), (11.60, 6.60), (84.50, 38.00), (14.50, 7.00)]),
+        ("srr", [(37.25, 19), (13.2, 8.2), (98, 51.5), (15.75, 8.25)]),
+    ],
+)
+def test_research_paper_cases(algorithm, expected):
+    atat, awt = be.smart_round_robin_batch(*be.pad_workloads(research_cases), algorithm=algorithm)
+    assert list(zip(np.round(atat, 2), np.round(awt, 2))) == expected
+
+
+# Every workload must match the scalar engine exactly, padding and idle gaps included
+@pytest.mark.parametrize("algorithm, module", [("isrr", im), ("srr", sm)])
+def test_matches_scalar_engine(algorithm, module):
+    rng = random.Random(3)
+    workloads = [
+        [(rng.randint(0, 40), rng.randint(1, 60)) for _ in range(rng.randint(1, 9))]
+        for _ in range(300)
+    ]
+    arrival, burst, mask = be.pad_workloads(workloads)
+    finish = be.simulate_batch(arrival, burst, mask, algorithm)
+    atat, awt = be.smart_round_robin_batch(arrival, burst, mask, algorithm)
+    for w, workload in enumerate(workloads):
+        processes = [module.Process(f"P{i}", *pair) for i, pair in enumerate(workload)]
+        assert module.smart_round_robin(processes, trace="off") == (atat[w], awt[w])
+        assert finish[w, : len(workload)].tolist() == [p.finish_time for p in processes]
@@ -0,0 +1,115 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import random
+from concurrent.futures import Future
+
+import pytest
+from modules import busy_periods as bp
+from modules import columnar
+from modules import sweep
+
+
+def random_case(seed, n=40):
+    rng = random.Random(seed)
+    # Unsorted arrivals with ties, idle gaps and processes without work
+    return [(f"P{i}", rng.randint(0, 150), rng.randint(0, 8)) for i in range(n)]
+
+
+def test_periods_split_at_idle_gaps():
+    workload = columnar.Workload.from_processes([("P0", 0, 3), ("P2", 5, 2), ("P1", 1, 1), ("P3", 7, 1), ("P4", 9, 0)])
+    # P1 arrives while P0 runs; P3 arrives exactly when P2's period ends
+    assert bp.busy_periods(workload) == [[0, 2], [1], [3], [4]]
+
+
+class DeferredPool:
+    """
+    Runs the chunks in this process, so tests exercise splitting and stitching quickly. Submitted
+    chunks only run when the caller waits, oldest first, which exposes how many are in flight.
+    """
+    most_in_flight = 0
+
+    def __init__(self, workers):
+        self.pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, function, *args):
+        future = Future()
+        self.pending.append((future, function, args))
+        DeferredPool.most_in_flight = max(DeferredPool.most_in_flight, len(self.pending))
+        return future
+
+    def wait(self, futures, return_when):
+        future, function, args = self.pending.pop(0)
+        future.set_result(function(*args))
+        return {future}, set()
+
+
+@pytest.fixture
+def deferred_pool(monkeypatch):
+    pools = []
+
+    def make(workers):
+        pools.append(DeferredPool(workers))
+        return pools[-1]
+
+    monkeypatch.setattr(bp, "ProcessPoolExecutor", make)
+    monkeypatch.setattr(bp, "wait", lambda futures, return_when: pools[-1].wait(futures, return_when))
+    DeferredPool.most_in_flight = 0
+    return DeferredPool
+
+
+def test_bounds_are_offsets_into_arrival_order():
+    workload = columnar.Workload.from_processes([("P0", 0, 3), ("P2", 5, 2), ("P1", 1, 1), ("P3", 7, 1), ("P4", 9, 0)])
+    assert list(bp.busy_period_bounds(workload)) == [(0, 2), (2, 3), (3, 4), (4, 5)]
+    assert list(bp.busy_period_bounds(columnar.Workload.from_processes([]))) == []
+
+
+@pytest.mark.parametrize("algorithm, time_quantum", [("isrr", None), ("srr", None), ("trr", 3)])
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_chunks_match_a_whole_run(algorithm, time_quantum, fast_forward, deferred_pool):
+    for seed in range(30):
+        workload = columnar.Workload.from_processes(random_case(seed))
+        expected = sweep.run_columns(workload, algorithm, time_quantum, fast_forward)
+        for chunk_size in (1, 7):
+            finish = bp.run_parallel(workload, algorithm, time_quantum, fast_forward, max_workers=4, chunk_size=chunk_size)
+            assert finish == expected
+
+
+def test_chunks_are_cut_lazily(deferred_pool):
+    # Every process is its own busy period, so there are 1000 chunks, but only a few at a time are
+    # cut and submitted
+    workload = columnar.Workload.from_processes([(f"P{i}", 10 * i, 3) for i in range(1000)])
+    finish = bp.run_parallel(workload, "srr", max_workers=2, chunk_size=1)
+    assert list(finish) == [10 * i + 3 for i in range(1000)]
+    assert deferred_pool.most_in_flight == 4 * 2
+
+
+def test_pool_run():
+    workload = columnar.Workload.from_processes(random_case(1, n=200))
+    assert bp.run_parallel(workload, "srr", max_workers=2, chunk_size=20) == sweep.run_columns(workload, "srr", None, False)
+    with pytest.raises(ValueError):
+        bp.run_parallel(workload, "trr", max_workers=2)
+
+
+def test_sketches_from_the_pool():
+    workload = columnar.Workload.from_processes(random_case(2, n=300))
+    whole = bp.latency_parallel(workload, "trr", 4, max_workers=1)
+    pooled = bp.latency_parallel(workload, "trr", 4, max_workers=2, chunk_size=30)
+    assert pooled.summary() == whole.summary()
+    assert len(pooled) == sum(1 for burst in workload.burst if burst > 0)
+
+
+def test_sketch_chunks_are_cut_lazily(deferred_pool):
+    workload = columnar.Workload.from_processes([(f"P{i}", 10 * i, i % 7 + 1) for i in range(1000)])
+    latency = bp.latency_parallel(workload, "isrr", max_workers=2, chunk_size=1)
+    assert len(latency) == 1000 and latency.waiting.max == 0
+    assert deferred_pool.most_in_flight == 4 * 2
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+import subprocess
+
+import pytest
+from modules import __main__ as cli_main
+from modules.ingest import TraceError
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Slow to import, and never needed to start the CLI. Checked by name rather than by timing the
+# start, which would flake on a loaded machine
+HEAVY_MODULES = ("numpy", "matplotlib", "multiprocessing")
+ENGINE_MODULES = ("modules.smart_engine", "modules.isrr_module", "modules.srr_module", "modules.trr_module")
+
+
+def cli(*args, **kwargs):
+    return subprocess.run(
+        [sys.executable, "-m", "modules", *args], cwd=ROOT, capture_output=True, text=True, **kwargs
+    )
+
+
+def imported_modules(*args):
+    # Every module a CLI invocation imports, as reported by -X importtime
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "modules", *args], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stderr
+    return {line.split("|")[-1].strip() for line in stderr.splitlines() if line.startswith("import time:")}
+
+
+def test_run_paper_cases():
+    result = cli("run", "--algorithm", "srr", check=True)
+    assert result.stdout.splitlines()[0] == "Case 1: ATAT = 37.25, AWT = 19.00"
+    result = cli("run", "--algorithm", "trr", "--gantt", check=True)
+    assert result.stdout.splitlines()[:2] == [
+        "Case 1: ATAT = 51.00, AWT = 32.75",
+        "|0 P0 6|6 P1 12|12 P2 18|18 P3 24|24 P0 30|30 P1 36|36 P2 38|38 P3 44|44 P1 50|50 P3 56|56 P1 62|62 P3 63|63 P1 73|",
+    ]
+
+
+def test_run_streams_a_log(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("pid,arrival,burst\nP0,0,8\nP3,0,5\nP1,2,6\nP2,7,11\n")
+    assert cli("run", str(path), check=True).stdout == f"{path}: ATAT = 14.50, AWT = 7.00\n"
+    tail = cli("run", str(path), "--tail", check=True).stdout.splitlines()[1]
+    assert tail == "  TAT p50/p95/p99 = 13.07/16.95/16.95, WT p50/p95/p99 = 5.00/10.91/10.91"
+    assert "trr needs --quantum" in cli("run", str(path), "--algorithm", "trr").stderr
+    assert "--quantum must be positive" in cli("run", str(path), "--algorithm", "trr", "--quantum", "0").stderr
+    bad = tmp_path / "bad.csv"
+    bad.write_text("pid,arrival,burst\nP0,0,x\n")
+    malformed = cli("run", str(bad))
+    assert malformed.returncode == 1 and malformed.stderr == f"error: {bad}:2: burst must be a whole number, got 'x'\n"
+    missing = cli("run", str(tmp_path / "missing.csv"))
+    assert missing.returncode == 1 and missing.stderr.startswith("error:")
+
+
+def test_tail_of_a_log_without_work(tmp_path):
+    path = tmp_path / "idle.csv"
+    path.write_text("pid,arrival,burst\nP0,0,0\n")
+    # Nothing was sketched, so there is no tail to print
+    assert cli("run", str(path), "--gantt", "--tail", check=True).stdout == f"{path}: ATAT = 0.00, AWT = 0.00\n|\n"
+
+
+def test_commands_are_dispatched():
+    workload = json.dumps([["P0", 0, 3], ["P1", 1, 4]])
+    result = cli("sweep", "-", "--algorithms", "isrr", input=workload + "\n", check=True)
+    assert json.loads(result.stdout)["algorithm"] == "isrr"
+    assert "usage: python -m modules plot" in cli("plot", "--help", check=True).stdout
+    assert cli("nope").returncode == 2
+
+
+@pytest.mark.parametrize("args, engines", [(("--help",), False), (("run",), True)])
+def test_startup_imports(args, engines):
+    imported = imported_modules(*args)
+    assert not [name for name in imported if name.split(".")[0] in HEAVY_MODULES]
+    # The engines load only once a command runs
+    assert any(name in imported for name in ENGINE_MODULES) == engines
+
+
+def test_only_input_errors_are_reported_as_usage_errors(monkeypatch):
+    def fail(error):
+        def command(argv):
+            raise error
+        return command
+
+    monkeypatch.setitem(cli_main.COMMANDS, "run", (fail(TraceError("jobs.csv:3: missing burst")), ""))
+    with pytest.raises(SystemExit, match="error: jobs.csv:3: missing burst"):
+        cli_main.main(["run"])
+    monkeypatch.setitem(cli_main.COMMANDS, "run", (fail(ValueError("a bug")), ""))
+    with pytest.raises(ValueError, match="a bug"):
+        cli_main.main(["run"])
@@ -0,0 +1,173 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pickle
+import random
+
+import pytest
+from modules import columnar
+from modules import isrr_module as im
+from modules import srr_module as sm
+from modules import sweep
+from modules import trr_module as tm
+
+
+def random_case(seed, n=40):
+    rng = random.Random(seed)
+    # Unsorted arrivals, repeated pids and processes without work
+    return [(f"P{rng.randint(0, n // 2)}", rng.randint(0, 100), rng.randint(0, 25)) for _ in range(n)]
+
+
+def test_from_processes_round_trip():
+    case = random_case(1)
+    workload = columnar.Workload.from_processes(case)
+    assert len(workload) == len(case)
+    assert list(workload) == case
+    assert len(workload.pids) == len(set(pid for pid, _, _ in case))
+    assert list(columnar.Workload.from_processes(im.Process(*args) for args in case)) == case
+
+
+def test_publish_and_attach():
+    case = random_case(2)
+    with columnar.Workload.from_processes(case).publish() as shared:
+        attached = shared.attach()
+        assert list(attached) == case
+        with pytest.raises(TypeError):
+            attached.arrival[0] = 1  # Attached columns are read-only
+        attached.close()
+
+
+@pytest.mark.parametrize("module, run", [(im, im.isrr_workload), (sm, sm.srr_workload)])
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_smart_workload_matches_batch(module, run, fast_forward):
+    for seed in range(20):
+        case = random_case(seed)
+        processes = [module.Process(*args) for args in case]
+        expected = module.smart_round_robin(processes, fast_forward=fast_forward, trace="off")
+        workload = columnar.Workload.from_processes(case)
+        finish = run(workload, fast_forward)
+        assert list(finish) == [p.finish_time for p in processes]
+        assert workload.averages(finish) == expected
+
+
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_trr_workload_matches_execute(fast_forward):
+    for seed in range(20):
+        case = random_case(seed)
+        scheduler = tm.RoundRobinScheduler(time_quantum=3)
+        scheduler.add_processes(case)
+        scheduler.execute(fast_forward=fast_forward)
+        workload = columnar.Workload.from_processes(case)
+        finish = tm.trr_workload(workload, 3, fast_forward)
+        # execute orders its processes by arrival time, keeping input order among ties
+        order = sorted(range(len(case)), key=lambda i: case[i][1])
+        assert [finish[i] for i in order] == [p["completion_time"] for p in scheduler.processes]
+        assert workload.averages(finish) == scheduler.calculate_averages()
+
+
+def test_sweep_over_shared_workloads():
+    cases = [[(pid, arrival, burst + 1) for pid, arrival, burst in random_case(seed)] for seed in range(4)]
+    expected = list(sweep.sweep(cases, time_quanta=(4,), max_workers=1))
+    shared = [columnar.Workload.from_processes(case).publish() for case in cases]
+    try:
+        assert list(sweep.sweep(shared, time_quanta=(4,), max_workers=2, chunksize=2)) == expected
+        # Inline runs attach per task and keep nothing mapped in this process
+        assert list(sweep.sweep(shared, time_quanta=(4,), max_workers=1)) == expected
+        assert sweep._attached is None
+    finally:
+        for handle in shared:
+            handle.unlink()
+
+
+def test_trace_file_round_trip(tmp_path):
+    case = random_case(5)
+    columnar.Workload.from_processes(case).save(tmp_path / "case.trace")
+    mapped = columnar.Workload.open(tmp_path / "case.trace")
+    assert list(mapped) == case
+    with pytest.raises(TypeError):
+        mapped.burst[0] = 1  # Mapped columns are read-only
+    mapped.close()
+
+    (tmp_path / "other").write_bytes(b"not a trace at all")
+    with pytest.raises(ValueError):
+        columnar.Workload.open(tmp_path / "other")
+
+
+def test_trace_file_stores_pids_and_arrival_order(tmp_path):
+    case = random_case(7)
+    workload = columnar.Workload.from_processes(case)
+    workload.save(tmp_path / "case.trace")
+    mapped = columnar.Workload.open(tmp_path / "case.trace")
+    # Pids are decoded on lookup and the arrival order is read from the file, not sorted again
+    assert isinstance(mapped.pids, columnar.PidTable)
+    assert list(mapped.pids) == workload.pids and mapped.pids[-1] == workload.pids[-1]
+    assert isinstance(mapped.arrival_order(), memoryview)
+    assert list(mapped.arrival_order()) == workload.arrival_order()
+    # A mapped workload saves again without decoding anything
+    mapped.save(tmp_path / "copy.trace")
+    mapped.close()
+    copy = columnar.Workload.open(tmp_path / "copy.trace")
+    assert list(copy) == case
+    copy.close()
+
+    columnar.Workload.from_processes(sorted(case, key=lambda c: c[1])).save(tmp_path / "sorted.trace")
+    mapped = columnar.Workload.open(tmp_path / "sorted.trace")
+    assert mapped.arrival_order() == range(len(case))
+    mapped.close()
+
+
+def test_trace_file_rejects_foreign_byte_order(tmp_path):
+    columnar.Workload.from_processes(random_case(8)).save(tmp_path / "case.trace")
+    image = bytearray((tmp_path / "case.trace").read_bytes())
+    start = len(columnar.TRACE_MAGIC)
+    image[start : start + 8] = image[start : start + 8][::-1]
+    (tmp_path / "swapped.trace").write_bytes(image)
+    with pytest.raises(ValueError, match="byte order"):
+        columnar.Workload.open(tmp_path / "swapped.trace")
+
+
+def test_mapped_workloads_pickle(tmp_path):
+    cases = [random_case(seed) for seed in range(3)]
+    for i, case in enumerate(cases):
+        columnar.Workload.from_processes(case).save(tmp_path / f"{i}.trace")
+    mapped = [columnar.Workload.open(tmp_path / f"{i}.trace") for i in range(3)]
+    copy = pickle.loads(pickle.dumps(mapped[0]))
+    assert list(copy) == cases[0] and copy._path == mapped[0]._path
+    copy.close()
+    expected = list(sweep.sweep(cases, ("isrr",), max_workers=1))
+    assert list(sweep.sweep(mapped, ("isrr",), max_workers=2, chunksize=1)) == expected
+    for workload in mapped:
+        workload.close()
+
+    with columnar.Workload.from_processes(cases[0]).publish() as shared:
+        attached = shared.attach()
+        with pytest.raises(TypeError, match="SharedWorkload"):
+            pickle.dumps(attached)
+        attached.close()
+
+
+def test_run_trace_writes_result_columns(tmp_path):
+    case = random_case(6)
+    columnar.Workload.from_processes(case).save(tmp_path / "case.trace")
+    averages = sweep.run_trace(tmp_path / "case.trace", tmp_path / "case.results", time_quantum=3)
+
+    workload = columnar.Workload.from_processes(case)
+    with columnar.ResultColumns.open(tmp_path / "case.results") as results:
+        assert results.names == sweep.ALGORITHMS and len(results) == len(case)
+        assert list(results["isrr"]) == list(im.isrr_workload(workload))
+        assert list(results["srr"]) == list(sm.srr_workload(workload))
+        assert list(results["trr"]) == list(tm.trr_workload(workload, 3))
+    for algorithm in sweep.ALGORITHMS:
+        assert averages[algorithm] == sweep.run_workload(case, algorithm, 3)
+
+
+def test_result_column_names(tmp_path):
+    with pytest.raises(ValueError):
+        columnar.ResultColumns.create(tmp_path / "bad", 3, ("finish", "finish"))
+    with columnar.ResultColumns.create(tmp_path / "good", 3, ("a", "b")) as results:
+        results["b"][2] = 7
+    with columnar.ResultColumns.open(tmp_path / "good") as results:
+        assert (list(results["a"]), list(results["b"])) == ([0, 0, 0], [0, 0, 7])
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+from modules import srr_module as sm
+from modules import trr_module as tm
+from modules.gantt import IDLE, SegmentLog
+
+
+def test_render_coalesces_adjacent_segments():
+    log = SegmentLog()
+    log.append_idle(0, 1)
+    log.append(1, 3, "P0")
+    log.append(3, 5, "P0")
+    log.append(5, 6, "P1")
+    log.append(6, 8, "P0")
+    assert log.render() == "|0 IDLE 1|1 P0 5|5 P1 6|6 P0 8|"
+    assert len(log.starts) == 4
+
+
+def test_cycles_expand_lazily():
+    log = SegmentLog()
+    log.append(0, 2, "P1")
+    log.append_cycle(2, ["P1", "P2"], 3, 2)
+    log.append(14, 15, "P2")
+    assert log.render() == "|0 P1 5|5 P2 8|8 P1 11|11 P2 15|"
+    assert len(log.starts) == 2  # The cycle itself is never stored segment by segment
+
+
+def test_fast_forward_charts_match():
+    case = [("P0", 0, 900), ("P1", 0, 950), ("P2", 40, 1200), ("P3", 3000, 7)]
+    charts = []
+    for fast_forward in (False, True):
+        smart = SegmentLog()
+        sm.smart_round_robin([sm.Process(*args) for args in case], fast_forward=fast_forward, gantt=smart)
+        trr = SegmentLog()
+        scheduler = tm.RoundRobinScheduler(time_quantum=4)
+        scheduler.add_processes(case)
+        scheduler.execute(fast_forward=fast_forward, gantt=trr)
+        charts.append((smart.render(), trr.render()))
+    assert charts[0] == charts[1]
+
+
+def test_to_numpy_matches_segments():
+    np = pytest.importorskip("numpy")
+    log = SegmentLog()
+    scheduler = tm.RoundRobinScheduler(time_quantum=2)
+    scheduler.add_processes([("P0", 0, 80), ("P1", 2, 60), ("P2", 300, 5)])
+    scheduler.execute(fast_forward=True, gantt=log)
+    assert log.cycles
+
+    starts, ends, pid_indices = log.to_numpy()
+    expected = list(log.segments())
+    assert starts.tolist() == [s for s, _, _ in expected]
+    assert ends.tolist() == [e for _, e, _ in expected]
+    assert [None if i == IDLE else log.pids[i] for i in pid_indices] == [p for _, _, p in expected]
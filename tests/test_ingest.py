@@ -0,0 +1,100 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+import random
+import subprocess
+
+import pytest
+from modules import ingest
+from modules import isrr_module as im
+
+ROOT = Path(__file__).resolve().parents[1]
+
+case = [("P0", 0, 8), ("P1", 2, 6), ("P2", 7, 11), ("P3", 0, 5)]
+in_order = sorted(case, key=lambda row: row[1])
+
+
+def write_csv(path, rows, header="pid,arrival_time,burst_time"):
+    lines = [header] if header else []
+    path.write_text("\n".join(lines + [",".join(map(str, row)) for row in rows]) + "\n")
+    return path
+
+
+def test_csv_with_and_without_header(tmp_path):
+    assert list(ingest.read_trace(write_csv(tmp_path / "a.csv", in_order))) == in_order
+    assert list(ingest.read_trace(write_csv(tmp_path / "b.csv", in_order, header=None))) == in_order
+    # Columns are found by name, in any order
+    reordered = write_csv(tmp_path / "c.csv", [(b, a, p) for p, a, b in in_order], header="BT, at, name")
+    assert list(ingest.read_trace(reordered)) == in_order
+
+
+def test_json_lines(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text(
+        "\n".join(json.dumps({"pid": p, "arrival": a, "burst_time": b}) for p, a, b in in_order[:2])
+        + "\n\n"
+        + "\n".join(json.dumps([p, a, b]) for p, a, b in in_order[2:])
+        + "\n"
+    )
+    assert list(ingest.read_trace(path)) == in_order
+
+
+@pytest.mark.parametrize("row, message", [
+    ("P0,x,3", "arrival must be a whole number"),
+    ("P0,1,-3", "burst can not be negative"),
+    ("P0,1", "expected pid, arrival and burst"),
+])
+def test_invalid_rows_name_the_line(tmp_path, row, message):
+    path = tmp_path / "bad.csv"
+    path.write_text(f"pid,arrival,burst\nP9,0,1\n{row}\n")
+    with pytest.raises(ValueError, match=f"bad.csv:3: {message}"):
+        list(ingest.read_trace(path))
+
+
+def test_reorder_window():
+    rng = random.Random(3)
+    rows = [(f"P{i}", i // 2, 1) for i in range(200)]  # Arrival times are shared by pairs of rows
+    # Displace rows by at most 5 positions
+    shuffled = []
+    for start in range(0, len(rows), 6):
+        block = rows[start : start + 6]
+        rng.shuffle(block)
+        shuffled += block
+    stats = ingest.IngestStats()
+    # Equal arrivals keep their order in the log
+    assert list(ingest.reorder(shuffled, window=5, stats=stats)) == sorted(shuffled, key=lambda row: row[1])
+    assert stats.reordered > 0 and stats.max_buffered == 5
+    with pytest.raises(ValueError):
+        list(ingest.reorder(shuffled, window=0))
+
+
+def test_chunks_are_pulled_lazily(tmp_path):
+    path = write_csv(tmp_path / "log.csv", [(f"P{i}", i, 1) for i in range(100)])
+    stats = ingest.IngestStats()
+    rows = ingest.read_trace(path, chunk_size=10, stats=stats)
+    assert next(rows) == ("P0", 0, 1)
+    assert (stats.rows, stats.chunks) == (10, 1)
+    assert len(list(rows)) == 99 and stats.chunks == 10 and stats.rows_per_second > 0
+
+
+def test_feeds_the_stream_schedulers(tmp_path):
+    path = write_csv(tmp_path / "log.csv", case)
+    processes = [im.Process(*row) for row in case]
+    expected = im.smart_round_robin(processes, trace="off")
+    events = list(im.isrr_stream(ingest.read_trace(path, window=4)))
+    assert sum(e.turnaround for e in events) / len(events) == expected[0]
+    assert sum(e.waiting for e in events) / len(events) == expected[1]
+
+
+def test_isrr_script_replays_a_log(tmp_path):
+    path = write_csv(tmp_path / "log.csv", case)
+    result = subprocess.run(
+        [sys.executable, "isrr.py", "--trace", str(path), "--reorder-window", "4"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    assert "Average Turnaround Time (ATAT) = 14.50" in result.stdout
+    assert "Ingested 4 rows" in result.stdout
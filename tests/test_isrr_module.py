@@ -4,6 +4,8 @@ from pathlib import Path
 # Add the project root to sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import random
+
 import pytest
 from modules import isrr_module as im
 
@@ -64,3 +66,35 @@ def test_research_paper_cases(case_data):
     assert (
         round(atat, 2) == expected_atat and round(awt, 2) == expected_awt
     ), f"Failed for processes: {[p.pid for p in processes]}"
+
+
+# Arrivals out of input order and idle gaps between processes
+@pytest.mark.parametrize(
+    "case, expected_finish",
+    [
+        (
+            [("P1", 5, 5), ("P2", 4, 6), ("P3", 3, 7), ("P4", 1, 9), ("P5", 2, 2), ("P6", 6, 3)],
+            [20, 26, 33, 10, 12, 15],
+        ),
+        ([("P1", 1, 4), ("P2", 10, 5), ("P3", 20, 3)], [5, 15, 23]),
+    ],
+)
+def test_unsorted_arrivals_and_idle_gaps(case, expected_finish):
+    processes = [im.Process(*args) for args in case]
+    im.smart_round_robin(processes)
+    assert [p.finish_time for p in processes] == expected_finish
+
+
+# The incremental calculator must agree with the reference list-based computation
+def test_incremental_calculator_matches_reference():
+    rng = random.Random(7)
+    for _ in range(500):
+        ready = sorted(
+            (im.Process(f"P{i}", 0, rng.randint(1, 1000)) for i in range(rng.randint(1, 20))),
+            key=lambda p: p.remaining_time,
+        )
+        calculator = im.StqDeltaCalculator()
+        for p in ready:
+            calculator.admit(p.remaining_time)
+        quantum = calculator.quantum(ready[0].remaining_time, ready[-1].remaining_time)
+        assert quantum == im.calculate_stq_delta(ready)
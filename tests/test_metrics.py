@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from modules import columnar
+from modules import isrr_module as im
+from modules import metrics
+from modules import runs
+from modules.cases import PAPER_CASES
+
+
+def test_paper_case_metrics():
+    processes, quantum = PAPER_CASES[0]
+    result = metrics.from_run(runs.simulate(columnar.Workload.from_processes(processes), "trr", quantum))
+    assert result.turnaround.tolist() == [30, 73, 38, 63]
+    assert result.waiting.tolist() == [18, 39, 30, 44]
+    assert result.response.tolist() == [0, 6, 12, 18]
+    assert result.slowdown.tolist() == [30 / 12, 73 / 34, 38 / 8, 63 / 19]
+    assert result.averages() == (51.0, 32.75)
+    assert result.context_switches() == 12
+
+
+def test_averages_match_the_engines():
+    rng = random.Random(7)
+    case = [(f"P{i}", rng.randint(0, 60), rng.randint(0, 9)) for i in range(200)]
+    expected = im.smart_round_robin([im.Process(*args) for args in case], trace="off")
+    run = runs.simulate(case, "isrr")
+    result = metrics.from_run(run)
+    assert result.averages() == pytest.approx(expected)
+    assert result.averages() == run.averages()
+    assert result.context_switches() == run.context_switches()
+    # Processes without work have no response time or slowdown
+    idle = [i for i, (_, _, burst) in enumerate(case) if burst == 0]
+    assert idle and np.isnan(result.response[idle]).all() and np.isnan(result.slowdown[idle]).all()
+    assert not np.isnan(np.delete(result.response, idle)).any()
+
+
+def test_summaries():
+    summary = metrics.summarize(np.array([4, 1, 3, 2, np.nan]), percentiles=(50, 100))
+    assert summary == {"count": 4, "mean": 2.5, "min": 1.0, "p50": 2.5, "p100": 4.0, "max": 4.0}
+    assert metrics.summarize(np.array([np.nan])) == {"count": 0}
+
+    result = metrics.compute([0, 2], [3, 3], [3, 6])
+    summaries = result.summary()
+    assert set(summaries) == {"turnaround", "waiting", "response", "slowdown"}
+    assert summaries["response"] == {"count": 0}
+    assert summaries["waiting"]["max"] == 1 and result.context_switches() is None
+
+
+def test_empty_run():
+    result = metrics.from_run(runs.simulate([], "srr"))
+    assert len(result) == 0 and result.averages() == (0.0, 0.0) and result.context_switches() == 0
+    assert result.summary()["turnaround"] == {"count": 0}
@@ -0,0 +1,140 @@
+"""
+Performance regression gate for the three engines.
+
+Each engine runs a fixed seeded workload. Its wall time is divided by the time of a fixed
+calibration loop on the same machine, which makes the numbers comparable across machines, and
+its tracemalloc peak is recorded as is. Both are compared against tests/performance_baseline.json
+within tolerance bands. Separately, growing the workload eightfold must not grow the time
+anywhere near the 64x a quadratic algorithm would take.
+
+To refresh the baseline after an intended change, run:
+    PERF_UPDATE_BASELINE=1 python -m pytest tests/test_performance.py
+"""
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+import os
+import random
+import time
+import tracemalloc
+
+import pytest
+from modules import isrr_module as im
+from modules import srr_module as sm
+from modules import trr_module as tm
+
+BASELINE_PATH = Path(__file__).with_name("performance_baseline.json")
+UPDATE_BASELINE = os.environ.get("PERF_UPDATE_BASELINE") == "1"
+
+# A run may take this many times its baseline relative time, which absorbs noisy machines
+TIME_TOLERANCE = 2.5
+# Allocation patterns are deterministic, so memory gets a much tighter band
+MEMORY_TOLERANCE = 1.25
+# Bound on time(8n) / time(n): linear is about 8, n log n about 10, quadratic 64
+SCALING_LIMIT = 20
+
+SIZE = 10_000
+
+
+def make_case(n, seed=0, mean_burst=10, load=1.5):
+    # Poisson arrivals with exponential bursts. The CPU is overloaded, so the ready set grows with n
+    # and anything quadratic in its size shows up
+    rng = random.Random(seed)
+    time_ = 0.0
+    case = []
+    for i in range(n):
+        case.append((f"P{i}", int(time_), 1 + int(rng.expovariate(1 / mean_burst))))
+        time_ += rng.expovariate(load / mean_burst)
+    return case
+
+
+def run_trr(case):
+    scheduler = tm.RoundRobinScheduler(time_quantum=4)
+    scheduler.add_processes(case)
+    scheduler.execute()
+    return scheduler.calculate_averages()
+
+
+def run_srr(case):
+    return sm.smart_round_robin([sm.Process(*args) for args in case], trace="off")
+
+
+def run_isrr(case):
+    return im.smart_round_robin([im.Process(*args) for args in case], trace="off")
+
+
+ENGINES = {"trr": run_trr, "srr": run_srr, "isrr": run_isrr}
+
+
+def best_time(function, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibration_loop():
+    # Interpreter-bound work of the same flavour as the engines: integer arithmetic,
+    # list and dict traffic and a sort, with a fixed amount of work
+    rng = random.Random(1)
+    values = [rng.randint(0, 10**6) for _ in range(50_000)]
+    table = {}
+    for i, value in enumerate(values):
+        table[value % 1000] = table.get(value % 1000, 0) + i
+    values.sort()
+    return sum(values) + len(table)
+
+
+@pytest.fixture(scope="module")
+def calibration():
+    return best_time(calibration_loop, repeat=5)
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    yield baseline
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def peak_memory(function, *args):
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_engine_against_baseline(engine, calibration, baseline):
+    case = make_case(SIZE)
+    relative_time = best_time(ENGINES[engine], case) / calibration
+    peak_bytes = peak_memory(ENGINES[engine], case)
+    if UPDATE_BASELINE:
+        baseline[engine] = {"relative_time": round(relative_time, 3), "peak_bytes": peak_bytes}
+        return
+    if engine not in baseline:
+        pytest.skip(f"no baseline for {engine}, run with PERF_UPDATE_BASELINE=1")
+
+    expected = baseline[engine]
+    assert relative_time <= expected["relative_time"] * TIME_TOLERANCE, (
+        f"{engine} took {relative_time:.2f} calibration loops, baseline {expected['relative_time']:.2f}"
+    )
+    assert peak_bytes <= expected["peak_bytes"] * MEMORY_TOLERANCE, (
+        f"{engine} peaked at {peak_bytes} bytes, baseline {expected['peak_bytes']}"
+    )
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_engine_scales_subquadratically(engine):
+    small = best_time(ENGINES[engine], make_case(SIZE // 8))
+    large = best_time(ENGINES[engine], make_case(SIZE))
+    assert large / small < SCALING_LIMIT, f"{engine} slowed down {large / small:.1f}x for 8x the processes"
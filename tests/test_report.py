@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+
+import pytest
+
+pytest.importorskip("matplotlib")
+from comp_scripts import report
+
+
+def test_paper_cases_are_computed_live():
+    metrics = report.compute_case(report.PAPER_CASES[0], ("trr", "srr", "isrr"))
+    # Same values the engine tests check for the first paper case
+    assert (metrics["srr"]["atat"], metrics["srr"]["awt"]) == (37.25, 19)
+    assert (metrics["trr"]["atat"], metrics["trr"]["awt"]) == (51.0, 32.75)
+    assert (metrics["srr"]["switches"], metrics["isrr"]["switches"]) == (5, 3)
+
+
+def test_only_changed_figures_are_rendered(tmp_path):
+    rendered, unchanged = report.build("trr_vs_srr", tmp_path, workers=1)
+    assert len(rendered) == 6 and unchanged == []
+    assert all((tmp_path / file).stat().st_size > 0 for file in rendered)
+
+    assert report.build("trr_vs_srr", tmp_path, workers=1) == ([], rendered)
+
+    # A new fourth case touches its own comparison and the reductions, not the other cases
+    cases = [report.PAPER_CASES[i] for i in (0, 1, 2)] + [([("P0", 0, 3), ("P1", 1, 9)], 2)]
+    rendered, unchanged = report.build("trr_vs_srr", tmp_path, cases=cases, workers=1)
+    assert sorted(rendered) == ["Case_4_comparison.png", "Reduction_ATAT.png", "Reduction_AWT.png"]
+
+    # Figures a smaller report no longer produces are removed
+    report.build("trr_vs_srr", tmp_path, cases=cases[:2], workers=1)
+    assert not (tmp_path / "Case_3_comparison.png").exists()
+
+
+def test_cleanup_stays_inside_the_output_directory(tmp_path):
+    directory = tmp_path / "report"
+    report.build("trr_vs_srr", directory, workers=1)
+    outside = tmp_path / "keep.png"
+    outside.write_bytes(b"not a figure")
+    (directory / "sub").mkdir()
+    (directory / "sub" / "keep.png").write_bytes(b"not a figure")
+    manifest = json.loads((directory / report.MANIFEST).read_text())
+    manifest.update({"../keep.png": "x", str(outside): "x", "sub/keep.png": "x"})
+    (directory / report.MANIFEST).write_text(json.dumps(manifest))
+    report.build("trr_vs_srr", directory, workers=1)
+    assert outside.exists() and (directory / "sub" / "keep.png").exists()
+
+
+def test_default_directories_are_unchanged():
+    assert report.default_directory("trr_vs_srr_isrr") == report.ROOT / "results" / "TRR_vs_SRR_vs_PRR"
+    assert report.default_directory("srr_vs_isrr") == report.ROOT / "results" / "SRR_vs_ISRR"
+
+
+def test_cached_results_are_reused(tmp_path, monkeypatch):
+    calls = []
+    simulate = report.result_cache.simulate
+    monkeypatch.setattr(report.result_cache, "simulate", lambda *args, **kwargs: calls.append(args) or simulate(*args, **kwargs))
+    report.build("srr_vs_isrr", tmp_path / "a", workers=1, cache_dir=str(tmp_path / "cache"))
+    assert len(calls) == 8  # Four cases, two algorithms
+    report.build("srr_vs_isrr", tmp_path / "b", workers=1, cache_dir=str(tmp_path / "cache"))
+    assert len(calls) == 8
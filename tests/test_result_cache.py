@@ -0,0 +1,103 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import os
+import random
+
+import pytest
+from modules import isrr_module as im
+from modules import result_cache as rc
+from modules import sweep
+from modules.gantt import SegmentLog
+
+
+def random_case(seed, n=30):
+    rng = random.Random(seed)
+    return [(f"P{i}", rng.randint(0, 60), rng.randint(1, 20)) for i in range(n)]
+
+
+@pytest.mark.parametrize("algorithm, time_quantum", [("isrr", None), ("srr", None), ("trr", 3)])
+def test_hits_return_the_simulated_results(tmp_path, algorithm, time_quantum):
+    cache = rc.ResultCache(tmp_path)
+    case = random_case(1)
+    first = cache.run(case, algorithm, time_quantum)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert first[:2] == sweep.run_workload(case, algorithm, time_quantum)
+    # Fast-forward never changes the results, so it shares the entry
+    assert cache.run(case, algorithm, time_quantum, fast_forward=True) == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_gantt_is_stored_on_request(tmp_path):
+    cache = rc.ResultCache(tmp_path)
+    processes = [im.Process(*args) for args in random_case(2)]
+    log = SegmentLog()
+    expected = im.smart_round_robin([im.Process(p.pid, p.arrival_time, p.burst_time) for p in processes],
+                                    gantt=log, trace="off")
+    assert cache.run(processes, "isrr").gantt is None
+    result = cache.run(processes, "isrr", gantt=True)  # The entry without a Gantt chart does not count
+    assert cache.misses == 2
+    assert result[:2] == expected and result.gantt == list(log.segments())
+    assert cache.run(processes, "isrr") == result and cache.hits == 1
+    assert all(p.finish_time == 0 for p in processes)  # Inputs are left untouched
+
+
+def test_key_covers_contents_and_settings():
+    case = random_case(3)
+    key = rc.cache_key(case, "trr", 4)
+    assert rc.cache_key(list(case), "trr", 4) == key
+    assert rc.cache_key(case, "trr", 5) != key
+    assert rc.cache_key(case, "srr") != rc.cache_key(case, "isrr")
+    assert rc.cache_key(case[:-1] + [(case[-1][0], case[-1][1], case[-1][2] + 1)], "trr", 4) != key
+    with pytest.raises(ValueError):
+        rc.cache_key(case, "trr")
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = rc.ResultCache(tmp_path)
+    cases = [random_case(seed) for seed in range(3)]
+    for age, case in enumerate(cases):
+        cache.run(case, "srr")
+        key = rc.cache_key(case, "srr")
+        os.utime(cache._path(key), ns=(age * 10**9, age * 10**9))
+    cache.get(rc.cache_key(cases[0], "srr"))  # Now the most recently used
+    cache.evict(cache.size() - 1)
+    assert cache.get(rc.cache_key(cases[1], "srr")) is None
+    assert cache.get(rc.cache_key(cases[0], "srr")) is not None
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_stores_scan_the_directory_only_when_over_the_limit(tmp_path, monkeypatch):
+    cache = rc.ResultCache(tmp_path)
+    scans = []
+    entries = cache.entries
+    monkeypatch.setattr(cache, "entries", lambda: scans.append(1) or entries())
+    for seed in range(5):
+        cache.run(random_case(seed), "srr")
+    assert len(scans) == 1  # The first store only
+
+    cache.max_bytes = cache.size() + 1
+    scans.clear()
+    cache.run(random_case(5), "srr")  # Goes over the limit, so the oldest entry goes
+    assert len(scans) == 1 and cache._size == cache.size() <= cache.max_bytes
+
+
+def test_engine_changes_invalidate_keys(monkeypatch):
+    case = random_case(6)
+    key = rc.cache_key(case, "isrr")
+    assert rc.ENGINE_VERSION == rc._engine_version()
+    monkeypatch.setattr(rc, "ENGINE_VERSION", "edited")
+    assert rc.cache_key(case, "isrr") != key
+
+
+def test_corrupt_entries_are_dropped(tmp_path):
+    cache = rc.ResultCache(tmp_path)
+    case = random_case(4)
+    key = rc.cache_key(case, "isrr")
+    cache.run(case, "isrr")
+    cache._path(key).write_bytes(b"garbage")
+    assert cache.get(key) is None and not cache._path(key).exists()
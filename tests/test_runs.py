@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import random
+
+import pytest
+from modules import columnar
+from modules import isrr_module as im
+from modules import runs
+from modules import srr_module as sm
+from modules import trr_module as tm
+from modules.cases import PAPER_CASES
+
+
+def test_processes_are_left_untouched():
+    processes = [im.Process(*args) for args in PAPER_CASES[3][0]]
+    result = runs.simulate(processes, "isrr")
+    assert result.averages() == (14.5, 7.0)
+    assert all(p.remaining_time == p.burst_time and p.finish_time == 0 and not p.stqs for p in processes)
+
+
+@pytest.mark.parametrize("algorithm, time_quantum", [("isrr", None), ("srr", None), ("trr", 3)])
+def test_empty_workload(algorithm, time_quantum):
+    result = runs.simulate([], algorithm, time_quantum)
+    assert len(result) == 0 and result.averages() == (0.0, 0.0) and result.context_switches() == 0
+
+
+def test_one_workload_through_every_algorithm():
+    rng = random.Random(4)
+    case = [(f"P{i}", rng.randint(0, 80), rng.randint(0, 12)) for i in range(40)]
+    workload = columnar.Workload.from_processes(case)
+    image = list(workload)
+    for _ in range(3):
+        for module in (im, sm):
+            expected = module.smart_round_robin([module.Process(*args) for args in case], trace="off")
+            assert runs.simulate(workload, "isrr" if module is im else "srr").averages() == expected
+        scheduler = tm.RoundRobinScheduler(3)
+        scheduler.add_processes(case)
+        scheduler.execute()
+        assert runs.simulate(workload, "trr", 3).averages() == scheduler.calculate_averages()
+    assert list(workload) == image
+
+
+def test_first_start_and_dispatches():
+    # |0 P0 6|6 P1 12|12 P2 18|18 P3 24|24 P0 30|30 P1 36|36 P2 38|38 P3 44|44 P1 50|50 P3 56|56 P1 62|62 P3 63|63 P1 73|
+    processes, quantum = PAPER_CASES[0]
+    result = runs.simulate(processes, "trr", quantum)
+    assert list(result.finish) == [30, 73, 38, 63]
+    assert list(result.first_start) == [0, 6, 12, 18]
+    assert list(result.dispatches) == [2, 5, 2, 4]
+    assert result.context_switches() == 12
+
+
+@pytest.mark.parametrize("algorithm, time_quantum", [("srr", None), ("trr", 2)])
+def test_fast_forward_records_the_same_dispatches(algorithm, time_quantum):
+    rng = random.Random(9)
+    case = [(f"P{i}", rng.randint(0, 30), rng.randint(0, 60)) for i in range(12)]
+    plain = runs.simulate(case, algorithm, time_quantum)
+    skipped = runs.simulate(case, algorithm, time_quantum, fast_forward=True)
+    assert list(skipped.first_start) == list(plain.first_start)
+    assert list(skipped.dispatches) == list(plain.dispatches)
+    with pytest.raises(ValueError):
+        runs.simulate(case, "trr")
@@ -0,0 +1,95 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import math
+import pickle
+import random
+
+import pytest
+from modules import columnar
+from modules import isrr_module as im
+from modules import sketch
+from modules import sweep
+from modules import trr_module as tm
+from modules.cases import PAPER_CASES
+
+
+def exact_quantile(values, q):
+    # The lower rank quantile a DDSketch estimates
+    return sorted(values)[math.floor(q * (len(values) - 1))]
+
+
+def test_quantiles_are_within_the_relative_accuracy():
+    rng = random.Random(3)
+    for accuracy in (0.01, 0.05):
+        values = [int(rng.lognormvariate(3, 2.5)) for _ in range(20000)]  # Many repeats, zeros and a long tail
+        latency = sketch.QuantileSketch(accuracy)
+        for value in values:
+            latency.add(value)
+        for q in (0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 0.999):
+            exact = exact_quantile(values, q)
+            assert abs(latency.quantile(q) - exact) <= accuracy * exact
+        assert (latency.quantile(0), latency.quantile(1)) == (min(values), max(values))
+        assert latency.count == len(values) and latency.mean() == sum(values) / len(values)
+
+    empty = sketch.QuantileSketch()
+    assert empty.quantile(0.5) is None and empty.summary() == {"count": 0}
+    with pytest.raises(ValueError):
+        empty.add(-1)
+    with pytest.raises(ValueError):
+        empty.quantile(1.5)
+
+
+def test_merged_shards_equal_one_sketch():
+    rng = random.Random(5)
+    values = [rng.randint(0, 10**6) for _ in range(30000)]
+    whole = sketch.QuantileSketch()
+    shards = [sketch.QuantileSketch() for _ in range(4)]
+    for i, value in enumerate(values):
+        whole.add(value)
+        shards[i % 4].add(value)
+    merged = sketch.QuantileSketch()
+    for shard in shards:
+        merged.merge(pickle.loads(pickle.dumps(shard)))  # As sent back by a worker
+    quantiles = [q / 100 for q in range(101)]
+    assert [merged.quantile(q) for q in quantiles] == [whole.quantile(q) for q in quantiles]
+    assert merged.summary() == whole.summary()
+    with pytest.raises(ValueError):
+        merged.merge(sketch.QuantileSketch(0.05))
+
+
+def test_folding_bounds_memory():
+    latency = sketch.QuantileSketch(max_buckets=40)
+    values = range(1, 10**6, 3)
+    for value in values:
+        latency.add(value)
+    assert len(latency._buckets) <= 40
+    # Only the lowest quantiles lose accuracy
+    exact = exact_quantile(values, 0.99)
+    assert abs(latency.quantile(0.99) - exact) <= 0.01 * exact
+    assert latency.quantile(0.01) > exact_quantile(values, 0.01)
+
+
+def test_engines_record_completions():
+    processes, quantum = PAPER_CASES[0]
+    workload = columnar.Workload.from_processes(processes)
+    for algorithm in sweep.ALGORITHMS:
+        latency = sketch.LatencySketch()
+        finish = sweep.run_columns(workload, algorithm, quantum, False, latency=latency)
+        turnaround = [f - a for f, a in zip(finish, workload.arrival)]
+        assert len(latency) == len(processes)
+        assert latency.turnaround.max == max(turnaround) and latency.turnaround.min == min(turnaround)
+        assert latency.waiting.mean() == sum(t - b for t, b in zip(turnaround, workload.burst)) / len(processes)
+
+    schedulers = [im.SmartRoundRobinScheduler(), tm.RoundRobinScheduler(quantum)]
+    for scheduler in schedulers:
+        for pid, arrival_time, burst_time in processes:
+            if isinstance(scheduler, tm.RoundRobinScheduler):
+                scheduler.submit(pid, arrival_time, burst_time)
+            else:
+                scheduler.submit(im.Process(pid, arrival_time, burst_time))
+        events = scheduler.advance_to(1000)
+        assert scheduler.latency.summary(percentiles=(100,))["waiting"]["p100"] == max(e.waiting for e in events)
@@ -0,0 +1,189 @@
+import sys
+import itertools
+import random
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+from modules import isrr_module as im
+from modules import smart_engine as se
+from modules import srr_module as sm
+
+
+# Both the insertion and the merge paths must keep the queue fully sorted
+@pytest.mark.parametrize("arrivals_per_round", [1, se.SortedReadyQueue.MERGE_THRESHOLD + 1])
+def test_sorted_ready_queue_keeps_order(arrivals_per_round):
+    rng = random.Random(arrivals_per_round)
+    remaining = {}
+    queue = se.SortedReadyQueue(key=lambda i: (remaining[i], i))
+    for _ in range(50):
+        arrivals = []
+        for _ in range(arrivals_per_round):
+            i = len(remaining)
+            remaining[i] = rng.randint(1, 20)
+            arrivals.append(i)
+        queue.insert(arrivals)
+        assert list(queue) == sorted(queue, key=queue.key)
+        queue.retire(rng.randint(0, len(queue) // 2))
+        for i in queue:
+            remaining[i] += 5  # A uniform shift never changes the order of survivors
+
+
+def make_case(module):
+    return [
+        module.Process("P0", 0, 8),
+        module.Process("P1", 2, 6),
+        module.Process("P2", 7, 11),
+        module.Process("P3", 0, 5),
+    ]
+
+
+@pytest.mark.parametrize("module", [im, sm])
+def test_trace_levels(module):
+    full = make_case(module)
+    expected = module.smart_round_robin(full, trace=se.TRACE_FULL)
+    for level in (se.TRACE_OFF, se.TRACE_SUMMARY):
+        processes = make_case(module)
+        assert module.smart_round_robin(processes, trace=level) == expected
+        for traced, process in zip(full, processes):
+            assert process.stqs == () and process.ds == ()
+            if level == se.TRACE_OFF:
+                assert process.summary is None
+                continue
+            summary = process.summary
+            assert summary.count == len(traced.stqs)
+            assert (summary.stq_min, summary.stq_max) == (min(traced.stqs), max(traced.stqs))
+            assert (summary.delta_min, summary.delta_max) == (min(traced.ds), max(traced.ds))
+            assert summary.stq_mean == sum(traced.stqs) / len(traced.stqs)
+            assert summary.delta_mean == sum(traced.ds) / len(traced.ds)
+
+
+def test_unknown_trace_level():
+    with pytest.raises(ValueError):
+        im.smart_round_robin(make_case(im), trace="verbose")
+
+
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_simulate_counts_rounds(fast_forward):
+    # Rounds skipped by fast-forward still count, once per round. Everything arrives at 0,
+    # so the last process to finish takes part in every round
+    traced = [sm.Process("P0", 0, 8), sm.Process("P1", 0, 60), sm.Process("P2", 0, 2)]
+    rounds = se.simulate(traced, sm.StqDeltaCalculator(), fast_forward=fast_forward, trace=se.TRACE_FULL)
+    assert rounds == max(len(p.stqs) for p in traced)
+
+
+def test_process_is_slotted():
+    assert not hasattr(im.Process("P0", 0, 1), "__dict__")
+    assert not hasattr(sm.Process("P0", 0, 1), "__dict__")
+    # Trace lists are only allocated for processes traced in full
+    processes = [sm.Process("P0", 0, 3), sm.Process("P1", 1, 0)]
+    assert processes[0].stqs == ()
+    sm.smart_round_robin(processes, trace=se.TRACE_FULL)
+    assert processes[0].stqs == [1, 1, 1] and processes[1].stqs == []
+
+
+@pytest.mark.parametrize("module, stream", [(im, im.isrr_stream), (sm, sm.srr_stream)])
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_stream_matches_batch(module, stream, fast_forward):
+    rng = random.Random(11)
+    case = sorted(
+        ((f"P{i}", rng.randint(0, 200), rng.randint(1, 30)) for i in range(60)), key=lambda c: c[1]
+    )
+    processes = [module.Process(*args) for args in case]
+    module.smart_round_robin(processes, trace=se.TRACE_OFF)
+    expected = {p.pid: (p.finish_time, p.finish_time - p.arrival_time) for p in processes}
+
+    events = list(stream(case, fast_forward=fast_forward))
+    assert [e.finish_time for e in events] == sorted(e.finish_time for e in events)
+    assert {e.pid: (e.finish_time, e.turnaround) for e in events} == expected
+    for e in events:
+        assert e.waiting == e.turnaround - dict((c[0], c[2]) for c in case)[e.pid]
+
+
+def test_stream_is_lazy():
+    # An endless arrival stream still produces completions
+    endless = ((f"P{i}", 10 * i, 5) for i in itertools.count())
+    events = list(itertools.islice(im.isrr_stream(endless), 3))
+    assert [(e.pid, e.finish_time) for e in events] == [("P0", 5), ("P1", 15), ("P2", 25)]
+
+
+def test_stream_fast_forward_stops_at_later_arrivals():
+    # Both processes arriving at 14 are admitted in one step, and the one arriving at 24 must
+    # already be pending by then, or the skipped rounds would run past it
+    case = [("Q0", 0, 22), ("Q1", 14, 18), ("P1", 14, 24), ("Q4", 24, 21), ("P0", 27, 23)]
+    events = sm.srr_stream(case, fast_forward=True)
+    assert [(e.pid, e.finish_time) for e in events] == [
+        ("Q0", 22), ("Q1", 60), ("P1", 88), ("Q4", 103), ("P0", 108)
+    ]
+
+
+def test_stream_rejects_unsorted_arrivals():
+    with pytest.raises(ValueError):
+        list(sm.srr_stream([("P0", 5, 3), ("P1", 2, 3)]))
+
+
+# Driving the online scheduler arrival by arrival must reproduce the batch schedule
+@pytest.mark.parametrize("module", [im, sm])
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_online_scheduler_matches_batch(module, fast_forward):
+    rng = random.Random(5)
+    case = sorted(
+        ((f"P{i}", rng.randint(0, 300), rng.randint(1, 80)) for i in range(40)), key=lambda c: c[1]
+    )
+    processes = [module.Process(*args) for args in case]
+    expected = module.smart_round_robin(processes, fast_forward=fast_forward, trace=se.TRACE_OFF)
+
+    scheduler = module.SmartRoundRobinScheduler(fast_forward=fast_forward)
+    finish_times = {}
+    for args in case:
+        if scheduler.horizon is None or args[1] - 1 >= scheduler.horizon:
+            for event in scheduler.advance_to(args[1] - 1):
+                finish_times[event.pid] = event.finish_time
+        scheduler.submit(module.Process(*args))
+    while (events := scheduler.step()) is not None:
+        finish_times.update((event.pid, event.finish_time) for event in events)
+
+    assert finish_times == {p.pid: p.finish_time for p in processes}
+    snapshot = scheduler.snapshot()
+    assert (snapshot.average_turnaround, snapshot.average_waiting) == expected
+    assert snapshot.completed == len(case) and snapshot.ready == [] and snapshot.pending == 0
+
+
+def test_online_scheduler_keeps_state_between_calls():
+    scheduler = im.SmartRoundRobinScheduler()
+    for i, burst in enumerate([1, 1, 1, 100]):
+        scheduler.submit(im.Process(f"P{i}", 0, burst))
+    assert [event.finish_time for event in scheduler.step()] == [1, 2, 3]
+    assert scheduler.snapshot().ready == [("P3", 74)]
+    with pytest.raises(ValueError):
+        scheduler.submit(im.Process("P4", 0, 5))  # The round at time 0 has already run
+    scheduler.submit(im.Process("P4", 30, 5))
+    assert scheduler.advance_to(29) == [se.Completion("P3", 103, 103, 3)]
+    assert scheduler.snapshot().pending == 1
+    assert scheduler.step() == [se.Completion("P4", 108, 78, 73)]
+    assert scheduler.step() is None
+
+
+def test_feeder_pulls_one_arrival_ahead():
+    pulled = []
+    submitted = []
+
+    def arrivals():
+        for item in [("P0", 0, 4), ("P1", 0, 0), ("P2", 3, 2), ("P3", 9, 1), ("P4", 12, 1)]:
+            pulled.append(item[0])
+            yield item
+
+    def submit(item):
+        submitted.append(item[0])
+        return item[2] > 0
+
+    feeder = se.ArrivalFeeder(arrivals(), lambda item: item[1], submit, name=lambda item: item[0])
+    feeder.feed(0)
+    # Everything up to time 0 plus the next future arrival, and only one item pulled beyond it
+    assert submitted == ["P0", "P1", "P2"] and pulled == ["P0", "P1", "P2", "P3"]
+    feeder.feed(2)
+    assert submitted == ["P0", "P1", "P2"]
+    feeder.feed(3)
+    assert submitted == ["P0", "P1", "P2", "P3"] and pulled[-1] == "P4"
@@ -4,6 +4,8 @@ from pathlib import Path
 # Add the project root to sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import random
+
 import pytest
 from modules import srr_module as sm
 
@@ -62,3 +64,54 @@ def test_research_paper_cases(case_data):
     assert (
         round(atat, 2) == expected_atat and round(awt, 2) == expected_awt
     ), f"Failed for processes: {[p.pid for p in processes]}"
+
+
+# Arrivals out of input order and idle gaps between processes
+@pytest.mark.parametrize(
+    "case, expected_finish",
+    [
+        (
+            [("P1", 5, 5), ("P2", 4, 6), ("P3", 3, 7), ("P4", 1, 9), ("P5", 2, 2), ("P6", 6, 3)],
+            [28, 31, 33, 12, 4, 21],
+        ),
+        ([("P1", 1, 4), ("P2", 10, 5), ("P3", 20, 3)], [5, 15, 23]),
+    ],
+)
+def test_unsorted_arrivals_and_idle_gaps(case, expected_finish):
+    processes = [sm.Process(*args) for args in case]
+    sm.smart_round_robin(processes)
+    assert [p.finish_time for p in processes] == expected_finish
+
+
+# The incremental calculator must agree with the reference list-based computation
+def test_incremental_calculator_matches_reference():
+    rng = random.Random(7)
+    for _ in range(500):
+        ready = sorted(
+            (sm.Process(f"P{i}", 0, rng.randint(1, 1000)) for i in range(rng.randint(1, 20))),
+            key=lambda p: p.remaining_time,
+        )
+        calculator = sm.StqDeltaCalculator()
+        for p in ready:
+            calculator.admit(p.remaining_time)
+        quantum = calculator.quantum(ready[0].remaining_time, ready[-1].remaining_time)
+        assert quantum == sm.calculate_stq_delta(ready)
+
+
+# Skipping rounds in closed form must not change finish times or the Gantt chart
+def test_fast_forward_matches_round_by_round(capsys):
+    case = [("P0", 0, 9000), ("P1", 0, 9050), ("P2", 40, 12000), ("P3", 30000, 7)]
+    results = []
+    for fast_forward in (False, True):
+        processes = [sm.Process(*args) for args in case]
+        averages = sm.smart_round_robin(processes, print_gantt=True, fast_forward=fast_forward)
+        results.append((averages, [p.finish_time for p in processes], capsys.readouterr().out))
+    assert results[0] == results[1]
+
+
+def test_fast_forward_long_equal_bursts():
+    # With default arguments, skipped rounds leave no per-round history behind
+    processes = [sm.Process("P0", 0, 10**9), sm.Process("P1", 0, 10**9)]
+    sm.smart_round_robin(processes, fast_forward=True)
+    assert [p.finish_time for p in processes] == [2 * 10**9 - 1, 2 * 10**9]
+    assert not processes[0].stqs and not processes[0].ds
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+import random
+
+import pytest
+from modules import sweep
+
+workloads = [
+    [("P0", 0, 12), ("P1", 0, 34), ("P2", 0, 8), ("P3", 0, 19)],
+    [("P1", 0, 20), ("P2", 3, 7), ("P3", 40, 5)],
+]
+
+
+def random_workloads(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        [(f"P{i}", rng.randint(0, 20), rng.randint(1, 30)) for i in range(rng.randint(1, 8))]
+        for _ in range(count)
+    ]
+
+
+def test_sweep_order_and_values():
+    results = list(sweep.sweep(workloads, time_quanta=(6, 2), max_workers=1))
+    assert [(r["workload"], r["algorithm"], r["time_quantum"]) for r in results] == [
+        (0, "trr", 6), (0, "trr", 2), (0, "srr", None), (0, "isrr", None),
+        (1, "trr", 6), (1, "trr", 2), (1, "srr", None), (1, "isrr", None),
+    ]
+    assert (results[0]["atat"], results[0]["awt"]) == (51.0, 32.75)
+    for result in results:
+        expected = sweep.run_workload(workloads[result["workload"]], result["algorithm"], result["time_quantum"])
+        assert (result["atat"], result["awt"]) == expected
+
+
+def test_sweep_pool_matches_inline():
+    many = random_workloads(60)
+    inline = list(sweep.sweep(many, time_quanta=(3,), max_workers=1))
+    # Tiny chunks make chunks finish out of order, exercising the reorder buffer
+    pooled = list(sweep.sweep(iter(many), time_quanta=(3,), max_workers=2, chunksize=5))
+    assert pooled == inline
+
+
+def test_sweep_needs_quantum_for_trr():
+    with pytest.raises(ValueError):
+        list(sweep.sweep(workloads))
+    assert len(list(sweep.sweep(workloads, algorithms=("isrr",), max_workers=1))) == 2
+
+
+def test_cli(tmp_path, capsys):
+    path = tmp_path / "workloads.jsonl"
+    path.write_text("".join(json.dumps(workload) + "\n" for workload in workloads))
+    sweep.main([str(path), "--algorithms", "trr", "--quantum", "6", "--workers", "1"])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["workload"] for line in lines] == [0, 1]
+    assert (lines[0]["atat"], lines[0]["awt"]) == (51.0, 32.75)
+
+
+def test_malformed_workloads_are_input_errors():
+    with pytest.raises(sweep.TraceError, match="line 2"):
+        list(sweep.read_workloads(['[["P0", 0, 3]]', '[["P0", 0]]']))
+    with pytest.raises(sweep.TraceError, match="line 1"):
+        list(sweep.read_workloads(["not json"]))
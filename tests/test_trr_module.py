@@ -6,6 +6,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import pytest
 from modules import trr_module as tm
+from modules.gantt import SegmentLog
 
 # Define test data and expected results
 test_data = [
@@ -31,3 +32,92 @@ def test_round_robin_scheduler(time_quantum, processes, expected):
 
     expected_avg_tat, expected_avg_wt = expected
     assert round(avg_tat, 2) == expected_avg_tat and round(avg_wt, 2) == expected_avg_wt
+
+
+# Bulk loading out of arrival order must schedule exactly like one-by-one insertion
+@pytest.mark.parametrize("time_quantum, processes, expected", test_data)
+def test_bulk_loading_matches_add_process(time_quantum, processes, expected):
+    one_by_one = tm.RoundRobinScheduler(time_quantum=time_quantum)
+    for name, arrival, burst in reversed(processes):
+        one_by_one.add_process(name, arrival, burst)
+    one_by_one.execute()
+
+    bulk = tm.RoundRobinScheduler(time_quantum=time_quantum)
+    bulk.add_processes(reversed(processes))
+    assert [p["arrival_time"] for p in bulk.processes] == sorted(p[1] for p in processes)
+    bulk.execute()
+
+    assert [(p["name"], p["completion_time"]) for p in bulk.processes] == [
+        (p["name"], p["completion_time"]) for p in one_by_one.processes
+    ]
+
+
+@pytest.mark.parametrize("time_quantum, processes, expected", test_data)
+def test_bulk_loading(time_quantum, processes, expected):
+    scheduler = tm.RoundRobinScheduler(time_quantum=time_quantum)
+    scheduler.add_processes(processes)
+    scheduler.execute()
+    avg_tat, avg_wt = scheduler.calculate_averages()
+    assert round(avg_tat, 2) == expected[0] and round(avg_wt, 2) == expected[1]
+
+
+@pytest.mark.parametrize("time_quantum, processes, expected", test_data)
+def test_fast_forward_matches_slice_by_slice(time_quantum, processes, expected):
+    schedulers = []
+    for fast_forward in (False, True):
+        scheduler = tm.RoundRobinScheduler(time_quantum=time_quantum)
+        scheduler.add_processes(processes)
+        scheduler.execute(fast_forward=fast_forward)
+        schedulers.append(scheduler)
+    slow, fast = schedulers
+    assert slow.processes == fast.processes
+
+
+# Bursts this long are only feasible because whole rotations are skipped in closed form
+def test_fast_forward_huge_bursts():
+    scheduler = tm.RoundRobinScheduler(time_quantum=1)
+    scheduler.add_processes([("P0", 0, 10**9), ("P1", 0, 10**9), ("P2", 5, 10**9)])
+    scheduler.execute(fast_forward=True)
+    assert [p["completion_time"] for p in scheduler.processes] == [
+        3 * 10**9 - 5,
+        3 * 10**9 - 3,
+        3 * 10**9,
+    ]
+    assert [p["start_time"] for p in scheduler.processes] == [0, 1, 7]
+
+
+@pytest.mark.parametrize("time_quantum, processes, expected", test_data)
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_stream_matches_execute(time_quantum, processes, expected, fast_forward):
+    scheduler = tm.RoundRobinScheduler(time_quantum=time_quantum)
+    scheduler.add_processes(processes)
+    scheduler.execute()
+
+    events = list(tm.trr_stream(sorted(processes, key=lambda p: p[1]), time_quantum, fast_forward))
+    assert sorted((e.pid, e.finish_time) for e in events) == sorted(
+        (p["name"], p["completion_time"]) for p in scheduler.processes
+    )
+    assert round(sum(e.turnaround for e in events) / len(events), 2) == expected[0]
+    assert round(sum(e.waiting for e in events) / len(events), 2) == expected[1]
+
+
+@pytest.mark.parametrize("time_quantum, processes, expected", test_data)
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_online_api_matches_execute(time_quantum, processes, expected, fast_forward):
+    batch = SegmentLog()
+    reference = tm.RoundRobinScheduler(time_quantum, fast_forward, batch)
+    reference.add_processes(processes)
+    reference.execute()
+    online = SegmentLog()
+    scheduler = tm.RoundRobinScheduler(time_quantum, fast_forward=fast_forward, gantt=online)
+    for name, arrival, burst in sorted(processes, key=lambda p: p[1]):
+        if scheduler.horizon is None or arrival - 1 >= scheduler.horizon:
+            scheduler.advance_to(arrival - 1)
+        scheduler.submit(name, arrival, burst)
+    while scheduler.step() is not None:
+        pass
+    snapshot = scheduler.snapshot()
+    assert snapshot.completed == len(processes)
+    assert round(snapshot.average_turnaround, 2) == expected[0]
+    assert round(snapshot.average_waiting, 2) == expected[1]
+    assert list(online.segments()) == list(batch.segments())
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import random
+
+import pytest
+from modules import columnar
+from modules import sweep
+from modules import what_if
+
+
+def assert_matches_full_run(session):
+    live = [i for i, arrival in enumerate(session.arrival) if arrival is not None]
+    workload = columnar.Workload.from_processes([(i, session.arrival[i], session.burst[i]) for i in live])
+    finish = sweep.run_columns(workload, session.algorithm, session.time_quantum, session.fast_forward)
+    assert [session.finish[i] for i in live] == list(finish)
+    assert session.averages() == pytest.approx(workload.averages(finish))
+
+
+@pytest.mark.parametrize("algorithm, time_quantum", [("isrr", None), ("srr", None), ("trr", 3)])
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_random_changes_match_full_runs(algorithm, time_quantum, fast_forward):
+    for seed in range(20):
+        rng = random.Random(seed)
+        case = [(f"P{i}", rng.randint(0, 120), rng.randint(0, 8)) for i in range(25)]
+        session = what_if.WhatIf(case, algorithm, time_quantum, fast_forward)
+        for _ in range(15):
+            live = [i for i, arrival in enumerate(session.arrival) if arrival is not None]
+            choice = rng.random()
+            if choice < 0.5:
+                session.edit(rng.choice(live), rng.randint(0, 120), rng.randint(0, 10))
+            elif choice < 0.75:
+                session.add("X", rng.randint(0, 130), rng.randint(0, 8))
+            else:
+                session.remove(rng.choice(live))
+            assert_matches_full_run(session)
+
+
+def test_only_the_touched_busy_periods_are_simulated():
+    # Three busy periods: [0, 10), [20, 26) and [40, 49)
+    case = [("A", 0, 6), ("B", 2, 4), ("C", 20, 3), ("D", 21, 3), ("E", 40, 9)]
+    session = what_if.WhatIf(case, "isrr")
+    assert session.busy_periods() == 3
+
+    session.edit(3, burst_time=4)  # D runs longer, still inside its period
+    assert session.simulated == 2 and session.busy_periods() == 3
+
+    session.edit(1, burst_time=15)  # B now runs past 20, merging its period with C and D's
+    assert session.simulated == 4 and session.busy_periods() == 2
+
+    index = session.add("F", 60, 5)  # A new period of its own after an idle gap
+    assert session.simulated == 1 and session.busy_periods() == 3 and session.finish[index] == 65
+
+    session.remove(4)
+    assert session.simulated == 0 and session.busy_periods() == 2
+    assert_matches_full_run(session)
+
+
+def test_invalid_changes():
+    session = what_if.WhatIf([("A", 0, 6)], "srr")
+    with pytest.raises(ValueError):
+        session.edit(0, burst_time=-1)
+    session.remove(0)
+    assert session.averages() == (0.0, 0.0)
+    with pytest.raises(IndexError):
+        session.edit(0, arrival_time=3)
+    with pytest.raises(ValueError):
+        what_if.WhatIf([("A", 0, 6)], "trr")
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from modules import columnar
+from modules import isrr_module as im
+from modules import workloads as wl
+
+
+@pytest.mark.parametrize("bursts", list(wl.BURSTS))
+@pytest.mark.parametrize("arrivals", list(wl.ARRIVALS))
+def test_generate_is_seeded_and_valid(bursts, arrivals):
+    arrival, burst = wl.generate(5000, bursts, arrivals, seed=7)
+    again = wl.generate(5000, bursts, arrivals, seed=7)
+    other = wl.generate(5000, bursts, arrivals, seed=8)
+    assert np.array_equal(arrival, again[0]) and np.array_equal(burst, again[1])
+    assert not np.array_equal(burst, other[1])
+    assert arrival.dtype == burst.dtype == np.int64
+    assert (burst >= 1).all() and (arrival >= 0).all()
+    assert (np.diff(arrival) >= 0).all()
+
+
+def test_models_are_independent_streams():
+    # Changing the burst model leaves the arrivals untouched
+    assert np.array_equal(wl.generate(100, "pareto")[0], wl.generate(100, "bimodal")[0])
+
+
+def test_distribution_shapes():
+    _, exponential = wl.generate(200_000, "exponential", burst_params={"mean": 20})
+    assert 19.5 < exponential.mean() < 21.5  # Rounding up adds about half a unit
+    _, pareto = wl.generate(200_000, "pareto", burst_params={"shape": 1.2, "minimum": 2})
+    assert pareto.min() >= 2 and pareto.max() > 1000 * np.median(pareto)
+    _, bimodal = wl.generate(200_000, "bimodal", burst_params={"long_fraction": 0.25})
+    assert 0.17 < (bimodal > 30).mean() < 0.2  # About 0.25 * exp(-30 / 100)
+    arrival, _ = wl.generate(200_000, arrivals="poisson", arrival_params={"mean_interarrival": 3})
+    assert 2.9 < arrival[-1] / len(arrival) < 3.1
+
+
+def test_generate_many_regenerates_single_traces():
+    traces = list(wl.generate_many(3, 50, seed=4, bursts="bimodal"))
+    arrival, burst = wl.generate(50, "bimodal", seed=[4, 2])
+    assert np.array_equal(traces[2][0], arrival) and np.array_equal(traces[2][1], burst)
+
+
+def test_outputs_feed_the_engines():
+    arrival, burst = wl.generate(300, "pareto", seed=1)
+    processes = wl.to_processes(arrival, burst, im.Process)
+    expected = im.smart_round_robin(processes, trace="off")
+    workload = columnar.Workload.from_numpy(arrival, burst)
+    assert list(workload) == wl.to_tuples(arrival, burst)
+    assert workload.averages(im.isrr_workload(workload)) == expected
+
+
+def test_unknown_model():
+    with pytest.raises(ValueError):
+        wl.generate(10, bursts="normal")